@@ -55,7 +55,7 @@ class BcDictionary(object):
         self.slot_table: IT.IndexedTable[BC.BcSlot] = IT.IndexedTable('slot-table')
         self.slot_list_table: IT.IndexedTable[BC.BcSlotList] = IT.IndexedTable('slot-list-table')
         self.opcode_table: IT.IndexedTable[BC.JBytecodeBase] = IT.IndexedTable('opcode-table')
-        self.tables: List[Tuple[IT.IndexedTableSuperclass, Callable[[ET.Element], None]]] = [
+        self.tables: List[Tuple[IT.IndexedTableSuperclass, Callable[[Optional[IT.TableNode]], None]]] = [
             (self.pc_list_table, self._read_xml_pc_list_table),
             (self.slot_table, self._read_xml_slot_table),
             (self.slot_list_table, self._read_xml_slot_list_table),
@@ -94,30 +94,26 @@ class BcDictionary(object):
             t.reset()
             f(UF.safe_find(xnode, t.name, t.name + ' missing from xml'))
 
-    def _read_xml_pc_list_table(self, txnode: "ET.Element") -> None:
-        def get_value(node : "ET.Element") -> BC.BcPcList:
-            rep = IT.get_rep(node)
+    def _read_xml_pc_list_table(self, txnode: Optional[IT.TableNode]) -> None:
+        def get_value(rep: IT.TableRep) -> BC.BcPcList:
             args = (self,) + rep
             return BC.BcPcList(*args)
         self.pc_list_table.read_xml(txnode,'n',get_value)
 
-    def _read_xml_slot_table(self, txnode: "ET.Element") -> None:
-        def get_value(node : "ET.Element") -> BC.BcSlot:
-            rep = IT.get_rep(node)
+    def _read_xml_slot_table(self, txnode: Optional[IT.TableNode]) -> None:
+        def get_value(rep: IT.TableRep) -> BC.BcSlot:
             args = (self,) + rep
             return BC.BcSlot(*args)
         self.slot_table.read_xml(txnode,'n',get_value)
 
-    def _read_xml_slot_list_table(self, txnode: "ET.Element") -> None:
-        def get_value(node: "ET.Element") -> BC.BcSlotList:
-            rep = IT.get_rep(node)
+    def _read_xml_slot_list_table(self, txnode: Optional[IT.TableNode]) -> None:
+        def get_value(rep: IT.TableRep) -> BC.BcSlotList:
             args = (self,) + rep
             return BC.BcSlotList(*args)
         self.slot_list_table.read_xml(txnode,'n',get_value)
 
-    def _read_xml_opcode_table(self, txnode: "ET.Element") -> None:
-        def get_value(node: "ET.Element") -> BC.JBytecodeBase:
-            rep = IT.get_rep(node)
+    def _read_xml_opcode_table(self, txnode: Optional[IT.TableNode]) -> None:
+        def get_value(rep: IT.TableRep) -> BC.JBytecodeBase:
             if BCD.is_bytecode(*((self,) + rep)):
                 return BCD.construct_bytecode_dictionary_record(*((self,) + rep))
             #if BCD.is_bytecode(*((self,) + rep), BC.JBytecodeConstBase):
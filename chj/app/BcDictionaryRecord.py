@@ -37,6 +37,8 @@ if TYPE_CHECKING:
 class BcDictionaryRecord(IT.IndexedTableValue):
     """Base class for all objects kept in the JDictionary."""
 
+    __slots__ = ("args", "bcd", "tags")
+
     def __init__(self,
             bcd: "BcDictionary",
             index: int,
@@ -33,6 +33,9 @@ from typing import List, TYPE_CHECKING
 
 if TYPE_CHECKING:
     from chj.app.BcDictionary import BcDictionary
+    from chj.index.DataDictionary import DataDictionary
+    from chj.index.JTermDictionary import JTermDictionary
+    from chj.index.JTypeDictionary import JTypeDictionary
     from chj.index.Classname import Classname
     from chj.index.JValueTypes import JValueTypeBase
     from chj.index.JObjectTypes import JObjectTypeBase
@@ -43,21 +46,30 @@ if TYPE_CHECKING:
 
 class BcBase(BCD.BcDictionaryRecord):
 
+    __slots__ = ()
+
     def __init__(self,
             bcd: "BcDictionary",
             index: int,
             tags: List[str],
             args: List[int]):
         BCD.BcDictionaryRecord.__init__(self,bcd,index,tags,args)
-        self.bcd = bcd                               # BcDictionary
-        self.jd = self.bcd.jd                        # DataDictionary
-        self.tpd = self.jd.tpd                       # JTypeDictionary
-        self.jtd = self.jd.jtd                       # JTermDictionary
+
+    @property
+    def jd(self) -> "DataDictionary": return self.bcd.jd
+
+    @property
+    def tpd(self) -> "JTypeDictionary": return self.bcd.jd.tpd
+
+    @property
+    def jtd(self) -> "JTermDictionary": return self.bcd.jd.jtd
 
     def __str__(self) -> str: return 'javaclass-dictionary-record'
 
 class BcPcList(BcBase):
 
+    __slots__ = ()
+
     def __init__(self,
             bcd: "BcDictionary",
             index: int,
@@ -72,6 +84,8 @@ class BcPcList(BcBase):
 
 class BcSlot(BcBase):
 
+    __slots__ = ()
+
     def __init__(self,
             bcd: "BcDictionary",
             index: int,
@@ -106,6 +120,8 @@ class BcSlot(BcBase):
 
 class BcSlotList(BcBase):
 
+    __slots__ = ()
+
     def __init__(self,
             bcd: "BcDictionary",
             index: int,
@@ -123,6 +139,8 @@ class BcSlotList(BcBase):
 
 class JBytecodeBase(BcBase):
 
+    __slots__ = ()
+
     def __init__(self,
             bcd: "BcDictionary",
             index: int,
@@ -154,6 +172,8 @@ class JBytecodeBase(BcBase):
 
 class BcInstruction(JBytecodeBase):
 
+    __slots__ = ()
+
     def __init__(self,
             bcd: "BcDictionary",
             index: int,
@@ -166,6 +186,8 @@ class BcInstruction(JBytecodeBase):
 @BCD.bc_dictionary_record_tag("ld")
 class BcLoad(JBytecodeBase):
 
+    __slots__ = ()
+
     def __init__(self,
             bcd: "BcDictionary",
             index: int,
@@ -183,6 +205,8 @@ class BcLoad(JBytecodeBase):
 @BCD.bc_dictionary_record_tag("st")
 class BcStore(JBytecodeBase):
 
+    __slots__ = ()
+
     def __init__(self,
             bcd: "BcDictionary",
             index: int,
@@ -201,6 +225,8 @@ class BcStore(JBytecodeBase):
 @BCD.bc_dictionary_record_tag("inc")
 class BcIInc(JBytecodeBase):
 
+    __slots__ = ()
+
     def __init__(self,
             bcd: "BcDictionary",
             index: int,
@@ -218,6 +244,8 @@ class BcIInc(JBytecodeBase):
 
 class JBytecodeConstBase(JBytecodeBase):
 
+    __slots__ = ()
+
     def __init__(self,
             bcd: "BcDictionary",
             index: int,
@@ -231,6 +259,8 @@ class JBytecodeConstBase(JBytecodeBase):
 @BCD.bc_dictionary_record_tag("icst")
 class BcIntConst(JBytecodeConstBase):
 
+    __slots__ = ()
+
     def __init__(self,
             bcd: "BcDictionary",
             index: int,
@@ -245,6 +275,8 @@ class BcIntConst(JBytecodeConstBase):
 @BCD.bc_dictionary_record_tag("lcst")
 class BcLongConst(JBytecodeConstBase):
 
+    __slots__ = ()
+
     def __init__(self,
             bcd: "BcDictionary",
             index: int,
@@ -260,6 +292,8 @@ class BcLongConst(JBytecodeConstBase):
 @BCD.bc_dictionary_record_tag("fcst")
 class BcFloatConst(JBytecodeConstBase):
 
+    __slots__ = ()
+
     def __init__(self,
             bcd: "BcDictionary",
             index: int,
@@ -274,6 +308,8 @@ class BcFloatConst(JBytecodeConstBase):
 @BCD.bc_dictionary_record_tag("dcst")
 class BcDoubleConst(JBytecodeConstBase):
 
+    __slots__ = ()
+
     def __init__(self,
             bcd: "BcDictionary",
             index: int,
@@ -288,6 +324,8 @@ class BcDoubleConst(JBytecodeConstBase):
 @BCD.bc_dictionary_record_tag("bcst")
 class BcByteConst(JBytecodeConstBase):
 
+    __slots__ = ()
+
     def __init__(self,
             bcd: "BcDictionary",
             index: int,
@@ -302,6 +340,8 @@ class BcByteConst(JBytecodeConstBase):
 @BCD.bc_dictionary_record_tag("shcst")
 class BcShortConst(JBytecodeConstBase):
 
+    __slots__ = ()
+
     def __init__(self,
             bcd: "BcDictionary",
             index: int,
@@ -316,6 +356,8 @@ class BcShortConst(JBytecodeConstBase):
 @BCD.bc_dictionary_record_tag("scst")
 class BcStringConst(JBytecodeConstBase):
 
+    __slots__ = ()
+
     def __init__(self,
             bcd: "BcDictionary",
             index: int,
@@ -334,6 +376,8 @@ class BcStringConst(JBytecodeConstBase):
 @BCD.bc_dictionary_record_tag("ccst")
 class BcClassConst(JBytecodeConstBase):
 
+    __slots__ = ()
+
     def __init__(self,
             bcd: "BcDictionary",
             index: int,
@@ -347,6 +391,8 @@ class BcClassConst(JBytecodeConstBase):
 
 class JBytecodeArithmeticBase(JBytecodeBase):
 
+    __slots__ = ()
+
     def __init__(self,
             bcd: "BcDictionary",
             index: int,
@@ -362,6 +408,8 @@ class JBytecodeArithmeticBase(JBytecodeBase):
 @BCD.bc_dictionary_record_tag("add")
 class BcAdd(JBytecodeArithmeticBase):
 
+    __slots__ = ()
+
     def __init__(self,
             bcd: "BcDictionary",
             index: int,
@@ -374,6 +422,8 @@ class BcAdd(JBytecodeArithmeticBase):
 @BCD.bc_dictionary_record_tag("sub")
 class BcSub(JBytecodeArithmeticBase):
 
+    __slots__ = ()
+
     def __init__(self,
             bcd: "BcDictionary",
             index: int,
@@ -386,6 +436,8 @@ class BcSub(JBytecodeArithmeticBase):
 @BCD.bc_dictionary_record_tag("mult")
 class BcMult(JBytecodeArithmeticBase):
 
+    __slots__ = ()
+
     def __init__(self,
             bcd: "BcDictionary",
             index: int,
@@ -398,6 +450,8 @@ class BcMult(JBytecodeArithmeticBase):
 @BCD.bc_dictionary_record_tag("div")
 class BcDiv(JBytecodeArithmeticBase):
 
+    __slots__ = ()
+
     def __init__(self,
             bcd: "BcDictionary",
             index: int,
@@ -410,6 +464,8 @@ class BcDiv(JBytecodeArithmeticBase):
 @BCD.bc_dictionary_record_tag("rem")
 class BcRem(JBytecodeArithmeticBase):
 
+    __slots__ = ()
+
     def __init__(self,
             bcd: "BcDictionary",
             index: int,
@@ -422,6 +478,8 @@ class BcRem(JBytecodeArithmeticBase):
 @BCD.bc_dictionary_record_tag("neg")
 class BcNeg(JBytecodeArithmeticBase):
 
+    __slots__ = ()
+
     def __init__(self,
             bcd: "BcDictionary",
             index: int,
@@ -433,6 +491,8 @@ class BcNeg(JBytecodeArithmeticBase):
 
 class JBytecodeConditionalJumpBase(JBytecodeBase):
 
+    __slots__ = ()
+
     def __init__(self,
             bcd: "BcDictionary",
             index: int,
@@ -448,6 +508,8 @@ class JBytecodeConditionalJumpBase(JBytecodeBase):
 @BCD.bc_dictionary_record_tag("ifeq")
 class BcIfEq(JBytecodeConditionalJumpBase):
 
+    __slots__ = ()
+
     def __init__(self,
             bcd: "BcDictionary",
             index: int,
@@ -459,6 +521,8 @@ class BcIfEq(JBytecodeConditionalJumpBase):
 @BCD.bc_dictionary_record_tag("ifne")
 class BcIfNe(JBytecodeConditionalJumpBase):
 
+    __slots__ = ()
+
     def __init__(self,
             bcd: "BcDictionary",
             index: int,
@@ -470,6 +534,8 @@ class BcIfNe(JBytecodeConditionalJumpBase):
 @BCD.bc_dictionary_record_tag("iflt")
 class BcIfLt(JBytecodeConditionalJumpBase):
 
+    __slots__ = ()
+
     def __init__(self,
             bcd: "BcDictionary",
             index: int,
@@ -481,6 +547,8 @@ class BcIfLt(JBytecodeConditionalJumpBase):
 @BCD.bc_dictionary_record_tag("ifge")
 class BcIfGe(JBytecodeConditionalJumpBase):
 
+    __slots__ = ()
+
     def __init__(self,
             bcd: "BcDictionary",
             index: int,
@@ -491,6 +559,8 @@ class BcIfGe(JBytecodeConditionalJumpBase):
 @BCD.bc_dictionary_record_tag("ifgt")
 class BcIfGt(JBytecodeConditionalJumpBase):
 
+    __slots__ = ()
+
     def __init__(self,
             bcd: "BcDictionary",
             index: int,
@@ -501,6 +571,8 @@ class BcIfGt(JBytecodeConditionalJumpBase):
 @BCD.bc_dictionary_record_tag("ifle")
 class BcIfLe(JBytecodeConditionalJumpBase):
 
+    __slots__ = ()
+
     def __init__(self,
             bcd: "BcDictionary",
             index: int,
@@ -511,6 +583,8 @@ class BcIfLe(JBytecodeConditionalJumpBase):
 @BCD.bc_dictionary_record_tag("ifnull")
 class BcIfNull(JBytecodeConditionalJumpBase):
 
+    __slots__ = ()
+
     def __init__(self,
             bcd: "BcDictionary",
             index: int,
@@ -521,6 +595,8 @@ class BcIfNull(JBytecodeConditionalJumpBase):
 @BCD.bc_dictionary_record_tag("ifnonnull")
 class BcIfNonNull(JBytecodeConditionalJumpBase):
 
+    __slots__ = ()
+
     def __init__(self,
             bcd: "BcDictionary",
             index: int,
@@ -531,6 +607,8 @@ class BcIfNonNull(JBytecodeConditionalJumpBase):
 @BCD.bc_dictionary_record_tag("ifcmpeq")
 class BcIfCmpEq(JBytecodeConditionalJumpBase):
 
+    __slots__ = ()
+
     def __init__(self,
             bcd: "BcDictionary",
             index: int,
@@ -541,6 +619,8 @@ class BcIfCmpEq(JBytecodeConditionalJumpBase):
 @BCD.bc_dictionary_record_tag("ifcmpne")
 class BcIfCmpNe(JBytecodeConditionalJumpBase):
 
+    __slots__ = ()
+
     def __init__(self,
             bcd: "BcDictionary",
             index: int,
@@ -551,6 +631,8 @@ class BcIfCmpNe(JBytecodeConditionalJumpBase):
 @BCD.bc_dictionary_record_tag("icmplt")
 class BcIfCmpLt(JBytecodeConditionalJumpBase):
 
+    __slots__ = ()
+
     def __init__(self,
             bcd: "BcDictionary",
             index: int,
@@ -561,6 +643,8 @@ class BcIfCmpLt(JBytecodeConditionalJumpBase):
 @BCD.bc_dictionary_record_tag("igcmpge")
 class BcIfCmpGe(JBytecodeConditionalJumpBase):
 
+    __slots__ = ()
+
     def __init__(self,
             bcd: "BcDictionary",
             index: int,
@@ -571,6 +655,8 @@ class BcIfCmpGe(JBytecodeConditionalJumpBase):
 @BCD.bc_dictionary_record_tag("ifcmpgt")
 class BcIfCmpGt(JBytecodeConditionalJumpBase):
 
+    __slots__ = ()
+
     def __init__(self,
             bcd: "BcDictionary",
             index: int,
@@ -581,6 +667,8 @@ class BcIfCmpGt(JBytecodeConditionalJumpBase):
 @BCD.bc_dictionary_record_tag("ifcmple")
 class BcIfCmpLe(JBytecodeConditionalJumpBase):
 
+    __slots__ = ()
+
     def __init__(self,
             bcd: "BcDictionary",
             index: int,
@@ -591,6 +679,8 @@ class BcIfCmpLe(JBytecodeConditionalJumpBase):
 @BCD.bc_dictionary_record_tag("ifcmpaeq")
 class BcIfCmpAEq(JBytecodeConditionalJumpBase):
 
+    __slots__ = ()
+
     def __init__(self,
             bcd: "BcDictionary",
             index: int,
@@ -601,6 +691,8 @@ class BcIfCmpAEq(JBytecodeConditionalJumpBase):
 @BCD.bc_dictionary_record_tag("ifcmpane")
 class BcIfCmpANe(JBytecodeConditionalJumpBase):
 
+    __slots__ = ()
+
     def __init__(self,
             bcd: "BcDictionary",
             index: int,
@@ -611,6 +703,8 @@ class BcIfCmpANe(JBytecodeConditionalJumpBase):
 @BCD.bc_dictionary_record_tag("goto")
 class BcGoto(JBytecodeBase):
 
+    __slots__ = ()
+
     def __init__(self,
             bcd: "BcDictionary",
             index: int,
@@ -625,6 +719,8 @@ class BcGoto(JBytecodeBase):
 @BCD.bc_dictionary_record_tag("jsr")
 class BcJsr(JBytecodeBase):
 
+    __slots__ = ()
+
     def __init__(self,
             bcd: "BcDictionary",
             index: int,
@@ -639,6 +735,8 @@ class BcJsr(JBytecodeBase):
 @BCD.bc_dictionary_record_tag("jret")
 class BcRet(JBytecodeBase):
 
+    __slots__ = ()
+
     def __init__(self,
             bcd: "BcDictionary",
             index: int,
@@ -653,6 +751,8 @@ class BcRet(JBytecodeBase):
 @BCD.bc_dictionary_record_tag("table")
 class BcTableSwitch(JBytecodeBase):
 
+    __slots__ = ()
+
     def __init__(self,
             bcd: "BcDictionary",
             index: int,
@@ -665,6 +765,8 @@ class BcTableSwitch(JBytecodeBase):
 @BCD.bc_dictionary_record_tag("lookup")
 class BcLookupSwitch(JBytecodeBase):
 
+    __slots__ = ()
+
     def __init__(self,
             bcd: "BcDictionary",
             index: int,
@@ -677,6 +779,8 @@ class BcLookupSwitch(JBytecodeBase):
 @BCD.bc_dictionary_record_tag("new")
 class BcNew(JBytecodeBase):
 
+    __slots__ = ()
+
     def __init__(self,
             bcd: "BcDictionary",
             index: int,
@@ -693,6 +797,8 @@ class BcNew(JBytecodeBase):
 @BCD.bc_dictionary_record_tag("newa")
 class BcNewArray(JBytecodeBase):
 
+    __slots__ = ()
+
     def __init__(self,
             bcd: "BcDictionary",
             index: int,
@@ -711,6 +817,8 @@ class BcNewArray(JBytecodeBase):
 @BCD.bc_dictionary_record_tag("mnewa")
 class BcAMultiNewArray(JBytecodeBase):
 
+    __slots__ = ()
+
     def __init__(self,
             bcd: "BcDictionary",
             index: int,
@@ -734,6 +842,8 @@ class BcAMultiNewArray(JBytecodeBase):
 @BCD.bc_dictionary_record_tag("ccast")
 class BcCheckCast(JBytecodeBase):
 
+    __slots__ = ()
+
     def __init__(self,
             bcd: "BcDictionary",
             index: int,
@@ -748,6 +858,8 @@ class BcCheckCast(JBytecodeBase):
 @BCD.bc_dictionary_record_tag("iof")
 class BcInstanceOf(JBytecodeBase):
 
+    __slots__ = ()
+
     def __init__(self,
             bcd: "BcDictionary",
             index: int,
@@ -761,6 +873,8 @@ class BcInstanceOf(JBytecodeBase):
 
 class BcFieldBase(JBytecodeBase):
 
+    __slots__ = ()
+
     def __init__(self,
             bcd: "BcDictionary",
             index: int,
@@ -776,6 +890,8 @@ class BcFieldBase(JBytecodeBase):
 @BCD.bc_dictionary_record_tag("gets")
 class BcGetStatic(BcFieldBase):
 
+    __slots__ = ()
+
     def __init__(self,
             bcd: "BcDictionary",
             index: int,
@@ -791,6 +907,8 @@ class BcGetStatic(BcFieldBase):
 @BCD.bc_dictionary_record_tag("puts")
 class BcPutStatic(BcFieldBase):
 
+    __slots__ = ()
+
     def __init__(self,
             bcd: "BcDictionary",
             index: int,
@@ -807,6 +925,8 @@ class BcPutStatic(BcFieldBase):
 @BCD.bc_dictionary_record_tag("getf")
 class BcGetField(BcFieldBase):
 
+    __slots__ = ()
+
     def __init__(self,
             bcd: "BcDictionary",
             index: int,
@@ -823,6 +943,8 @@ class BcGetField(BcFieldBase):
 @BCD.bc_dictionary_record_tag("putf")
 class BcPutField(BcFieldBase):
 
+    __slots__ = ()
+
     def __init__(self,
             bcd: "BcDictionary",
             index: int,
@@ -839,6 +961,8 @@ class BcPutField(BcFieldBase):
 @BCD.bc_dictionary_record_tag("ald")
 class BcArrayLoad(JBytecodeBase):
 
+    __slots__ = ()
+
     def __init__(self,
             bcd: "BcDictionary",
             index: int,
@@ -854,6 +978,8 @@ class BcArrayLoad(JBytecodeBase):
 @BCD.bc_dictionary_record_tag("ast")
 class BcArrayStore(JBytecodeBase):
 
+    __slots__ = ()
+
     def __init__(self,
             bcd: "BcDictionary",
             index: int,
@@ -868,6 +994,8 @@ class BcArrayStore(JBytecodeBase):
 
 class BcInvokeBase(JBytecodeBase):
 
+    __slots__ = ()
+
     def __init__(self,
             bcd: "BcDictionary",
             index: int,
@@ -884,6 +1012,8 @@ class BcInvokeBase(JBytecodeBase):
 @BCD.bc_dictionary_record_tag("invv")
 class BcInvokeVirtual(BcInvokeBase):
 
+    __slots__ = ()
+
     def __init__(self,
             bcd: "BcDictionary",
             index: int,
@@ -899,6 +1029,8 @@ class BcInvokeVirtual(BcInvokeBase):
 @BCD.bc_dictionary_record_tag("invsp")
 class BcInvokeSpecial(BcInvokeBase):
 
+    __slots__ = ()
+
     def __init__(self,
             bcd: "BcDictionary",
             index: int,
@@ -914,6 +1046,8 @@ class BcInvokeSpecial(BcInvokeBase):
 @BCD.bc_dictionary_record_tag("invst")
 class BcInvokeStatic(BcInvokeBase):
 
+    __slots__ = ()
+
     def __init__(self,
             bcd: "BcDictionary",
             index: int,
@@ -930,6 +1064,8 @@ class BcInvokeStatic(BcInvokeBase):
 @BCD.bc_dictionary_record_tag("invi")
 class BcInvokeInterface(BcInvokeBase):
 
+    __slots__ = ()
+
     def __init__(self,
             bcd: "BcDictionary",
             index: int,
@@ -945,6 +1081,8 @@ class BcInvokeInterface(BcInvokeBase):
 @BCD.bc_dictionary_record_tag("invd")
 class BcInvokeDynamic(BcInvokeBase):
 
+    __slots__ = ()
+
     def __init__(self,
             bcd: "BcDictionary",
             index: int,
@@ -958,6 +1096,8 @@ class BcInvokeDynamic(BcInvokeBase):
 @BCD.bc_dictionary_record_tag("ret")
 class BcReturn(JBytecodeBase):
 
+    __slots__ = ()
+
     def __init__(self,
             bcd: "BcDictionary",
             index: int,
@@ -28,49 +28,57 @@
 
 import hashlib
 
+from array import array
+
 import xml.etree.ElementTree as ET
 
 import chj.util.fileutil as UF
+import chj.util.graphutil as UG
 
 from chj.util.DotGraph import DotGraph
 
-from typing import Callable, Dict, List, Optional, Set, Tuple, TYPE_CHECKING
+from typing import cast, Callable, Dict, FrozenSet, List, Optional, Set, Tuple, TYPE_CHECKING
 
 if TYPE_CHECKING:
     from chj.app.JavaMethod import JavaMethod
     from chj.cost.MethodCost import MethodCost
 
 class BBlock():
-    '''Basic block in a method control flow graph.'''
+    '''Basic block in a method control flow graph.
+
+    The xml node is decoded when the block is constructed and not kept.
+    '''
 
     def __init__(self, cfg:"Cfg", xnode:ET.Element) -> None:
         self.cfg = cfg
-        self.xnode = xnode
-        self.hascondition = 'tcond' in self.xnode.attrib
+        self.hascondition = 'tcond' in xnode.attrib
+        self._firstpc = UF.get_optional(xnode, 'first-pc', int)
+        self._lastpc = UF.get_optional(xnode, 'last-pc', int)
+        self._tcond = xnode.get('tcond')
+        self._fcond = xnode.get('fcond')
+        self._looplevels: List[int] = []
+        xlevels = xnode.find('loop-levels')
+        if not xlevels is None:
+            self._looplevels = [ UF.safe_get_lazy(x, 'pc', lambda: 'pc missing from xml for loop in Basic Block at' + str(self.firstpc), int)
+                                    for x in xlevels.findall('level') ]
 
     @property
     def firstpc(self) -> int:
-        firstpc = self.xnode.get('first-pc')
-        if firstpc is None:
+        if self._firstpc is None:
             raise UF.CHJError('firstpc is missing from xml')
         else:
-            return int(firstpc)
+            return self._firstpc
 
     @property
     def lastpc(self) -> int:
-        lastpc = self.xnode.get('last-pc')
-        if lastpc is None:
+        if self._lastpc is None:
             raise UF.CHJError('lastpc is missing from xml')
         else:
-            return int(lastpc)
+            return self._lastpc
 
-    def get_loop_level_count(self) -> int: return len(self.get_loop_levels())
+    def get_loop_level_count(self) -> int: return self.cfg.get_loop_level_counts()[self.firstpc]
 
-    def get_loop_levels(self) -> List[int]:
-        if self.xnode.find('loop-levels') is None:
-            return []
-        return [ UF.safe_get(x, 'pc', 'pc missing from xml for loop in Basic Block at' + str(self.firstpc), int)
-                    for x in UF.safe_find(self.xnode, 'loop-levels', 'loop-levels missing from xml for Basic Block at' + str(self.firstpc)).findall('level') ]
+    def get_loop_levels(self) -> List[int]: return self._looplevels
 
     def get_successor_loop_level_counts(self) -> List[int]:
         return [ x.get_loop_level_count() for x in self.get_successor_blocks() ]
@@ -81,19 +89,18 @@ class BBlock():
         return [ self.cfg.get_block(x) for x in self.get_successors() ]
 
     def get_tcond(self) -> str:
-        if self.hascondition:
-            return UF.safe_get(self.xnode, 'tcond', 'tcond missing from xml', str)
-        else:
+        if self._tcond is None:
             raise UF.CHJError('tcond missing from xml')
+        else:
+            return self._tcond
 
     def get_fcond(self) -> str:
-        if self.hascondition:
-            return UF.safe_get(self.xnode, 'fcond', 'fcond missing from xml', str)
-        else:
+        if not self.hascondition or self._fcond is None:
             raise UF.CHJError('fcond missing from xml')
+        else:
+            return self._fcond
 
-    def has_conditions(self) -> bool:
-        return ('tcond' in self.xnode.attrib)
+    def has_conditions(self) -> bool: return self.hascondition
 
 
 class Cfg():
@@ -101,11 +108,22 @@ class Cfg():
 
     def __init__(self, jmethod: "JavaMethod", xnode: ET.Element):
         self.jmethod = jmethod
-        self.xnode = xnode
         self.blocks: Dict[int, BBlock] = {}            # firstpc -> BBlock
         self.edges: Dict[int, List[int]] = {}             # firstpc -> list of firstpcs
-        self._initialize_blocks()
-        self._initialize_edges()
+        self.components: Optional[List[List[int]]] = None       # loop-collapsed components
+        self.componentof: Dict[int, int] = {}                   # firstpc -> component
+        self.predecessors: Dict[int, List[int]] = {}      # firstpc -> list of firstpcs
+        self.blockpcs = array('i')                        # pc -> firstpc of its block (-1: none)
+        self.idoms: Optional[Dict[int, int]] = None       # firstpc -> immediate dominator (-1: root)
+        self.domintervals: Dict[int, Tuple[int, int]] = {}
+        self.ipdoms: Optional[Dict[int, int]] = None      # firstpc -> immediate post-dominator (-1: exit)
+        self.pdomintervals: Dict[int, Tuple[int, int]] = {}
+        self.loopparents: Optional[Dict[int, int]] = None     # loop header -> enclosing header (-1: none)
+        self.loopdepths: Dict[int, int] = {}              # loop header -> nesting depth (outermost: 1)
+        self.innermostloops: Dict[int, int] = {}          # firstpc -> header of innermost loop
+        self.looplevelcounts: Optional[Dict[int, int]] = None
+        self._initialize_blocks(xnode)
+        self._initialize_edges(xnode)
 
     def get_block(self, pc: int) -> BBlock:
         if pc in self.blocks:
@@ -114,11 +132,12 @@ class Cfg():
             raise UF.CHJError('No block found for pc = ' + str(pc))
 
     def get_loop_level_counts(self) -> Dict[int, int]:
-        loop_levels = {}
-        for pc in self.blocks:
-            block = self.blocks[pc]
-            loop_levels[pc] = block.get_loop_level_count()
-        return loop_levels
+        if self.looplevelcounts is None:
+            self.looplevelcounts = {}
+            for pc in self.blocks:
+                block = self.blocks[pc]
+                self.looplevelcounts[pc] = len(block.get_loop_levels())
+        return self.looplevelcounts
 
     def get_successors(self, pc:int) -> List[int]:
         if pc in self.edges:
@@ -126,6 +145,78 @@ class Cfg():
         else:
             return []
 
+    def get_predecessors(self, pc: int) -> List[int]:
+        if pc in self.predecessors:
+            return self.predecessors[pc]
+        else:
+            return []
+
+    def get_block_pc(self, pc: int) -> int:
+        '''returns the firstpc of the block that contains pc'''
+        if len(self.blockpcs) == 0:
+            size = 1 + max([ b.lastpc for b in self.blocks.values() ] + [ -1 ])
+            self.blockpcs = array('i', [-1]) * size
+            for (firstpc, b) in self.blocks.items():
+                for i in range(firstpc, b.lastpc + 1): self.blockpcs[i] = firstpc
+        if 0 <= pc < len(self.blockpcs) and self.blockpcs[pc] >= 0:
+            return self.blockpcs[pc]
+        raise UF.CHJError('No block found for pc = ' + str(pc))
+
+    def get_idom(self, pc: int) -> Optional[int]:
+        '''returns the immediate dominator of block pc (None for a root block
+        or an unreachable block)'''
+        self._initialize_dominators()
+        idom = cast(Dict[int, int], self.idoms).get(pc, -1)
+        return None if idom < 0 else idom
+
+    def dominates(self, a: int, b: int) -> bool:
+        '''returns true if every path from the method entry (or an exception
+        handler) to block b passes through block a; a block dominates itself'''
+        self._initialize_dominators()
+        if a in self.domintervals and b in self.domintervals:
+            (ia, ib) = (self.domintervals[a], self.domintervals[b])
+            return ia[0] <= ib[0] and ib[1] <= ia[1]
+        return False
+
+    def get_ipdom(self, pc: int) -> Optional[int]:
+        '''returns the immediate post-dominator of block pc (None for an exit
+        block or a block that cannot reach an exit)'''
+        self._initialize_postdominators()
+        ipdom = cast(Dict[int, int], self.ipdoms).get(pc, -1)
+        return None if ipdom < 0 else ipdom
+
+    def postdominates(self, a: int, b: int) -> bool:
+        '''returns true if every path from block b to a method exit passes
+        through block a; a block post-dominates itself'''
+        self._initialize_postdominators()
+        if a in self.pdomintervals and b in self.pdomintervals:
+            (ia, ib) = (self.pdomintervals[a], self.pdomintervals[b])
+            return ia[0] <= ib[0] and ib[1] <= ia[1]
+        return False
+
+    def get_loop_headers(self) -> List[int]:
+        '''returns the headers of the natural loops, in pc order'''
+        self._initialize_loop_forest()
+        return sorted(cast(Dict[int, int], self.loopparents))
+
+    def get_loop_parent(self, header: int) -> Optional[int]:
+        '''returns the header of the loop that immediately encloses the loop at
+        header (None if it is outermost)'''
+        self._initialize_loop_forest()
+        parent = cast(Dict[int, int], self.loopparents).get(header, -1)
+        return None if parent < 0 else parent
+
+    def get_innermost_loop(self, pc: int) -> Optional[int]:
+        '''returns the header of the innermost loop that contains pc (None if
+        pc is not in a loop)'''
+        self._initialize_loop_forest()
+        return self.innermostloops.get(self.get_block_pc(pc))
+
+    def get_loop_depth(self, pc: int) -> int:
+        '''returns the number of loops that contain pc'''
+        header = self.get_innermost_loop(pc)
+        return 0 if header is None else self.loopdepths[header]
+
     def iter_blocks(self, f: Callable[[BBlock], None]) -> None:
         for b in self.blocks: f(self.blocks[b])
 
@@ -142,59 +233,204 @@ class Cfg():
     def enumerate_paths(self,
         startpc: int,
         endpc: int) -> List[List[int]]:
-        def multiplicity(l:List[int], e:int) -> int:
-            count = 0
-            for x in l:
-                if x == e: count += 1
-            return count
+        '''returns all paths from startpc to endpc that pass through a block at
+        most once, or twice if it is in a loop; exponential in the number of
+        branches, see get_path_cost_bounds for bounds on the path costs'''
         result: List[List[int]] = []
+        counts: Dict[int, int] = { startpc: 1 }         # pc -> occurrences in prefix
         prefix: List[int] = [ startpc ]
-        def enumpaths(p: List[int]) -> None:
-            prefix = p[:]
+        def enumpaths() -> None:
             lastpc = prefix[-1]
             succs = self.get_successors(lastpc)
             depth = 0
             if self.get_block(lastpc).get_loop_level_count() > 0:
                 depth = 1
             for s in succs:
-                if multiplicity(prefix,s) > depth: continue
+                if counts.get(s, 0) > depth: continue
                 if s == endpc:
-                    prefix.append(s)
-                    result.append(prefix)
-                    prefix = prefix[:-1]
+                    result.append(prefix + [ s ])
                     break
             for s in succs:
-                if (multiplicity(prefix,s) > depth) or s == endpc:
+                if (counts.get(s, 0) > depth) or s == endpc:
                     continue
                 prefix.append(s)
-                enumpaths(prefix)
-                prefix = prefix[:-1]
+                counts[s] = counts.get(s, 0) + 1
+                enumpaths()
+                counts[s] -= 1
+                prefix.pop()
 
-        enumpaths(prefix)
+        enumpaths()
 
-        pathsets: List[Tuple[Set[int], int]] = []
+        pathsets: Set[Tuple[FrozenSet[int], int]] = set([])
         uniquepaths = []
         for p in result:
-            if (set(p),len(p)) in pathsets: continue
-            pathsets.append((set(p),len(p)))
+            if (frozenset(p),len(p)) in pathsets: continue
+            pathsets.add((frozenset(p),len(p)))
             uniquepaths.append(p)
         return uniquepaths
 
-    def _initialize_blocks(self) -> None:
-        blockerrormsg = 'blocks missing from xml for ' + self.jmethod.get_name()
-        firstpcerrormsg = 'blocks missing from xml for block in ' + self.jmethod.get_name()
-
-        for b in UF.safe_find(self.xnode, 'blocks', blockerrormsg).findall('bblock'):
-            self.blocks[ UF.safe_get(b, 'first-pc', firstpcerrormsg, int) ] = BBlock(self,b)
-
-    def _initialize_edges(self) -> None:
-        errormsg = ' missing from xml for ' + self.jmethod.get_name()
+    def get_loop_components(self) -> List[List[int]]:
+        '''returns the blocks of the cfg grouped into strongly connected
+        components, so that each loop is one component, in reverse topological
+        order (every component comes after the components it reaches)'''
+        if self.components is None:
+            self.components = [ sorted(c) for c in UG.get_strongly_connected_components(
+                sorted(self.blocks), self.get_successors) ]
+            for (i, c) in enumerate(self.components):
+                for pc in c: self.componentof[pc] = i
+        return self.components
+
+    def get_component(self, pc: int) -> int:
+        self.get_loop_components()
+        if pc in self.componentof:
+            return self.componentof[pc]
+        else:
+            raise UF.CHJError('No block found for pc = ' + str(pc))
 
-        for e in UF.safe_find(self.xnode, 'edges', 'edges ' + errormsg).findall('edge'):
-            src = UF.safe_get(e, 'src', 'src' + errormsg, int)
-            tgt = UF.safe_get(e, 'tgt', 'tgt' + errormsg, int)
+    def get_path_cost_bounds(self,
+        endpc: int,
+        blockcost: Callable[[int], Tuple[int, Optional[int]]]
+        ) -> Dict[int, Tuple[int, Optional[int], int, int]]:
+        '''returns, for every component from which endpc can be reached, the
+        lower and upper bound of the cost of the paths from that component to
+        endpc, and the next component on a cheapest and on a most expensive path
+        (-1 at the component of endpc).
+
+        The paths are those of the loop-collapsed cfg, which is a dag; a
+        component costs the sum of the (lower, upper) blockcost of its blocks,
+        that is, a loop is charged one iteration. An upper bound of None is
+        unbounded. One pass over the components in reverse topological order.
+        '''
+        components = self.get_loop_components()
+        endcomponent = self.get_component(endpc)
+        result: Dict[int, Tuple[int, Optional[int], int, int]] = {}
+        for c in range(endcomponent, len(components)):     # earlier ones cannot reach endpc
+            blocks = components[c]
+            (lb, ub) = (0, cast(Optional[int], 0))
+            for pc in blocks:
+                (blb, bub) = blockcost(pc)
+                lb += blb
+                ub = None if (ub is None or bub is None) else ub + bub
+            if c == endcomponent:
+                result[c] = (lb, ub, -1, -1)
+                continue
+            succs = set([ self.componentof[s] for pc in blocks for s in self.get_successors(pc) ])
+            candidates = [ s for s in sorted(succs) if s != c and s in result ]
+            if len(candidates) == 0: continue
+            lbnext = min(candidates, key=lambda s: result[s][0])
+            ubnext = candidates[0]
+            for s in candidates:
+                sub = result[s][1]
+                if sub is None:
+                    ubnext = s
+                    break
+                if sub > cast(int, result[ubnext][1]): ubnext = s
+            subub = result[ubnext][1]
+            result[c] = (lb + result[lbnext][0],
+                         None if (ub is None or subub is None) else ub + subub,
+                         lbnext,
+                         ubnext)
+        return result
+
+    def get_witness_path(self,
+        bounds: Dict[int, Tuple[int, Optional[int], int, int]],
+        startpc: int,
+        longest: bool = True) -> List[int]:
+        '''returns the blocks on a most expensive (cheapest if not longest) path
+        from startpc given the result of get_path_cost_bounds; the blocks of a
+        loop are listed in pc order'''
+        c = self.get_component(startpc)
+        result: List[int] = []
+        while c >= 0 and c in bounds:
+            result.extend(cast(List[List[int]], self.components)[c])
+            c = bounds[c][3] if longest else bounds[c][2]
+        return result
+
+    def _initialize_dominators(self) -> None:
+        if not self.idoms is None: return
+        # a virtual root (-1) precedes the entry block and the blocks without
+        # predecessors, such as exception handlers
+        roots = [ pc for pc in sorted(self.blocks) if len(self.get_predecessors(pc)) == 0 ]
+        if len(self.blocks) > 0 and not min(self.blocks) in roots: roots.insert(0, min(self.blocks))
+        rootset = set(roots)
+        self.idoms = UG.get_immediate_dominators(
+            -1,
+            lambda n: roots if n == -1 else self.get_successors(n),
+            lambda n: ([ -1 ] if n in rootset else []) + self.get_predecessors(n))
+        self.domintervals = UG.get_tree_intervals(-1, self.idoms)
+
+    def _initialize_postdominators(self) -> None:
+        if not self.ipdoms is None: return
+        # a virtual exit (-1) follows the blocks without successors
+        exits = [ pc for pc in sorted(self.blocks) if len(self.get_successors(pc)) == 0 ]
+        exitset = set(exits)
+        self.ipdoms = UG.get_immediate_dominators(
+            -1,
+            lambda n: exits if n == -1 else self.get_predecessors(n),
+            lambda n: ([ -1 ] if n in exitset else []) + self.get_successors(n))
+        self.pdomintervals = UG.get_tree_intervals(-1, self.ipdoms)
+
+    def _initialize_loop_forest(self) -> None:
+        if not self.loopparents is None: return
+        self._initialize_dominators()
+        latches: Dict[int, List[int]] = {}      # header -> sources of back edges
+        for src in self.edges:
+            for tgt in self.edges[src]:
+                if self.dominates(tgt, src): latches.setdefault(tgt, []).append(src)
+
+        # headers are processed inner before outer (an inner header comes later
+        # in dominator tree preorder); the blocks of a processed loop are
+        # represented by its header, found through representative
+        representative: Dict[int, int] = {}
+        def find(n: int) -> int:
+            r = n
+            while r in representative: r = representative[r]
+            while n != r:
+                parent = representative[n]
+                representative[n] = r
+                n = parent
+            return r
+
+        parents: Dict[int, int] = {}
+        for h in sorted(latches, key=lambda h: self.domintervals[h][0], reverse=True):
+            self.innermostloops[h] = h
+            body: Set[int] = set([ h ])
+            work = [ find(t) for t in latches[h] ]
+            while len(work) > 0:
+                b = work.pop()
+                if b in body: continue
+                body.add(b)
+                if b in parents: parents[b] = h
+                else: self.innermostloops[b] = h
+                for p in self.get_predecessors(b):
+                    if p in self.domintervals:
+                        r = find(p)
+                        if not r in body: work.append(r)
+            for b in body:
+                if b != h: representative[b] = h
+            parents[h] = -1
+
+        for h in sorted(parents, key=lambda h: self.domintervals[h][0]):
+            self.loopdepths[h] = 1 if parents[h] < 0 else self.loopdepths[parents[h]] + 1
+        self.loopparents = parents
+
+    def _initialize_blocks(self, xnode: ET.Element) -> None:
+        blockerrormsg = lambda: 'blocks missing from xml for ' + self.jmethod.get_name()
+        firstpcerrormsg = lambda: 'blocks missing from xml for block in ' + self.jmethod.get_name()
+
+        for b in UF.safe_find_lazy(xnode, 'blocks', blockerrormsg).findall('bblock'):
+            self.blocks[ UF.safe_get_lazy(b, 'first-pc', firstpcerrormsg, int) ] = BBlock(self,b)
+
+    def _initialize_edges(self, xnode: ET.Element) -> None:
+        errormsg = lambda: ' missing from xml for ' + self.jmethod.get_name()
+
+        for e in UF.safe_find_lazy(xnode, 'edges', lambda: 'edges ' + errormsg()).findall('edge'):
+            src = UF.safe_get_lazy(e, 'src', lambda: 'src' + errormsg(), int)
+            tgt = UF.safe_get_lazy(e, 'tgt', lambda: 'tgt' + errormsg(), int)
             if not src in self.edges: self.edges[src] = []
             self.edges[src].append(tgt)
+            if not tgt in self.predecessors: self.predecessors[tgt] = []
+            self.predecessors[tgt].append(src)
 
     def as_dot(self,
             methodcost: Optional["MethodCost"]=None,
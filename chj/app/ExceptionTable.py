@@ -37,32 +37,32 @@ if TYPE_CHECKING:
     from chj.index.Classname import Classname
 
 class FinallyHandler(object):
+    '''Exception table entry, decoded from its xml node when constructed.'''
 
     def __init__(self, jtable: "ExceptionTable", xnode:"ET.Element"):
         self.jtable = jtable
-        self.xnode = xnode
+        self._startpc = UF.get_optional(xnode, 'start', int)
+        self._endpc = UF.get_optional(xnode, 'end', int)
+        self._handlerpc = UF.get_optional(xnode, 'pc', int)
 
     @property
     def startpc(self) -> int:
-        startpc = self.xnode.get('start')
-        if startpc is not None:
-            return int(startpc)
+        if self._startpc is not None:
+            return self._startpc
         else:
             raise UF.CHJError('startpc missing from xml for Exception')
 
     @property
     def endpc(self) -> int:
-        endpc = self.xnode.get('end')
-        if endpc is not None:
-            return int(endpc)
+        if self._endpc is not None:
+            return self._endpc
         else:
             raise UF.CHJError('endpc missing from xml for Exception')
 
     @property
     def handlerpc(self) -> int:
-        handlerpc = self.xnode.get('pc')
-        if handlerpc is not None:
-            return int(handlerpc)
+        if self._handlerpc is not None:
+            return self._handlerpc
         else:
             raise UF.CHJError('pc missing from xml for Exception')
 
@@ -71,13 +71,12 @@ class ExceptionHandler(FinallyHandler):
     def __init__(self, jtable: "ExceptionTable", xnode:"ET.Element"):
         FinallyHandler.__init__(self,jtable,xnode)
         self.jd = jtable.jmethod.jd
-        self.xnode = xnode
+        self._cnix = UF.get_optional(xnode, 'cnix', int)
 
     @property
     def cnix(self) -> int:
-        cnix = self.xnode.get('cnix')
-        if cnix is not None:
-            return int(cnix)
+        if self._cnix is not None:
+            return self._cnix
         else:
             raise UF.CHJError('cnix missing from xml for Exception')
 
@@ -42,7 +42,7 @@ class Field():
     def __init__(self, jclass: "JavaClass", xnode: "ET.Element"):
         self.jclass = jclass                                        # JavaClass
         self.jd: "DataDictionary" = jclass.app.jd                   # DataDictionary
-        self.cfsix = UF.safe_get(xnode, 'cfsix', 'cfsix missing from xml of class ' + jclass.get_qname(), int)
+        self.cfsix = UF.safe_get_lazy(xnode, 'cfsix', lambda: 'cfsix missing from xml of class ' + jclass.get_qname(), int)
         self.access = xnode.get('access')
         self.isfinal = 'final' in xnode.attrib and xnode.get('final') == 'yes'
         self.isstatic = 'static' in xnode.attrib and xnode.get('static') == 'yes'
@@ -26,7 +26,10 @@
 # SOFTWARE.
 # ------------------------------------------------------------------------------
 
-from typing import Any, cast, List, Optional, TYPE_CHECKING
+from array import array
+from bisect import bisect_left, bisect_right
+
+from typing import Any, cast, Iterator, List, Mapping, Optional, TYPE_CHECKING
 
 import chj.util.fileutil as UF
 
@@ -46,6 +49,8 @@ if TYPE_CHECKING:
 
 class Instruction(object):
 
+    __slots__ = ("jmethod", "pc", "opc", "exprstack", "tgts")
+
     def __init__(self,
             jmethod: "JavaMethod",
             pc: int,
@@ -119,3 +124,78 @@ class Instruction(object):
             raise UF.CHJError(str(self.opc) + ' does not contain a field')
 
     def __str__(self) -> str: return str(self.opc)
+
+
+class InstructionTable(Mapping[int, Instruction]):
+    '''Instructions of a method, as a read-only mapping pc -> Instruction.
+
+    The instructions are kept in parallel int arrays sorted by pc: the
+    opcode and slot-list indices into the class BcDictionary, and the index
+    of the call target in the CallgraphDictionary (-1 if none). Instruction
+    objects are constructed on access and not kept.
+    '''
+
+    def __init__(self, jmethod: "JavaMethod") -> None:
+        self.jmethod = jmethod
+        self.pcs = array('i')
+        self.opcodes = array('i')
+        self.slots = array('i')
+        self.targets = array('i')
+
+    def add(self, pc: int, opcode: int, slots: int, target: int = -1) -> None:
+        '''Append an instruction; pcs must be added in increasing order.'''
+        if len(self.pcs) > 0 and pc <= self.pcs[-1]:
+            raise UF.CHJError('Instruction at pc ' + str(pc) + ' out of order')
+        self.pcs.append(pc)
+        self.opcodes.append(opcode)
+        self.slots.append(slots)
+        self.targets.append(target)
+
+    def _position(self, pc: int) -> int:
+        pos = bisect_left(self.pcs, pc)
+        if pos < len(self.pcs) and self.pcs[pos] == pc:
+            return pos
+        return -1
+
+    def _get_instruction(self, pos: int) -> Instruction:
+        jmethod = self.jmethod
+        bcd = jmethod.jclass.bcd
+        if bcd is None:
+            raise UF.CHJError('No bytecode dictionary for ' + jmethod.get_qname())
+        target = self.targets[pos]
+        return Instruction(
+            jmethod,
+            self.pcs[pos],
+            bcd.get_opcode(self.opcodes[pos]),
+            bcd.get_slots(self.slots[pos]),
+            None if target < 0 else jmethod.jd.cgd.get_target(target))
+
+    def __getitem__(self, pc: int) -> Instruction:
+        pos = self._position(pc)
+        if pos < 0:
+            raise KeyError(pc)
+        return self._get_instruction(pos)
+
+    def __contains__(self, pc: object) -> bool:
+        return isinstance(pc, int) and self._position(pc) >= 0
+
+    def __iter__(self) -> Iterator[int]: return iter(self.pcs)
+
+    def __len__(self) -> int: return len(self.pcs)
+
+    def iter_instructions(self) -> Iterator[Instruction]:
+        for pos in range(len(self.pcs)):
+            yield self._get_instruction(pos)
+
+    def get_pcs(self) -> List[int]: return self.pcs.tolist()
+
+    def get_next_pc(self, pc: int) -> Optional[int]:
+        '''returns the pc of the first instruction after pc'''
+        pos = bisect_right(self.pcs, pc)
+        if pos < len(self.pcs):
+            return self.pcs[pos]
+        return None
+
+    def get_pcs_in_range(self, firstpc: int, lastpc: int) -> List[int]:
+        '''returns the pcs of the instructions from firstpc up to and including lastpc'''
+        return self.pcs[bisect_left(self.pcs, firstpc):bisect_right(self.pcs, lastpc)].tolist()
@@ -71,6 +71,14 @@ class JavaClass():
 
     def get_method(self, cmsix: int) -> JavaMethod: return self.methods[cmsix]
 
+    def prefetch(self, aspects: Optional[List[str]] = None) -> None:
+        '''loads the given aspects (see JavaMethod.ASPECTS) of all methods'''
+        for m in self.methods.values(): m.prefetch(aspects)
+
+    def release(self, aspects: Optional[List[str]] = None) -> None:
+        '''drops the given aspects of all methods until they are used again'''
+        for m in self.methods.values(): m.release(aspects)
+
     def iter_methods(self, f: Callable[[int, JavaMethod], None]) -> None:
         for cmsix in self.methods: f(cmsix,self.methods[cmsix])
 
@@ -160,14 +168,14 @@ class JavaClass():
         else:
             print('No dictionary found for ' + self.get_qname())
 
-        errormsg = ' missing from xml for ' + self.get_qname()
-        for f in UF.safe_find(xnode, 'fields', 'fields' + errormsg).findall('field'):
-            self.fields[UF.safe_get(f, 'cfsix', 'cfsix' + errormsg ,int)] = Field(self,f)
-        for m in UF.safe_find(xnode, 'methods', 'methods' + errormsg).findall('method'):
+        errormsg = lambda: ' missing from xml for ' + self.get_qname()
+        for f in UF.safe_find_lazy(xnode, 'fields', lambda: 'fields' + errormsg()).findall('field'):
+            self.fields[UF.safe_get_lazy(f, 'cfsix', lambda: 'cfsix' + errormsg() ,int)] = Field(self,f)
+        for m in UF.safe_find_lazy(xnode, 'methods', lambda: 'methods' + errormsg()).findall('method'):
             if 'native' in m.attrib and m.get('native') == 'yes':
                 continue
-            self.methods[UF.safe_get(m, 'cmsix', 'cmsix' + errormsg, int)] = JavaMethod(self,m)
+            self.methods[UF.safe_get_lazy(m, 'cmsix', lambda: 'cmsix' + errormsg(), int)] = JavaMethod(self,m)
         if 'super-ix' in xnode.attrib:
-            self.superix = UF.safe_get(xnode, 'super-ix', 'super-ix' + errormsg, int)
+            self.superix = UF.safe_get_lazy(xnode, 'super-ix', lambda: 'super-ix' + errormsg(), int)
 
 
@@ -26,11 +26,13 @@
 # SOFTWARE.
 # ------------------------------------------------------------------------------
 
+from array import array
+
 import chj.util.fileutil as UF
 
 from chj.app.Cfg import Cfg
 from chj.app.ExceptionTable import ExceptionTable
-from chj.app.Instruction import Instruction
+from chj.app.Instruction import Instruction, InstructionTable
 from chj.app.Loop import Loop
 from chj.app.MethodInvs import MethodInvs
 from chj.app.Vartable import Vartable
@@ -59,24 +61,91 @@ class JavaMethod(object):
     - _taint contains taint information for each variable at each location
     - _loops contains detailed information on each loop in the method
     These files are loaded on demand when a related request for data is made.
+
+    The aspects (see ASPECTS) are loaded independently on first use; bulk
+    consumers can load them up front with prefetch, and drop them again
+    with release.
     """
 
+    ASPECTS = ('bytecode', 'loops', 'invariants', 'taint')
+
     def __init__(self, jclass: "JavaClass", xnode: "ET.Element") -> None:
         self.jclass = jclass                                    # JavaClass
         self.jd: "DataDictionary" = jclass.jd                   # DataDictionary
         self.xnode = xnode                                      # class file xnode
         self.access = xnode.get('access')
-        self.loops: Dict[int, Loop] = {}                        # first-pc -> Loop
-        self.cfg: Cfg                                           # Cfg
-        self.instructions: Dict[int, Instruction] = {}          # pc -> Instruction
-        self.exceptiontable: Optional[ExceptionTable] = None    # ExceptionTable
-        self.variabletable: Optional[Vartable] = None
-        self.taintedvariables: Dict[int, List["T.VariableTaintNode"]] = {}          # pc -> DTaintedVariables
-        self.invariants: Optional[MethodInvs] = None            # MethodInvs
+        self._loops: Optional[Dict[int, Loop]] = None           # first-pc -> Loop
+        self._loopdepths: Optional["array[int]"] = None         # pc -> number of loops
+        self._cfg: Optional[Cfg] = None                         # Cfg
+        self._instructions: Optional[InstructionTable] = None   # pc -> Instruction
+        self._exceptiontable: Optional[ExceptionTable] = None   # ExceptionTable
+        self._variabletable: Optional[Vartable] = None
+        self._taintedvariables: Optional[Dict[int, List["T.VariableTaintNode"]]] = None   # pc -> DTaintedVariables
+        self._invariants: Optional[MethodInvs] = None           # MethodInvs
+        self._invariantsloaded = False
+
+    @property
+    def loops(self) -> Dict[int, Loop]:
+        self._initialize_loops()
+        return cast(Dict[int, Loop], self._loops)
+
+    @property
+    def cfg(self) -> Cfg:
+        self._read_method_bytecode()
+        if self._cfg is None:
+            raise UF.CHJError('No CFG available for abstract method ' + self.get_qname())
+        return self._cfg
+
+    @property
+    def instructions(self) -> InstructionTable:
+        self._read_method_bytecode()
+        return cast(InstructionTable, self._instructions)
+
+    @property
+    def exceptiontable(self) -> Optional[ExceptionTable]:
         self._read_method_bytecode()
-        self._initialize_loops()                                # extract from class file xnode
+        return self._exceptiontable
+
+    @property
+    def variabletable(self) -> Optional[Vartable]:
+        self._read_method_bytecode()
+        return self._variabletable
+
+    @property
+    def taintedvariables(self) -> Dict[int, List["T.VariableTaintNode"]]:
         self._initialize_tainted_variables()
+        return cast(Dict[int, List["T.VariableTaintNode"]], self._taintedvariables)
+
+    @property
+    def invariants(self) -> Optional[MethodInvs]:
         self._read_method_invariants()
+        return self._invariants
+
+    def prefetch(self, aspects: Optional[List[str]] = None) -> None:
+        """Load the given aspects (default: all) now rather than on first use."""
+        for aspect in (self.ASPECTS if aspects is None else aspects):
+            if aspect == 'bytecode': self._read_method_bytecode()
+            elif aspect == 'loops': self._initialize_loops()
+            elif aspect == 'invariants': self._read_method_invariants()
+            elif aspect == 'taint': self._initialize_tainted_variables()
+            else: raise UF.CHJError('Unknown method aspect: ' + aspect)
+
+    def release(self, aspects: Optional[List[str]] = None) -> None:
+        """Drop the given aspects (default: all); they are reloaded on next use."""
+        for aspect in (self.ASPECTS if aspects is None else aspects):
+            if aspect == 'bytecode':
+                self._instructions = None
+                self._cfg = None
+                self._exceptiontable = None
+                self._variabletable = None
+            elif aspect == 'loops':
+                self._loops = None
+                self._loopdepths = None
+            elif aspect == 'invariants':
+                self._invariants = None
+                self._invariantsloaded = False
+            elif aspect == 'taint': self._taintedvariables = None
+            else: raise UF.CHJError('Unknown method aspect: ' + aspect)
 
     @property
     def cmsix(self) -> int:
@@ -103,21 +172,27 @@ class JavaMethod(object):
 
     def get_pcs(self) -> List[int]:
         self._read_method_bytecode()
-        return sorted(self.instructions.keys())
+        return self.instructions.get_pcs()
 
     def get_loops(self) -> "ValuesView[Loop]":
         return self.loops.values()
 
     def get_loop_depth(self, pc: int) -> int:
-        result = 0
-        for loop in self.get_loops():
-            if pc >= loop.first_pc and pc <= loop.last_pc:
-                result += 1
-        return result
+        '''returns the number of loops whose pc range contains pc'''
+        if self._loopdepths is None:
+            ranges = [ (loop.first_pc, loop.last_pc) for loop in self.get_loops() ]
+            depths = array('i', [0]) * (2 + max([ last for (_, last) in ranges ] + [ -1 ]))
+            for (first, last) in ranges:
+                if first > last: continue
+                depths[first] += 1
+                depths[last + 1] -= 1
+            for i in range(1, len(depths)): depths[i] += depths[i - 1]
+            self._loopdepths = depths
+        return self._loopdepths[pc] if 0 <= pc < len(self._loopdepths) else 0
 
     def get_loop_count(self) -> int:
-        loops_node = UF.safe_find(self.xnode, 'loops', 'loops not found in xml for ' + self.get_name())
-        return UF.safe_get(loops_node, 'count', 'loop count not found in xml for ' + self.get_name(), int)
+        loops_node = UF.safe_find_lazy(self.xnode, 'loops', lambda: 'loops not found in xml for ' + self.get_name())
+        return UF.safe_get_lazy(loops_node, 'count', lambda: 'loop count not found in xml for ' + self.get_name(), int)
 
     def get_max_depth(self) -> int:
         return int(self.xnode.get('max-depth','0'))
@@ -150,14 +225,11 @@ class JavaMethod(object):
 
     def iter_instructions(self, f:Callable[[int, Instruction], None]) -> None:
         self._read_method_bytecode()
-        for pc in self.instructions: f(pc,self.instructions[pc])
+        for i in self.instructions.iter_instructions(): f(i.pc,i)
 
     def get_next_pc(self, pc: int) -> Optional[int]:
-        pcs = self.get_pcs()
-        index = pcs.index(pc)
-        if index < len(pcs) - 1:
-            return pcs[index + 1]
-        return None
+        self._read_method_bytecode()
+        return self.instructions.get_next_pc(pc)
 
     def get_variable_name(self, name: str, pc: int) -> str:
         self._read_method_bytecode()
@@ -289,15 +361,15 @@ class JavaMethod(object):
     def as_dictionary(self) -> Dict[str, str]:
         self._read_method_bytecode()
         result = {}
-        for i in sorted(self.instructions):
-            result[str(i)] = str(self.instructions[i])
+        for i in self.instructions.iter_instructions():
+            result[str(i.pc)] = str(i)
         return result
 
     def as_list(self) -> List[List[str]]:
         self._read_method_bytecode()
         lines = []
-        for i in sorted(self.instructions):
-            lines.append([str(i), str(self.instructions[i])])
+        for i in self.instructions.iter_instructions():
+            lines.append([str(i.pc), str(i)])
         return lines
 
     def __str__(self) -> str:
@@ -305,15 +377,18 @@ class JavaMethod(object):
         lines = []
         lines.append(self.get_qname())
         lines.append(str(self.variabletable))
-        for i in sorted(self.instructions):
-            lines.append(str(i).rjust(4) + '  ' + str(self.instructions[i]))
+        for i in self.instructions.iter_instructions():
+            lines.append(str(i.pc).rjust(4) + '  ' + str(i))
         return '\n'.join(lines)
         
 
     def _initialize_loops(self) -> None:
-        for l in UF.safe_find(self.xnode, 'loops', 'loops missing from xml for ' + self.get_name()).findall('loop'):
-            looppc = UF.safe_get(l, 'first-pc', 'first-pc missing from xml for loop in ' + self.get_name(), int)
-            self.loops[looppc] = Loop(self,l)
+        if self._loops is not None: return
+        loops: Dict[int, Loop] = {}
+        for l in UF.safe_find_lazy(self.xnode, 'loops', lambda: 'loops missing from xml for ' + self.get_name()).findall('loop'):
+            looppc = UF.safe_get_lazy(l, 'first-pc', lambda: 'first-pc missing from xml for loop in ' + self.get_name(), int)
+            loops[looppc] = Loop(self,l)
+        self._loops = loops
 
     def _get_file_details(self) -> Tuple[str, str, str, str, str]:
         path = str(self.jclass.app.path)
@@ -324,62 +399,69 @@ class JavaMethod(object):
         return (path,package,classname,methodname,cmsix)
 
     def _initialize_tainted_variables(self) -> None:
-        if len(self.taintedvariables) > 0: return
-        if self.jd.ttd is None: return
-        def f(i: int, n: "T.VariableTaintNode") -> None:
-            if n.get_caller().index == self.cmsix:
+        if self._taintedvariables is not None: return
+        taintedvariables: Dict[int, List["T.VariableTaintNode"]] = {}
+        if self.jd.has_taint_results():
+            for n in self.jd.ttd.get_method_var_taint_nodes(self.cmsix):
                 pc = n.get_pc()
-                if not pc in self.taintedvariables: self.taintedvariables[pc] = []
-                self.taintedvariables[pc].append(n)
-        self.jd.ttd.iter_var_taint_node_types(f)
+                if not pc in taintedvariables: taintedvariables[pc] = []
+                taintedvariables[pc].append(n)
+        self._taintedvariables = taintedvariables
 
     def _read_method_bytecode(self) -> None:
-        if self.is_abstract(): return
-        if len(self.instructions) > 0: return
+        if self._instructions is not None: return
+        instructions = InstructionTable(self)
+        if self.is_abstract():
+            self._instructions = instructions
+            return
 
         (path,package,classname,methodname,id) = self._get_file_details()
 
         bcxnode = UF.get_app_methodsbc_xnode(path,package,classname,methodname,id)
         inode = bcxnode.find('instructions')
-        if not inode is None:
+        if not inode is None and self.jclass.bcd is not None:
+            rows: List[Tuple[int, int, int, int]] = []
             for i in inode.findall('instr'):
-                pc = UF.safe_get(i, 'pc', 'pc missing from xml for instruction in method ' + self.get_qname(), int)
-                xiopc = UF.safe_get(i, 'iopc', 'iopc missing from xml for ' + self.get_qname(), int)
-                if self.jclass.bcd is not None:
-                    iopc = self.jclass.bcd.get_opcode(xiopc)
-                    xissdl = UF.safe_get(i, 'issdl', 'issdl missing from xml for ' + self.get_qname(), int)
-                    exprstack = self.jclass.bcd.get_slots(xissdl)
-                    tgts: Optional["CallgraphTargetBase"] = None
-                    if 'itgt' in i.attrib:
-                        tgts = self.jd.cgd.read_xml_target(i)
-                    elif self.jd.has_call_target(self.cmsix,pc):
-                        (_,tgts) = self.jd.get_call_target(self.cmsix,pc)
-                    else:
-                        tgts = None
-                    instr = Instruction(self,pc,iopc,exprstack,tgts)
-                    self.instructions[pc] = instr
+                pc = UF.safe_get_lazy(i, 'pc', lambda: 'pc missing from xml for instruction in method ' + self.get_qname(), int)
+                xiopc = UF.safe_get_lazy(i, 'iopc', lambda: 'iopc missing from xml for ' + self.get_qname(), int)
+                xissdl = UF.safe_get_lazy(i, 'issdl', lambda: 'issdl missing from xml for ' + self.get_qname(), int)
+                if 'itgt' in i.attrib:
+                    itgt = UF.safe_get(i, 'itgt', 'itgt missing from xml', int)
+                elif self.jd.has_call_target(self.cmsix,pc):
+                    itgt = self.jd.get_call_target(self.cmsix,pc)[1].index
+                else:
+                    itgt = -1
+                rows.append((pc, xiopc, xissdl, itgt))
+            for (pc, xiopc, xissdl, itgt) in sorted(rows):
+                instructions.add(pc, xiopc, xissdl, itgt)
         
         vtnode = bcxnode.find('variable-table')
-        if not vtnode is None:
-            self.variabletable = Vartable(self,vtnode)
+        variabletable = None if vtnode is None else Vartable(self,vtnode)
 
         cfgnode = bcxnode.find('cfg')
         if not cfgnode is None:
-            self.cfg = Cfg(self,cfgnode)
+            cfg = Cfg(self,cfgnode)
         else:
             raise UF.CHJError('CFG missing from xml for ' + self.get_qname())
 
         exnode = bcxnode.find('exception-handlers')
+        exceptiontable = None
         if not exnode is None and (len(exnode.findall('handler')) > 0):
-            self.exceptiontable = ExceptionTable(self,exnode)
+            exceptiontable = ExceptionTable(self,exnode)
+
+        self._variabletable = variabletable
+        self._cfg = cfg
+        self._exceptiontable = exceptiontable
+        self._instructions = instructions
 
     def _read_method_invariants(self) -> None:
+        if self._invariantsloaded: return
+        self._invariantsloaded = True
         if self.is_abstract(): return
-        if not self.invariants is None: return
 
         try:
             (path,package,classname,methodname,id) = self._get_file_details()
             invsnode = UF.get_app_methodsinvs_xnode(path,package,classname,methodname,id)
-            self.invariants = MethodInvs(self,invsnode)
+            self._invariants = MethodInvs(self,invsnode)
         except Exception as e:
             print('Unable to load ' + str(methodname) + ' in ' + str(classname) + ': ' + str(e))
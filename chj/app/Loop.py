@@ -28,7 +28,7 @@
 
 import chj.util.fileutil as UF
 
-from typing import Dict, List, Tuple, TYPE_CHECKING
+from typing import Dict, List, Optional, Tuple, TYPE_CHECKING
 
 if TYPE_CHECKING:
     from chj.app.JavaMethod import JavaMethod
@@ -37,61 +37,64 @@ if TYPE_CHECKING:
     import xml.etree.ElementTree as ET
 
 class Loop(object):
+    '''Loop in a method, decoded from its xml node when constructed.'''
 
     def __init__(self,jmethod: "JavaMethod", xnode: "ET.Element"):
         self.jmethod = jmethod          # JavaMethod
         self.jd = jmethod.jd            # DataDictionary
-        self.xnode = xnode
         self.jumpconditions: Dict[int, str] = {}       # pc -> jumpcondition string
-        self._initializejumpconditions()
+        self._depth = UF.get_optional(xnode, 'depth', int)
+        self._entry_pc = UF.get_optional(xnode, 'entry-pc', int)
+        self._first_pc = UF.get_optional(xnode, 'first-pc', int)
+        self._last_pc = UF.get_optional(xnode, 'last-pc', int)
+        self._instr_count = UF.get_optional(xnode, 'instrs', int)
+        self._maxiterations: List[Optional[int]] = []   # jterm indices
+        inode = xnode.find('max-iterations')
+        if not inode is None:
+            self._maxiterations = [ UF.get_optional(jt, 'ijt', int) for jt in inode.findall('max-it') ]
+        self._initializejumpconditions(xnode)
 
     @property
     def depth(self) -> int:
-        xdepth = self.xnode.get('depth')
-        if xdepth is not None:
-            return int(xdepth)
+        if self._depth is not None:
+            return self._depth
         else:
             raise UF.CHJError('depth missing from xml for loop in ' + self.jmethod.get_qname())
 
     @property
     def entry_pc(self) -> int:
-        xentry_pc = self.xnode.get('entry-pc')
-        if xentry_pc is not None:
-            return int(xentry_pc)
+        if self._entry_pc is not None:
+            return self._entry_pc
         else:
             raise UF.CHJError('entry-pc missing from xml for loop in ' + self.jmethod.get_qname())
 
     @property
     def first_pc(self) -> int:
-        xfirst_pc = self.xnode.get('first-pc')
-        if xfirst_pc is not None:
-            return int(xfirst_pc)
+        if self._first_pc is not None:
+            return self._first_pc
         else:
             raise UF.CHJError('first-pc missing from xml for loop in ' + self.jmethod.get_qname())
 
     @property
     def last_pc(self) -> int:
-        xlast_pc = self.xnode.get('last-pc')
-        if xlast_pc is not None:
-            return int(xlast_pc)
+        if self._last_pc is not None:
+            return self._last_pc
         else:
             raise UF.CHJError('last-pc missing from xml for loop in ' + self.jmethod.get_qname())
 
     @property
     def instr_count(self) -> int:
-        xinstr_count = self.xnode.get('instrs')
-        if xinstr_count is not None:
-            return int(xinstr_count)
+        if self._instr_count is not None:
+            return self._instr_count
         else:
             raise UF.CHJError('instrs missing from xml for loop in ' + self.jmethod.get_qname())
 
     def get_max_iterations(self) -> List["JTermBase"]:
         result: List["JTermBase"] = []
-        inode = self.xnode.find('max-iterations')
-        if inode is None: 
-            return result
-        for jt in inode.findall('max-it'):
-            result.append(self.jd.jtd.read_xml_jterm(jt))
+        for ix in self._maxiterations:
+            if ix is None:
+                raise UF.CHJError('ijt missing from jterm xml')
+            result.append(self.jd.jtd.get_jterm(ix))
         return result
 
     def get_constant_bounds(self) -> List["JTermBase"]:
@@ -116,8 +119,8 @@ class Loop(object):
 
     def get_pc_jump_conditions(self) -> "ItemsView[int, str]": return self.jumpconditions.items()
 
-    def _initializejumpconditions(self) -> None:
-        errormsg = ' missing from xml for loop in method ' + self.jmethod.get_qname()
-        xjump = UF.safe_find(self.xnode, 'jump-conditions', 'jump-conditions' + errormsg)
+    def _initializejumpconditions(self, xnode: "ET.Element") -> None:
+        errormsg = lambda: ' missing from xml for loop in method ' + self.jmethod.get_qname()
+        xjump = UF.safe_find_lazy(xnode, 'jump-conditions', lambda: 'jump-conditions' + errormsg())
         for j in xjump.findall('jump-cond'):
-            self.jumpconditions[UF.safe_get(j, 'pc', 'pc' + errormsg, int)] = UF.safe_get(j, 'cond', 'cond' + errormsg, str)
+            self.jumpconditions[UF.safe_get_lazy(j, 'pc', lambda: 'pc' + errormsg(), int)] = UF.safe_get_lazy(j, 'cond', lambda: 'cond' + errormsg(), str)
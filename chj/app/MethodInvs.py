@@ -40,9 +40,8 @@ class MethodInvs(object):
     def __init__(self, jmethod: "JavaMethod", xnode: "ET.Element"):
         self.jmethod = jmethod            # JavaMethod
         self.jtd = jmethod.jd.jtd         # JTermDictionary
-        self.xnode = xnode
         self.invariants: Dict[int, List["JTRelationalExpr"]] = {}   # pc -> RelationalExpr list
-        self._initialize()
+        self._initialize(xnode)
 
     def __str__(self) -> str:
         lines = []
@@ -51,10 +50,10 @@ class MethodInvs(object):
             lines.append(str(pc).rjust(5) + '  ' + invs)
         return '\n'.join(lines)
             
-    def _initialize(self) -> None:
+    def _initialize(self, xnode: "ET.Element") -> None:
         if len(self.invariants) > 0: return
-        for pnode in self.xnode.findall('pc-invs'):
-            pc = UF.safe_get(pnode, 'pc', 'pc missing from xml for method invariants in ' + self.jmethod.get_qname(), int)
+        for pnode in xnode.findall('pc-invs'):
+            pc = UF.safe_get_lazy(pnode, 'pc', lambda: 'pc missing from xml for method invariants in ' + self.jmethod.get_qname(), int)
             inv = self.jtd.read_xml_relational_expr_list(pnode).get_exprs()
             self.invariants[pc] = inv
 
@@ -26,9 +26,11 @@
 # SOFTWARE.
 # ------------------------------------------------------------------------------
 
+from bisect import bisect_right
+
 import chj.util.fileutil as UF
 
-from typing import Dict, Tuple, TYPE_CHECKING
+from typing import Dict, List, Optional, Set, Tuple, TYPE_CHECKING
 
 if TYPE_CHECKING:
     from chj.app.JavaMethod import JavaMethod
@@ -37,54 +39,54 @@ if TYPE_CHECKING:
     import xml.etree.ElementTree as ET
 
 class VartableSlot():
+    '''Variable table entry, decoded from its xml node when constructed.'''
 
     def __init__(self,
             vartable: "Vartable",
             xnode: "ET.Element"):
         self.jd = vartable.jd
-        self.xnode = xnode
         self.tpd  = self.jd.tpd           # JTypeDictionary
         self.vartable = vartable
+        self._iname = UF.get_optional(xnode, 'iname', int)
+        self._ivty = UF.get_optional(xnode, 'ivty', int)
+        self._vix = UF.get_optional(xnode, 'vix', int)
+        self._startpc = UF.get_optional(xnode, 'spc', int)
+        self._endpc = UF.get_optional(xnode, 'epc', int)
         self.name = self._name
         self.namelen = self.name.get_string_length()
 
     @property
     def _name(self) -> "StringConstant":
-        name = self.xnode.get('iname')
-        if name is not None:
-            return self.tpd.get_string(int(name))
+        if self._iname is not None:
+            return self.tpd.get_string(self._iname)
         else:
             raise UF.CHJError('iname missing for xml of vartable of method ' + self.vartable.jmethod.get_qname())
 
     @property
     def vtype(self) -> "JValueTypeBase":
-        vtype = self.xnode.get('ivty')
-        if vtype is not None:
-            return self.tpd.get_value_type(int(vtype))
+        if self._ivty is not None:
+            return self.tpd.get_value_type(self._ivty)
         else:
             raise UF.CHJError('ivty missing for xml of vartable of method ' + self.vartable.jmethod.get_qname())
 
     @property
     def vix(self) -> int:
-        vix = self.xnode.get('vix')
-        if vix is not None:
-            return int(vix)
+        if self._vix is not None:
+            return self._vix
         else:
             raise UF.CHJError('vix missing for xml of vartable of method ' + self.vartable.jmethod.get_qname())
 
     @property
     def startpc(self) -> int:
-        startpc = self.xnode.get('spc')
-        if startpc is not None:
-            return int(startpc)
+        if self._startpc is not None:
+            return self._startpc
         else:
             raise UF.CHJError('spc missing for xml of vartable of method ' + self.vartable.jmethod.get_qname())
 
     @property
     def endpc(self) -> int:
-        endpc = self.xnode.get('epc')
-        if endpc is not None:
-            return int(endpc)
+        if self._endpc is not None:
+            return self._endpc
         else:
             raise UF.CHJError('endpc missing for xml of vartable of method ' + self.vartable.jmethod.get_qname())
 
@@ -104,9 +106,13 @@ class Vartable():
             xnode: "ET.Element"):
         self.jmethod = jmethod           # JavaMethod
         self.jd = jmethod.jd             # DataDictionary
-        self.xnode = xnode
         self.table: Dict[Tuple[int, int], VartableSlot] = {}                  # (index,startpc) -> VartableSlot
-        self._initializetable()
+        self.startpcs: Dict[int, List[int]] = {}            # index -> sorted startpcs
+        self.endpcs: Dict[int, List[int]] = {}              # index -> endpcs, in the order of startpcs
+        self.slots: Dict[int, List[VartableSlot]] = {}      # index -> slots, in the order of startpcs
+        self.overlapping: Set[int] = set([])                # indices with overlapping pc ranges
+        self._initializetable(xnode)
+        self._initializeindex()
         
     def getparameters(self) -> Dict[int, VartableSlot]:
         '''a variable is a parameter if its start pc equals 0.'''
@@ -126,15 +132,46 @@ class Vartable():
         lines.append('-' * 64)
         return '\n'.join(lines)
 
+    def get_slot(self, index: int, pc: int) -> Optional[VartableSlot]:
+        '''returns the slot of variable index whose pc range contains pc'''
+        if not index in self.startpcs: return None
+        if index in self.overlapping:
+            for (ix,spc) in self.table:
+                if ix == index and pc >= spc and pc <= self.table[(ix,spc)].endpc:
+                    return self.table[(ix,spc)]
+            return None
+        i = bisect_right(self.startpcs[index], pc) - 1
+        if i >= 0 and pc <= self.endpcs[index][i]:
+            return self.slots[index][i]
+        return None
+
     def get_name(self, index: int, pc: int) -> str:
-        for (ix,spc) in self.table:
-            if ix == index and pc >= spc and pc <= self.table[(ix,spc)].endpc:
-                return self.table[(ix,spc)].name.get_string()
-        raise UF.CHJError("Could not find name for ix: " + str(ix) + " and spc: " + str(spc) + " in Vartable")
-
-    def _initializetable(self) -> None:
-        for s in self.xnode.findall('slot'):
-            vix = UF.safe_get(s, 'vix', 'vix missing from xml for slot of method ' + self.jmethod.get_qname(), int)
-            spc = UF.safe_get(s, 'spc', 'spc missing from xml for slot of method ' + self.jmethod.get_qname(), int)
+        slot = self.get_slot(index, pc)
+        if slot is None:
+            raise UF.CHJError("Could not find name for ix: " + str(index) + " and pc: " + str(pc) + " in Vartable")
+        return slot.name.get_string()
+
+    def get_type(self, index: int, pc: int) -> "JValueTypeBase":
+        slot = self.get_slot(index, pc)
+        if slot is None:
+            raise UF.CHJError("Could not find type for ix: " + str(index) + " and pc: " + str(pc) + " in Vartable")
+        return slot.vtype
+
+    def _initializetable(self, xnode: "ET.Element") -> None:
+        for s in xnode.findall('slot'):
+            vix = UF.safe_get_lazy(s, 'vix', lambda: 'vix missing from xml for slot of method ' + self.jmethod.get_qname(), int)
+            spc = UF.safe_get_lazy(s, 'spc', lambda: 'spc missing from xml for slot of method ' + self.jmethod.get_qname(), int)
             index = (vix, spc)
             self.table[index] = VartableSlot(self,s)
+
+    def _initializeindex(self) -> None:
+        ranges: Dict[int, List[Tuple[int, int, VartableSlot]]] = {}
+        for ((ix,spc),slot) in self.table.items():
+            ranges.setdefault(ix, []).append((spc, slot.endpc, slot))
+        for (ix, r) in ranges.items():
+            r.sort(key=lambda x: x[0])
+            self.startpcs[ix] = [ x[0] for x in r ]
+            self.endpcs[ix] = [ x[1] for x in r ]
+            self.slots[ix] = [ x[2] for x in r ]
+            if any(r[i][1] >= r[i+1][0] for i in range(len(r) - 1)):
+                self.overlapping.add(ix)
@@ -66,6 +66,7 @@ def branches(args: argparse.Namespace) -> NoReturn:
     appname: str = args.appname
     includes: Optional[str] = args.includes
     save: bool = args.save
+    jobs: int = args.jobs
 
     path = UCC.check_app_analysisdir(appname)
 
@@ -76,9 +77,9 @@ def branches(args: argparse.Namespace) -> NoReturn:
     headername = appname
     lines.append(UP.reportheader('Branch Conditions', headername))
     if includes:
-        lines.append(BranchConditions(app).toincludestring(includes))
+        lines.append(BranchConditions(app, jobs).toincludestring(includes))
     else:
-        lines.append(BranchConditions(app).tostring())
+        lines.append(BranchConditions(app, jobs).tostring())
 
     if save:
         UCC.save(path, 'branch_conditions_report.txt', lines)
@@ -208,10 +209,11 @@ def loaded_strings(args: argparse.Namespace) -> NoReturn:
     appname: str = args.appname
     substring: Optional[str] = args.substring
     save: bool = args.save
+    jobs: int = args.jobs
 
     path = UCC.check_app_analysisdir(appname)
     app = AppAccess(path)
-    results = app.get_loaded_strings(substring=substring)
+    results = app.get_loaded_strings(substring=substring, jobs=jobs)
 
     lines = []
     headername = appname
@@ -256,7 +258,7 @@ def loops(args: argparse.Namespace) -> NoReturn:
     lines.append(UP.reportheader('Loop Summary', headername))
     loopsummary = LoopSummary(app,sources=list(taintnodes))
     if len(taintlist) > 0:
-        if app.jd.ttd is not None:
+        if app.jd.has_taint_results():
             for tn in taintlist:
                 lines.append(str(tn).rjust(4) + '  '
                                  + str(app.jd.ttd.get_taint_origin(tn)))
@@ -417,6 +419,7 @@ def reflective_calls(args: argparse.Namespace) -> NoReturn:
 def static_field_inits(args: argparse.Namespace) -> NoReturn:
     appname: str = args.appname
     save: Optional[str] = args.save
+    jobs: int = args.jobs
 
     path = UCC.check_app_analysisdir(appname)
     app = AppAccess(path)
@@ -424,7 +427,7 @@ def static_field_inits(args: argparse.Namespace) -> NoReturn:
     lines = []
     headername = appname
     lines.append(UP.reportheader('Static Field Accesses', headername))
-    lines.append(RPS.StaticFields(app).to_string())
+    lines.append(RPS.StaticFields(app, jobs).to_string())
 
     if save:
         UCC.save(path, 'static_fields_report.txt', lines)
@@ -456,6 +459,7 @@ def taint_trail(args: argparse.Namespace) -> NoReturn:
     taintsourceid: int = args.taintsourceid
     sink: Optional[str] = args.sink
     loops: bool = args.loops
+    witnesses: int = args.witnesses
 
     try:
         (path,_) = UF.get_engagement_app_jars(appname)
@@ -466,7 +470,7 @@ def taint_trail(args: argparse.Namespace) -> NoReturn:
         exit(1)
 
     app = AppAccess(path)
-    if app.jd.ttd is None:
+    if not app.jd.has_taint_results():
         raise UF.CHJError('Taint analysis results missing from xml! Please create them first')
 
     xnodes = UF.safe_find(xtrail, 'node-dictionary', 'node-dictionary missing from xml')
@@ -477,9 +481,7 @@ def taint_trail(args: argparse.Namespace) -> NoReturn:
 
     # return the root of the taint graph
     def get_root_node(nodes: List[int], enode: "ET.Element") -> int:
-        tgts = []
-        for n in enode.findall('edge'):
-            tgts.append(UF.safe_get(n, 'src', 'src missing from xml', int))
+        tgts = set([ UF.safe_get(n, 'src', 'src missing from xml', int) for n in enode.findall('edge') ])
         for j in nodes:
             if not j in tgts:
                 return j
@@ -508,13 +510,15 @@ def taint_trail(args: argparse.Namespace) -> NoReturn:
                         if str(cms.get_variable()) == 'lc':
                             sinkids.append(n)
 
-            edge_adjacencylists: Dict[int, List[int]] = {}
+            # taint flows from the tgts of an edge to its src
+            successors: Dict[int, List[int]] = {}
+            predecessors: Dict[int, List[int]] = {}
             for m in xedges.findall('edge'):
                 src = UF.safe_get(m, 'src', 'src missing from xml', int)
                 tgts = [ int(x) for x in UF.safe_get(m, 'tgts', 'tgts missing from xml', str).split(',') ]
                 for t in tgts:
-                    edge_adjacencylists.setdefault(t,[])
-                    edge_adjacencylists[t].append(src)
+                    successors.setdefault(t,[]).append(src)
+                    predecessors.setdefault(src,[]).append(t)
 
             srcid = get_root_node(nodes,xedges)
 
@@ -524,14 +528,18 @@ def taint_trail(args: argparse.Namespace) -> NoReturn:
                 sinkname = str(app.jd.ttd.get_taint_node_type(sinkid))
                 print(' - ' + sinkname)
 
-
-            for sinkid in sinkids:
-                if sinkid in pathnodes: continue
-                g = UG.DirectedGraph(nodes,edge_adjacencylists)
-                print('Find path to ' + str(app.jd.ttd.get_taint_node_type(sinkid)))
-                g.find_paths(srcid,sinkid)
-                for p in g.paths:
-                    pathnodes = pathnodes.union(p)
+            pathnodes = UG.get_path_nodes(
+                srcid, sinkids, lambda n: successors.get(n, []), lambda n: predecessors.get(n, []))
+
+            if witnesses > 0:
+                witnesspaths: Dict[int, List[List[int]]] = {}
+                slicesuccessors = lambda n: [ m for m in successors.get(n, []) if m in pathnodes ]
+                for sinkid in sinkids:
+                    if sinkid in pathnodes and not sinkid in witnesspaths:
+                        witnesspaths[sinkid] = UG.get_shortest_paths(srcid, sinkid, slicesuccessors, witnesses)
+                        print('Shortest paths to ' + str(app.jd.ttd.get_taint_node_type(sinkid)) + ': '
+                              + ', '.join([ str(len(p) - 1) for p in witnesspaths[sinkid] ]))
+                pathnodes = set([ n for paths in witnesspaths.values() for p in paths for n in p ])
 
     # if no restrictions include all nodes
     if len(pathnodes) == 0:
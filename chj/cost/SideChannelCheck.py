@@ -26,17 +26,14 @@
 # SOFTWARE.
 # ------------------------------------------------------------------------------
 
-from chj.cost.CostMeasure import CostMeasure
-
 import chj.util.fileutil as UF
 
-from typing import Dict, List, Tuple, TYPE_CHECKING
+from typing import cast, Dict, List, Optional, Tuple, TYPE_CHECKING
 
 if TYPE_CHECKING:
     from chj.app.JavaMethod import JavaMethod
     from chj.cost.MethodCost import MethodCost
     import xml.etree.ElementTree as ET
-    from collections.abc import ValuesView
 
 class SideChannelCheck:
 
@@ -44,7 +41,7 @@ class SideChannelCheck:
         self.jmc = mc                                       # MethodCost
         self.costmodel = self.jmc.costmodel
         self.xnode = xnode
-        self.paths: Dict[int, CostMeasure] = {}             # pred-pc -> CostMeasure
+        self.bounds: Optional[Dict[int, Tuple[int, Optional[int], int, int]]] = None   # component -> path bounds
 
     @property
     def decisionpc(self) -> int:
@@ -64,31 +61,67 @@ class SideChannelCheck:
 
     def get_method(self) -> "JavaMethod": return self.jmc.get_method()
 
-    def get_paths(self) -> "ValuesView[CostMeasure]":
-        return self.paths.values()
+    def get_block_cost_bounds(self, pc: int) -> Tuple[int, Optional[int]]:
+        '''returns the constant lower and upper bound of the cost of block pc
+        (upper bound None if not constant)'''
+        try:
+            cost = self.jmc.get_block_cost(pc)
+        except UF.CHJError:
+            return (0, None)
+        if cost.upperbounds.is_constant():
+            return (cost.get_lowerbound(), cost.get_upperbound())
+        return (cost.get_lowerbound(), None)
+
+    def get_path_cost_bounds(self) -> Dict[int, Tuple[int, Optional[int], int, int]]:
+        if self.bounds is None:
+            cfg = self.get_method().get_cfg()
+            self.bounds = cfg.get_path_cost_bounds(self.observationpc, self.get_block_cost_bounds)
+        return self.bounds
+
+    def get_branch_cost_bounds(self) -> List[Tuple[int, int, Optional[int]]]:
+        '''returns (successor pc, lower bound, upper bound) of the cost of the
+        paths from decision-pc to observation-pc through each successor of
+        decision-pc, over the loop-collapsed cfg'''
+        cfg = self.get_method().get_cfg()
+        bounds = self.get_path_cost_bounds()
+        start = cfg.get_component(self.decisionpc)
+        if not start in bounds: return []
+        (startlb, startub) = (0, cast(Optional[int], 0))
+        for pc in cfg.get_loop_components()[start]:
+            (lb, ub) = self.get_block_cost_bounds(pc)
+            startlb += lb
+            startub = None if (startub is None or ub is None) else startub + ub
+        result: List[Tuple[int, int, Optional[int]]] = []
+        for s in dict.fromkeys(cfg.get_successors(self.decisionpc)):
+            c = cfg.get_component(s)
+            if c == start:
+                result.append((s, bounds[c][0], bounds[c][1]))
+            elif c in bounds:
+                (lb, ub) = (bounds[c][0], bounds[c][1])
+                result.append((s, startlb + lb, None if (startub is None or ub is None) else startub + ub))
+        return result
+
+    def get_max_cost_difference(self) -> Optional[int]:
+        '''returns the largest difference between the upper bound of one branch
+        at decision-pc and the lower bound of another (None if unbounded)'''
+        branches = self.get_branch_cost_bounds()
+        result = 0
+        for (s1, _, ub) in branches:
+            for (s2, lb, _) in branches:
+                if s1 == s2: continue
+                if ub is None: return None
+                result = max(result, ub - lb)
+        return result
 
-    def get_full_paths(self) -> List[List[int]]:
+    def get_branch_witness_path(self, pc: int, longest: bool = True) -> List[int]:
+        '''returns the blocks of a most expensive (cheapest if not longest) path
+        from decision-pc through successor pc to observation-pc'''
         cfg = self.get_method().get_cfg()
-        return cfg.enumerate_paths(self.decisionpc, self.observationpc)
-
-    def get_full_paths_through_pc(self, pc: int) -> List[List[int]]:
-        fullpaths = self.get_full_paths()
-        return [ x for x in fullpaths if x[-2] == pc ]
-
-    def get_longest_full_paths_through_pc(self, pc: int) -> List[List[int]]:
-        fullpaths = self.get_full_paths_through_pc(pc)
-        sets = set([])
-        for p in fullpaths:
-            sets.add(frozenset(p))
-        maximalsets = set([])
-        for s in sets:
-            if any(x for x in sets if s != x and s.issubset(x)): continue
-            maximalsets.add(s)
-        maximalpaths = []
-        for p in fullpaths:
-            if set(p) in maximalsets:
-                maximalpaths.append(p)
-        return maximalpaths
+        bounds = self.get_path_cost_bounds()
+        start = cfg.get_component(self.decisionpc)
+        if cfg.get_component(pc) == start:
+            return cfg.get_witness_path(bounds, self.decisionpc, longest)
+        return cfg.get_loop_components()[start] + cfg.get_witness_path(bounds, pc, longest)
 
     def get_conditions_in_path(self, p: List[int]) -> List[Tuple[str, str]]:
         result = []
@@ -109,7 +142,6 @@ class SideChannelCheck:
 
     def __str__(self) -> str:
         lines = []
-        cfg = self.get_method().get_cfg()
         lines.append('decision-pc   : ' + str(self.decisionpc))
         lines.append('observation-pc: ' + str(self.observationpc))
         decisionblock = self.jmc.get_method().get_cfg().get_block(self.decisionpc)
@@ -124,30 +156,13 @@ class SideChannelCheck:
             lines.append('No conditions found decision-pc')
         lines.append(' ')
 
-        fullpaths = cfg.enumerate_paths(self.decisionpc,self.observationpc)
-                             
-        lines.append('  path through pc=        cost')
-        lines.append('-' * 80)
-        for n in sorted(fullpaths):
-            lbblockcosts = [ self.jmc.get_block_cost(pc).cost.get_lower_bounds().get_jterms()[0] for pc in n ]
-            ubblockcosts = [ self.jmc.get_block_cost(pc).cost.get_upper_bounds().get_jterms()[0] for pc in n ]
-            lbcost = lbblockcosts[0]
-            ubcost = ubblockcosts[0]
-            for c in lbblockcosts:
-                lbcost = lbcost.add(c).simplify()
-            for c in ubblockcosts:
-                ubcost = ubcost.add(c).simplify()
-            lines.append('  ' + str(n).rjust(45) + ': [' + str(lbcost).rjust(20) + ' ; ' + str(ubcost).rjust(20) + ']')
+        def bound(ub: Optional[int]) -> str: return 'inf' if ub is None else str(ub)
 
-        lines.append(' ')
-        for p in sorted(self.paths):
-            lines.append('Paths through ' + str(p))
-            pathsthroughp = self.get_longest_full_paths_through_pc(p)
-            for pp in pathsthroughp:
-                lines.append('  ' + str(pp))
-                conds = self.get_conditions_in_path(pp[1:])
-                for (pc,d) in conds:
-                    lines.append('    ' + str(pc) + ': ' + str(d))
-                    
+        lines.append('  branch to pc=        cost')
+        lines.append('-' * 80)
+        for (succpc, lb, ub) in self.get_branch_cost_bounds():
+            lines.append('  ' + str(succpc).rjust(12) + ': [' + str(lb).rjust(20) + ' ; ' + bound(ub).rjust(20) + ']')
+            lines.append('    longest path: ' + str(self.get_branch_witness_path(succpc)))
+        lines.append('max cost difference: ' + bound(self.get_max_cost_difference()))
         return '\n'.join(lines)
 
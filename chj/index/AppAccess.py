@@ -26,15 +26,21 @@
 # SOFTWARE.
 # ------------------------------------------------------------------------------
 
+import multiprocessing
+import os
+
+from concurrent.futures import ProcessPoolExecutor
+
 import chj.util.fileutil as UF
 
 from chj.app.JavaClass import JavaClass
 from chj.cost.CostModel import CostModel
 from chj.index.Callgraph import Callgraph
+from chj.index.CallgraphReachability import CallgraphReachability
 from chj.index.DataDictionary import DataDictionary
 from chj.libsum.JDKModels import JDKModels
 from chj.userdata.UserDataClass import UserDataClass
-from typing import cast, Callable, Dict, List, Optional, Tuple, TYPE_CHECKING
+from typing import Any, cast, Callable, Dict, List, Optional, Tuple, TypeVar, TYPE_CHECKING
 
 if TYPE_CHECKING:
     from chj.app.Instruction import Instruction
@@ -42,18 +48,66 @@ if TYPE_CHECKING:
     from chj.index.Classname import Classname
     from chj.index.FieldSignature import FieldSignature
 
+T = TypeVar('T')
+
+# (app, f) handed to forked class workers by AppAccess.map_classes; set in
+# the parent before the pool is created and inherited by the children
+_class_worker_state: Optional[Tuple["AppAccess", Callable[[JavaClass], Any]]] = None
+
+def _map_classes_worker(cnixs: List[int]) -> List[Tuple[int, Any]]:
+    (app, f) = cast(Tuple["AppAccess", Callable[[JavaClass], Any]], _class_worker_state)
+    results = []
+    for cnix in cnixs:
+        jclass = app._load_class(cnix)
+        if not jclass is None:
+            results.append((cnix, f(jclass)))
+    return results
+
+def _field_access_payload(
+        accesses: List[Tuple[int, List[Tuple[int, "Classname", "FieldSignature"]]]]
+        ) -> List[Tuple[int, List[Tuple[int, int, int]]]]:
+    return [ (cmsix, [ (pc, cn.index, fs.index) for (pc, cn, fs) in maccesses ])
+                 for (cmsix, maccesses) in accesses ]
+
 class AppAccess(object):
 
-    def __init__(self, path:str) -> None:
+    def __init__(self, path:str, parallel: bool = False) -> None:
+        '''parallel: decode the data dictionary files in parallel worker
+        processes (also enabled by setting CHJ_PARALLEL_LOAD=1)'''
         self.path = path
+        self.parallel = parallel or os.environ.get('CHJ_PARALLEL_LOAD') == '1'
         self.jdkmodels = JDKModels(self)
         self.jd = DataDictionary(self)
         self.callgraph: Optional[Callgraph] = None              # Callgraph
+        self.reachability: Optional[CallgraphReachability] = None   # CallgraphReachability
         self.classes: Dict[int, JavaClass] = {}                 # cnix -> JavaClass (application classes)
         self.userdataclasses: Dict[int, UserDataClass] = {}     # cnix -> UserDataClass
         self.costmodel: Optional[CostModel] = None              # CostModel
         self.classesloaded = False
 
+    def map_classes(self, f: Callable[[JavaClass], T], jobs: int = 1) -> List[Tuple[int, T]]:
+        '''returns (cnix, f(class)) for all application classes that can be loaded.
+
+        With jobs > 1 the classes are loaded and f is applied in forked worker
+        processes; f must then return plain (picklable) data, such as indices
+        and strings, which is all that is sent back. Classes loaded by the
+        workers are not retained in this AppAccess.
+        '''
+        global _class_worker_state
+        if jobs <= 1 or not 'fork' in multiprocessing.get_all_start_methods():
+            self._get_classes()
+            return [ (cnix, f(self.classes[cnix])) for cnix in self.classes ]
+        cnixs = list(self.jd.appclassindices.values())
+        chunksize = max(1, -(-len(cnixs) // (jobs * 4)))
+        chunks = [ cnixs[i:i+chunksize] for i in range(0, len(cnixs), chunksize) ]
+        _class_worker_state = (self, f)
+        try:
+            with ProcessPoolExecutor(max_workers=jobs,
+                                     mp_context=multiprocessing.get_context('fork')) as pool:
+                return [ r for chunk in pool.map(_map_classes_worker, chunks) for r in chunk ]
+        finally:
+            _class_worker_state = None
+
     def iter_classes(self, f:Callable[[JavaClass], None]) -> None:
         self._get_classes()
         for cnix in self.classes: f(self.classes[cnix])
@@ -113,15 +167,46 @@ class AppAccess(object):
         self._get_callgraph()
         return cast(Callgraph, self.callgraph)
 
+    def get_reachability(self) -> CallgraphReachability:
+        '''returns the transitive reachability between methods over the callgraph'''
+        if self.reachability is None:
+            self.reachability = CallgraphReachability(self.get_callgraph())
+        return self.reachability
+
+    def has_costmodel(self) -> bool:
+        '''returns true if cost analysis results exist for all application classes'''
+        if not self.costmodel is None: return True
+        if not os.path.isdir(os.path.join(UF.get_analysisdir(self.path), 'chcost')):
+            return False
+        for cnix in self.jd.appclassindices.values():
+            c = self.jd.get_cn(cnix)
+            if not os.path.isfile(UF.get_costclass_filename(
+                    self.path, c.get_package_name(), c.get_simple_name())):
+                return False
+        return True
+
     def get_costmodel(self) -> CostModel:
         '''returns a CostModel object'''
         self._get_costmodel()
         return cast(CostModel, self.costmodel)
 
-    def get_loaded_strings(self, substring: str=None) -> List[Tuple[int, List[Tuple[int, str]]]]:
+    def get_loaded_strings(self, substring: str=None, jobs: int = 1) -> List[Tuple[int, List[Tuple[int, str]]]]:
         results = []
-        def f(c: JavaClass) -> None: results.extend(c.get_loaded_strings(substring=substring))
-        self.iter_classes(f)
+        def f(c: JavaClass) -> List[Tuple[int, List[Tuple[int, str]]]]:
+            return c.get_loaded_strings(substring=substring)
+        for (_, cresults) in self.map_classes(f, jobs): results.extend(cresults)
+        return results
+
+    def get_branch_conditions(self, jobs: int = 1) -> List[Tuple[int, str, str]]:
+        '''returns (cmsix, method name, condition) for all branch conditions'''
+        results = []
+        def f(c: JavaClass) -> List[Tuple[int, str, str]]:
+            cresults = []
+            for (cmsix, m) in c.methods.items():
+                for cond in m.get_conditions():
+                    cresults.append((cmsix, m.get_aqname(), cond[0]))
+            return cresults
+        for (_, cresults) in self.map_classes(f, jobs): results.extend(cresults)
         return results
 
     def get_loaded_string_instructions(self) -> Dict[int, Dict[int, List["Instruction"]]]:
@@ -132,21 +217,31 @@ class AppAccess(object):
         self.iter_classes(f)
         return results
 
-    def get_static_initializers(self) -> List[Tuple[int, List[Tuple[int, "Classname", "FieldSignature"]]]]:
-        results = []
-        def f(c: JavaClass) -> None:
-            initializers = c.get_static_initializers()
-            if len(initializers) > 0: results.extend(initializers)
-        self.iter_classes(f)
-        return results
-
-    def get_static_field_readers(self) -> List[Tuple[int, List[Tuple[int, "Classname", "FieldSignature"]]]]:
-        results = []
-        def f(c: JavaClass) -> None:
-            readers = c.get_static_field_readers()
-            if len(readers) > 0: results.extend(readers)
-        self.iter_classes(f)
-        return results
+    def get_static_initializers(self, jobs: int = 1) -> List[Tuple[int, List[Tuple[int, "Classname", "FieldSignature"]]]]:
+        def f(c: JavaClass) -> List[Tuple[int, List[Tuple[int, int, int]]]]:
+            return _field_access_payload(c.get_static_initializers())
+        return self._get_field_accesses(f, jobs)
+
+    def get_static_field_readers(self, jobs: int = 1) -> List[Tuple[int, List[Tuple[int, "Classname", "FieldSignature"]]]]:
+        def f(c: JavaClass) -> List[Tuple[int, List[Tuple[int, int, int]]]]:
+            return _field_access_payload(c.get_static_field_readers())
+        return self._get_field_accesses(f, jobs)
+
+    def get_static_field_accesses(self, jobs: int = 1) -> Tuple[
+            List[Tuple[int, List[Tuple[int, "Classname", "FieldSignature"]]]],
+            List[Tuple[int, List[Tuple[int, "Classname", "FieldSignature"]]]]]:
+        '''returns (get_static_initializers(), get_static_field_readers()),
+        loading each class once'''
+        def f(c: JavaClass) -> Tuple[List[Tuple[int, List[Tuple[int, int, int]]]],
+                                     List[Tuple[int, List[Tuple[int, int, int]]]]]:
+            return (_field_access_payload(c.get_static_initializers()),
+                    _field_access_payload(c.get_static_field_readers()))
+        initializers = []
+        readers = []
+        for (_, (cinitializers, creaders)) in self.map_classes(f, jobs):
+            initializers.extend(self._decode_field_accesses(cinitializers))
+            readers.extend(self._decode_field_accesses(creaders))
+        return (initializers, readers)
 
     def get_object_field_writers(self) -> List[Tuple[int, List[Tuple[int, "Classname", "FieldSignature"]]]]:
         results = []
@@ -172,6 +267,29 @@ class AppAccess(object):
         self.iter_classes(f)
         return results
 
+    def _get_field_accesses(self,
+            f: Callable[[JavaClass], List[Tuple[int, List[Tuple[int, int, int]]]]],
+            jobs: int) -> List[Tuple[int, List[Tuple[int, "Classname", "FieldSignature"]]]]:
+        results = []
+        for (_, cresults) in self.map_classes(f, jobs):
+            results.extend(self._decode_field_accesses(cresults))
+        return results
+
+    def _decode_field_accesses(self,
+            accesses: List[Tuple[int, List[Tuple[int, int, int]]]]
+            ) -> List[Tuple[int, List[Tuple[int, "Classname", "FieldSignature"]]]]:
+        return [ (cmsix, [ (pc, self.jd.get_cn(cnix), self.jd.get_fs(fsix))
+                               for (pc, cnix, fsix) in maccesses ])
+                     for (cmsix, maccesses) in accesses ]
+
+    def _load_class(self, cnix: int) -> Optional[JavaClass]:
+        cn = self.jd.get_cn(cnix)
+        xnode = UF.get_app_class_xnode(self.path,cn.get_package_name(),cn.get_simple_name())
+        if xnode is None:
+            print('Unable to load ' + cn.get_name())
+            return None
+        return JavaClass(self,xnode)
+
     def _get_class(self, cnix: int) -> None:
         if cnix in self.classes: return
         cn = self.jd.get_cn(cnix)
@@ -187,13 +305,10 @@ class AppAccess(object):
         if self.classesloaded: return
         for (cname,cnix) in self.jd.appclassindices.items():
             if cnix in self.classes: continue
-            cn = self.jd.get_cn(cnix)
-            xnode = UF.get_app_class_xnode(self.path,cn.get_package_name(),cn.get_simple_name())
-            if xnode is None:
-                print('Unable to load ' + cn.get_name())
-                continue
-            self.classes[cnix] = JavaClass(self,xnode)
-            self.classesloaded = True
+            jclass = self._load_class(cnix)
+            if not jclass is None:
+                self.classes[cnix] = jclass
+        self.classesloaded = True
 
     def _get_userdata_classes(self) -> None:
         for (cname,cnix) in self.jd.appclassindices.items():
@@ -209,11 +324,9 @@ class AppAccess(object):
 
     def _get_callgraph(self) -> None:
         if self.callgraph is None:
-            xcg = UF.get_datacallgraph_xnode(self.path)
-            if not xcg is None:
-                self.callgraph = Callgraph(self,xcg)
-            else:
+            if not os.path.isfile(UF.get_datacallgraph_filename(self.path)):
                 raise UF.CHJError('Call graph not found in xml')
+            self.callgraph = Callgraph(self)
                 
 
 
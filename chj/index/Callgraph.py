@@ -28,9 +28,11 @@
 
 from chj.util.DotGraph import DotGraph
 
+from chj.index.CallgraphIndex import CallgraphIndex
+
 import chj.util.fileutil as UF
 
-from typing import Any, Dict, List, Tuple, TYPE_CHECKING
+from typing import Any, Dict, List, Optional, Set, Tuple, TYPE_CHECKING
 
 if TYPE_CHECKING:
     from chj.index.AppAccess import AppAccess
@@ -39,16 +41,28 @@ if TYPE_CHECKING:
 
 class Callgraph():
 
-    def __init__(self, app: "AppAccess", xnode: "ET.Element"):
+    def __init__(self, app: "AppAccess", xnode: Optional["ET.Element"] = None):
+        """The call edges are taken from the DataDictionary; the callgraph
+        xml (xnode) is only consulted for the callback edges, and read on
+        demand if not given."""
         self.app = app                   # AppAccess
         self.jd = self.app.jd            # DataDictionary
         self.cgd = self.jd.cgd           # CallgraphDictionary
-        self.xnode = xnode
+        self._xnode = xnode
         self.edges: Dict[int, Dict[int, "CallgraphTargetBase"]] = {}             # cms-ix -> pc -> CallgraphTargetBase
         self.callbackedges: List[int] = []     # cms-ix list
+        self._index: Optional[CallgraphIndex] = None
         self._get_edges()
 
-    def as_dot(self, cmsix:int) -> Tuple[Dict[str, str], DotGraph]:
+    @property
+    def index(self) -> CallgraphIndex:
+        if self._index is None:
+            self._index = CallgraphIndex(self.jd)
+        return self._index
+
+    def as_dot(self, cmsix:int, maxdepth: Optional[int] = None) -> Tuple[Dict[str, str], DotGraph]:
+        '''call graph of the application methods reachable from cmsix, up to
+        maxdepth calls deep if given'''
         def register_node(dotgraph: DotGraph,
                         cmsix: int, nodes:
                         Dict[str, str]) -> None:
@@ -60,55 +74,63 @@ class Callgraph():
         dotgraph = DotGraph("cg_" + str(cmsix))
         register_node(dotgraph, cmsix, nodes)
 
-        rem_nodes = [ cmsix ]
-        done_nodes = []
+        rem_nodes = [ (cmsix, 0) ]
+        done_nodes: Set[int] = set([])
 
         while len(rem_nodes) > 0:
-            cmsix = rem_nodes.pop()
-            done_nodes.append(cmsix)
+            (cmsix, depth) = rem_nodes.pop()
+            if cmsix in done_nodes: continue
+            done_nodes.add(cmsix)
             methodname = self.app.get_method(cmsix).get_aqname()
 
-            tgts = self._get_method_edges(cmsix)
-
-            for pc in tgts:
-                (msix, tgt) = tgts[pc]
-                for cnix in tgt.cnixs:
-                    tgtcmsix = self.jd.get_cmsix(cnix, msix)
-                    if self.jd.is_application_class(cnix):
-                        tgtname = self.app.get_method(tgtcmsix).get_aqname()
-                        dotgraph.add_edge(methodname, tgtname)
-                        register_node(dotgraph, tgtcmsix, nodes)
-                        if tgtcmsix not in done_nodes: rem_nodes.append(tgtcmsix)
+            for (pc, cnix, msix, tgtcmsix) in self.index.get_call_edges(cmsix):
+                if tgtcmsix >= 0 and self.jd.is_application_class(cnix):
+                    tgtname = self.app.get_method(tgtcmsix).get_aqname()
+                    dotgraph.add_edge(methodname, tgtname)
+                    register_node(dotgraph, tgtcmsix, nodes)
+                    if tgtcmsix not in done_nodes and (maxdepth is None or depth + 1 < maxdepth):
+                        rem_nodes.append((tgtcmsix, depth + 1))
+                else:
+                    if msix in self.jd.mssignatures:
+                        tgtname = self.jd.get_cn(cnix).get_name() + '.' + self.jd.mssignatures[msix][0]
                     else:
-                        if msix in self.jd.mssignatures:
-                            tgtname = self.jd.get_cn(cnix).get_name() + '.' + self.jd.mssignatures[msix][0]
-                        else:
-                            tgtname = self.jd.get_cn(cnix).get_name()
-                        dotgraph.add_edge(methodname, tgtname)
+                        tgtname = self.jd.get_cn(cnix).get_name()
+                    dotgraph.add_edge(methodname, tgtname)
         return (nodes, dotgraph)
 
-    def as_rev_dot(self, cmsix: int) -> DotGraph:
+    def as_rev_dot(self, cmsix: int, maxdepth: Optional[int] = None) -> DotGraph:
+        '''reverse call graph of the methods that reach cmsix, up to maxdepth
+        calls deep if given'''
         dotgraph = DotGraph("revcg_" + str(cmsix))
         dotgraph.add_node(self.app.get_method(cmsix).get_aqname())
 
-        rem_nodes = [ cmsix ]
-        done_nodes = []
+        rem_nodes = [ (cmsix, 0) ]
+        done_nodes: Set[int] = set([])
 
         while len(rem_nodes) > 0:
-            cmsix = rem_nodes.pop()
-            done_nodes.append(cmsix)
+            (cmsix, depth) = rem_nodes.pop()
+            if cmsix in done_nodes: continue
+            done_nodes.add(cmsix)
             methodname = self.app.get_method(cmsix).get_aqname()
 
-            tgts = self._get_rev_method_edges(cmsix)
-
-            for pc in tgts:
-                srccmsix = tgts[pc]
+            for srccmsix in self.index.get_callers(cmsix):
                 srcname = self.app.get_method(srccmsix).get_aqname()
                 dotgraph.add_edge(srcname, methodname)
-                if srccmsix not in done_nodes: rem_nodes.append(srccmsix)
+                if srccmsix not in done_nodes and (maxdepth is None or depth + 1 < maxdepth):
+                    rem_nodes.append((srccmsix, depth + 1))
 
         return dotgraph
 
+    @property
+    def xnode(self) -> "ET.Element":
+        if self._xnode is None:
+            self._xnode = UF.get_datacallgraph_xnode(self.app.path)
+        return self._xnode
+
+    def get_callback_methods(self) -> List[int]:
+        self._getcallbackedges()
+        return self.callbackedges
+
     def is_callback(self, cmsix: int) -> bool:
         self._getcallbackedges()
         return cmsix in self.callbackedges
@@ -125,42 +147,10 @@ class Callgraph():
         raise UF.CHJError("Callgraph Target missing from cmsix : " + str(cmsix) + ", pc: " + str(pc))
 
     def _get_edges(self) -> None:
-        errormsg = 'missing from xml for callgraph'
-
         if len(self.edges) > 0: return
-        for e in UF.safe_find(self.xnode, 'edges', 'edges ' + errormsg).findall('edge'):
-            srccmsix = UF.safe_get(e, 'ix', 'ix ' + errormsg , int)
-            pc = UF.safe_get(e, 'pc', 'pc ' + errormsg , int)
+        for ((srccmsix, pc), (_, tgt)) in self.jd.callgraphedges.items():
             if not srccmsix in self.edges: self.edges[srccmsix] = {}
-            self.edges[srccmsix][pc] = self.cgd.get_target(UF.safe_get(e, 'itgt', 'itgt ' + errormsg, int))
-
-    def _get_method_edges(self, cmsix: int) -> Dict[int, Tuple[int, "CallgraphTargetBase"]]:
-        edges: Dict[int, Tuple[int, "CallgraphTargetBase"]] = {}
-        errormsg = ' missing from xml for method with cmsix ' + str(cmsix)
-
-        for e in UF.safe_find(self.xnode, 'edges', 'edges ' + errormsg).findall('edge'):
-            if UF.safe_get(e, 'ix', 'ix ' + errormsg, int) == cmsix:
-                pc = UF.safe_get(e, 'pc', 'pc ' + errormsg, int)
-                tgt = self.cgd.get_target(UF.safe_get(e, 'itgt', 'itgt ' + errormsg, int))
-                if tgt.is_non_virtual_target() or tgt.is_virtual_target():
-                    msix = UF.safe_get(e, 'ms-ix', 'ms-ix ' + errormsg, int)
-                    edges[pc] = (msix, tgt)
-        return edges
-
-    def _get_rev_method_edges(self, cmsix: int) -> Dict[int, int]:
-        errormsg = ' missing from xml for method with cmsix ' + str(cmsix)
-
-        edges = {}
-        for e in UF.safe_find(self.xnode, 'edges', 'edges ' + errormsg).findall('edge'):
-            msix = UF.safe_get(e, 'ms-ix', 'ms-ix ' + errormsg, int)
-            tgt = self.cgd.get_target(UF.safe_get(e, 'itgt', 'itgt ' + errormsg, int))
-            for cnix in tgt.cnixs:
-                tgtcmsix = self.jd.get_cmsix(cnix, msix)
-                if tgtcmsix == cmsix:
-                    srcix = UF.safe_get(e, 'ix', 'ix ' + errormsg, int)
-                    pc = UF.safe_get(e, 'pc', 'pc ' + errormsg, int)
-                    edges[pc] = srcix
-        return edges
+            self.edges[srccmsix][pc] = tgt
 
     def _getcallbackedges(self) -> None:
         if len(self.callbackedges) > 0: return
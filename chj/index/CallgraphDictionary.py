@@ -31,7 +31,7 @@ import chj.util.fileutil as UF
 
 import chj.index.CallgraphDictionaryRecord as CGD
 
-from typing import Any, Callable, Dict, List, Tuple, Union, TYPE_CHECKING
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union, TYPE_CHECKING
 
 if TYPE_CHECKING:
     from chj.index.MethodSignature import MethodSignature
@@ -40,13 +40,14 @@ if TYPE_CHECKING:
 
 class CallgraphTargetBase(CGD.CallgraphDictionaryRecord):
 
+    __slots__ = ("cnixs",)
+
     def __init__(self,
             cgd: "CallgraphDictionary",
             index: int,
             tags: List[str],
             args: List[int]):
         CGD.CallgraphDictionaryRecord.__init__(self,cgd,index,tags,args)
-        self.cgd = cgd
         self.cnixs: List[int] = []
 
     def has_application_targets(self) -> bool: return False
@@ -67,6 +68,8 @@ class CallgraphTargetBase(CGD.CallgraphDictionaryRecord):
 @CGD.callgraph_dictionary_record_tag("nv")
 class NonVirtualTarget(CallgraphTargetBase):
 
+    __slots__ = ("classname", "cnix", "targettype")
+
     def __init__(self,
             cgd: "CallgraphDictionary",
             index: int,
@@ -95,6 +98,8 @@ class NonVirtualTarget(CallgraphTargetBase):
 @CGD.callgraph_dictionary_record_tag("cv")
 class ConstrainedVirtualTargets(CallgraphTargetBase):
 
+    __slots__ = ()
+
     def __init__(self,
             cgd: "CallgraphDictionary",
             index: int,
@@ -124,6 +129,8 @@ class ConstrainedVirtualTargets(CallgraphTargetBase):
 @CGD.callgraph_dictionary_record_tag("v")
 class VirtualTargets(CallgraphTargetBase):
 
+    __slots__ = ()
+
     def __init__(self,
             cgd: "CallgraphDictionary",
             index: int,
@@ -148,6 +155,8 @@ class VirtualTargets(CallgraphTargetBase):
 @CGD.callgraph_dictionary_record_tag("empty")
 class EmptyTarget(CallgraphTargetBase):
 
+    __slots__ = ()
+
     def __init__(self,
             cgd: "CallgraphDictionary",
             index: int,
@@ -177,9 +186,9 @@ class CallgraphDictionary(object):
 
     def __init__(self,
             jd: "DataDictionary",
-            xnode: "ET.Element"):
+            xnode: Optional["ET.Element"]):
         self.jd = jd
-        self.target_table: IT.IndexedTable["CallgraphTargetBase"] = IT.IndexedTable('target-table')
+        self.target_table: IT.IndexedTable["CallgraphTargetBase"] = IT.mk_indexed_table('target-table')
         self.tables = [
             (self.target_table, self._read_xml_target_table)
             ]
@@ -207,14 +216,19 @@ class CallgraphDictionary(object):
 
     # ----------------------- Initialize dictionary from file ------------------
  
-    def initialize(self, xnode: "ET.Element", force: bool=False) -> None:
+    def initialize(self, xnode: Optional["ET.Element"], force: bool=False) -> None:
         if xnode is None: return
         for (t,f) in self.tables:
             t.reset()
             f(UF.safe_find(xnode, t.name, 'Missing xml for table ' + t.name))
 
-    def _read_xml_target_table(self, txnode: "ET.Element") -> None:
-        def get_value(node: "ET.Element") -> "CallgraphTargetBase":
-            return CGD.construct_callgraph_dictionary_record(*((self,) + IT.get_rep(node)), CallgraphTargetBase)
+    def initialize_tables(self, get_table: Callable[[str], IT.TableNode]) -> None:
+        for (t,f) in self.tables:
+            t.reset()
+            f(get_table(t.name))
+
+    def _read_xml_target_table(self, txnode: Optional[IT.TableNode]) -> None:
+        def get_value(rep: IT.TableRep) -> "CallgraphTargetBase":
+            return CGD.construct_callgraph_dictionary_record(*((self,) + rep), CallgraphTargetBase)
         self.target_table.read_xml(txnode,'n',get_value)
         
@@ -37,6 +37,8 @@ if TYPE_CHECKING:
 class CallgraphDictionaryRecord(IT.IndexedTableValue):
     """Base class for all objects kept in the JDictionary."""
 
+    __slots__ = ("args", "cgd", "tags")
+
     def __init__(self,
             cgd: "CallgraphDictionary",
             index: int,
@@ -0,0 +1,161 @@
+# ------------------------------------------------------------------------------
+# CodeHawk Java Analyzer
+# Author: Henny Sipma
+# ------------------------------------------------------------------------------
+# The MIT License (MIT)
+#
+# Copyright (c) 2016-2020 Kestrel Technology LLC
+# Copyright (c) 2021      Andrew McGraw
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+# ------------------------------------------------------------------------------
+
+from array import array
+from collections import deque
+
+from typing import Dict, List, Optional, Set, Tuple, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from chj.index.DataDictionary import DataDictionary
+
+class CallgraphIndex():
+    '''Forward and reverse adjacency of the call graph by cmsix, in compressed
+    sparse row form.
+
+    The call edges of caller c are at positions fwdoffsets[c]:fwdoffsets[c+1]
+    of the forward arrays, in the order of DataDictionary.callgraphedges; an
+    edge has the caller pc and the cnix, msix and cmsix of the callee (cmsix
+    is -1 if the callee is not in the type dictionary). One edge is made for
+    each target class of a call. The reverse arrays have, for each callee
+    cmsix, the callers and pcs of its incoming edges.
+    '''
+
+    def __init__(self, jd: "DataDictionary") -> None:
+        self.jd = jd
+        edges: List[Tuple[int, int, int, int, int]] = []       # (caller, pc, cnix, msix, callee)
+        for ((srccmsix, pc), (msix, tgt)) in jd.callgraphedges.items():
+            for cnix in tgt.cnixs:
+                tgtcmsix = jd.get_cmsix(cnix, msix) if jd.has_cms(cnix, msix) else -1
+                edges.append((srccmsix, pc, cnix, msix, tgtcmsix))
+        size = 1 + max([ jd.tpd.class_method_signature_data_table.size() ]
+                       + [ max(e[0], e[4]) for e in edges ])
+        self.size = size
+
+        self.fwdoffsets = self._get_offsets([ e[0] for e in edges ], size)
+        self.fwdpcs = array('i', [0]) * len(edges)
+        self.fwdcnixs = array('i', [0]) * len(edges)
+        self.fwdmsixs = array('i', [0]) * len(edges)
+        self.fwdcallees = array('i', [0]) * len(edges)
+        fill = self.fwdoffsets[:-1]
+        for (srccmsix, pc, cnix, msix, tgtcmsix) in edges:
+            pos = fill[srccmsix]
+            fill[srccmsix] += 1
+            self.fwdpcs[pos] = pc
+            self.fwdcnixs[pos] = cnix
+            self.fwdmsixs[pos] = msix
+            self.fwdcallees[pos] = tgtcmsix
+
+        revedges = [ e for e in edges if e[4] >= 0 ]
+        self.revoffsets = self._get_offsets([ e[4] for e in revedges ], size)
+        self.revcallers = array('i', [0]) * len(revedges)
+        self.revpcs = array('i', [0]) * len(revedges)
+        fill = self.revoffsets[:-1]
+        for (srccmsix, pc, _, _, tgtcmsix) in revedges:
+            pos = fill[tgtcmsix]
+            fill[tgtcmsix] += 1
+            self.revcallers[pos] = srccmsix
+            self.revpcs[pos] = pc
+
+    def _get_offsets(self, keys: List[int], size: int) -> "array[int]":
+        offsets = array('i', [0]) * (size + 1)
+        for k in keys:
+            offsets[k + 1] += 1
+        for i in range(size):
+            offsets[i + 1] += offsets[i]
+        return offsets
+
+    def _in_range(self, cmsix: int) -> bool: return 0 <= cmsix < self.size
+
+    def get_call_edges(self, cmsix: int) -> List[Tuple[int, int, int, int]]:
+        '''returns (pc, callee cnix, callee msix, callee cmsix) of the calls made by cmsix'''
+        if not self._in_range(cmsix): return []
+        (lo, hi) = (self.fwdoffsets[cmsix], self.fwdoffsets[cmsix+1])
+        return list(zip(self.fwdpcs[lo:hi], self.fwdcnixs[lo:hi], self.fwdmsixs[lo:hi], self.fwdcallees[lo:hi]))
+
+    def get_caller_edges(self, cmsix: int) -> List[Tuple[int, int]]:
+        '''returns (caller cmsix, pc) of the calls to cmsix'''
+        if not self._in_range(cmsix): return []
+        (lo, hi) = (self.revoffsets[cmsix], self.revoffsets[cmsix+1])
+        return list(zip(self.revcallers[lo:hi], self.revpcs[lo:hi]))
+
+    def get_callees(self, cmsix: int) -> List[int]:
+        '''returns the distinct callees of cmsix, in order of first call'''
+        if not self._in_range(cmsix): return []
+        callees = self.fwdcallees[self.fwdoffsets[cmsix]:self.fwdoffsets[cmsix+1]]
+        return list(dict.fromkeys(c for c in callees if c >= 0))
+
+    def get_callers(self, cmsix: int) -> List[int]:
+        '''returns the distinct callers of cmsix, in order of first call'''
+        if not self._in_range(cmsix): return []
+        return list(dict.fromkeys(self.revcallers[self.revoffsets[cmsix]:self.revoffsets[cmsix+1]]))
+
+    def get_fan_out(self, cmsix: int) -> int: return len(self.get_callees(cmsix))
+
+    def get_fan_in(self, cmsix: int) -> int: return len(self.get_callers(cmsix))
+
+    def bfs(self, cmsix: int, maxdepth: Optional[int] = None, reverse: bool = False) -> List[Tuple[int, int]]:
+        '''returns (cmsix, depth) of the methods reachable from cmsix (that reach
+        cmsix if reverse) within maxdepth calls, in breadth-first order'''
+        neighbors = self.get_callers if reverse else self.get_callees
+        result = [ (cmsix, 0) ]
+        visited: Set[int] = set([ cmsix ])
+        queue = deque(result)
+        while len(queue) > 0:
+            (n, depth) = queue.popleft()
+            if maxdepth is not None and depth >= maxdepth: continue
+            for m in neighbors(n):
+                if not m in visited:
+                    visited.add(m)
+                    result.append((m, depth + 1))
+                    queue.append((m, depth + 1))
+        return result
+
+    def dfs(self, cmsix: int, maxdepth: Optional[int] = None, reverse: bool = False) -> List[Tuple[int, int]]:
+        '''returns (cmsix, depth) of the methods reachable from cmsix (that reach
+        cmsix if reverse) within maxdepth calls, in depth-first preorder; depth
+        is that of the path along which a method was first visited'''
+        neighbors = self.get_callers if reverse else self.get_callees
+        result: List[Tuple[int, int]] = []
+        visited: Set[int] = set([])
+        stack = [ (cmsix, 0) ]
+        while len(stack) > 0:
+            (n, depth) = stack.pop()
+            if n in visited: continue
+            visited.add(n)
+            result.append((n, depth))
+            if maxdepth is not None and depth >= maxdepth: continue
+            for m in reversed(neighbors(n)):
+                if not m in visited:
+                    stack.append((m, depth + 1))
+        return result
+
+    def get_callers_within(self, cmsix: int, k: int) -> Dict[int, int]:
+        '''returns the methods that call cmsix through at most k calls, with the
+        smallest number of calls'''
+        return dict((m, d) for (m, d) in self.bfs(cmsix, k, reverse=True) if d > 0)
@@ -0,0 +1,165 @@
+# ------------------------------------------------------------------------------
+# CodeHawk Java Analyzer
+# Author: Henny Sipma
+# ------------------------------------------------------------------------------
+# The MIT License (MIT)
+#
+# Copyright (c) 2016-2020 Kestrel Technology LLC
+# Copyright (c) 2021      Andrew McGraw
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+# ------------------------------------------------------------------------------
+
+from array import array
+
+import chj.util.fileutil as UF
+import chj.util.graphutil as UG
+import chj.index.DataDictionary as DD
+
+from typing import Any, Dict, List, Optional, Set, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from chj.index.Callgraph import Callgraph
+    from chj.index.MethodSignature import ClassMethodSignature
+
+REACHABILITY_VERSION = 1
+
+def get_bits(bits: int) -> List[int]:
+    '''returns the positions of the bits set in bits, in increasing order'''
+    return [ i for (i, b) in enumerate(bin(bits)[:1:-1]) if b == '1' ]
+
+class CallgraphReachability():
+    '''Transitive reachability between methods over the call graph.
+
+    The call graph is condensed into its strongly connected components; each
+    component has a bitset (a Python int, bit i for cmsix i) of the methods
+    reachable from it, itself included. Every method reaches itself. The
+    component map and bitsets are saved in a snapshot next to the analysis
+    results and reloaded as long as the data dictionary files are unchanged.
+    '''
+
+    def __init__(self, callgraph: "Callgraph") -> None:
+        self.callgraph = callgraph
+        self.app = callgraph.app
+        self.jd = callgraph.jd
+        self.components = array('i')            # cmsix -> component
+        self.reach: List[int] = []              # component -> bitset of reachable cmsix
+        self.revcomponents: List[List[int]] = []    # component -> components that call into it
+        self.members: List[List[int]] = []      # component -> cmsixs
+        self._initialize()
+
+    def reaches(self, src: int, dst: int) -> bool:
+        '''returns true if method src can reach method dst through zero or more calls'''
+        if not (0 <= src < len(self.components)) or dst < 0: return False
+        return ((self.reach[self.components[src]] >> dst) & 1) == 1
+
+    def get_reachable(self, cmsix: int) -> List[int]:
+        '''returns the methods reachable from cmsix (cmsix included)'''
+        return self.get_reachable_from([ cmsix ])
+
+    def get_reachable_from(self, cmsixs: List[int]) -> List[int]:
+        '''returns the methods reachable from any of cmsixs'''
+        bits = 0
+        for cmsix in cmsixs:
+            if 0 <= cmsix < len(self.components):
+                bits |= self.reach[self.components[cmsix]]
+        return get_bits(bits)
+
+    def get_reaching(self, cmsix: int) -> List[int]:
+        '''returns the methods that can reach cmsix (cmsix included)'''
+        if not (0 <= cmsix < len(self.components)): return []
+        start = self.components[cmsix]
+        done: Set[int] = set([ start ])
+        rem = [ start ]
+        while len(rem) > 0:
+            c = rem.pop()
+            for p in self.revcomponents[c]:
+                if not p in done:
+                    done.add(p)
+                    rem.append(p)
+        return sorted([ m for c in done for m in self.members[c] ])
+
+    def get_entry_points(self) -> List[int]:
+        '''returns the application methods that may be called from outside the
+        application: main methods, static initializers and callbacks'''
+        callbacks = set(self.callgraph.get_callback_methods())
+        result: List[int] = []
+        def f(cms: "ClassMethodSignature") -> None:
+            if cms.methodname in [ 'main', '<clinit>' ] or cms.index in callbacks:
+                result.append(cms.index)
+        self.jd.iter_methods(f)
+        return result
+
+    def get_dead_methods(self, entrypoints: Optional[List[int]] = None) -> List[int]:
+        '''returns the application methods not reachable from entrypoints
+        (default: get_entry_points)'''
+        if entrypoints is None: entrypoints = self.get_entry_points()
+        reachable = set(self.get_reachable_from(entrypoints))
+        result: List[int] = []
+        def f(cms: "ClassMethodSignature") -> None:
+            if not cms.index in reachable: result.append(cms.index)
+        self.jd.iter_methods(f)
+        return result
+
+    def _initialize(self) -> None:
+        path = self.app.path
+        key = DD.get_snapshot_key([
+            UF.get_datadictionary_filename(path),
+            UF.get_dataclassnames_filename(path),
+            UF.get_datamissingitems_filename(path),
+            UF.get_datasignatures_filename(path),
+            UF.get_datacallgraph_filename(path) ])
+        if DD.load_snapshot(path, 'reachability', key, self._restore, REACHABILITY_VERSION):
+            return
+        self._compute()
+        DD.save_snapshot(path, 'reachability', key, {
+            'components': self.components,
+            'reach': self.reach,
+            'revcomponents': self.revcomponents,
+            'members': self.members }, REACHABILITY_VERSION)
+
+    def _restore(self, data: Dict[str, Any]) -> None:
+        self.components = data['components']
+        self.reach = data['reach']
+        self.revcomponents = data['revcomponents']
+        self.members = data['members']
+
+    def _compute(self) -> None:
+        index = self.callgraph.index
+        components = UG.get_strongly_connected_components(range(index.size), index.get_callees)
+        componentof = array('i', [-1]) * index.size
+        for (c, members) in enumerate(components):
+            for m in members: componentof[m] = c
+        reach: List[int] = []
+        revcomponents: List[List[int]] = [ [] for _ in components ]
+        for (c, members) in enumerate(components):
+            bits = 0
+            succs: Set[int] = set([])
+            for m in members:
+                bits |= 1 << m
+                succs.update([ componentof[t] for t in index.get_callees(m) ])
+            succs.discard(c)
+            for s in succs:             # components come after the ones they reach
+                bits |= reach[s]
+                revcomponents[s].append(c)
+            reach.append(bits)
+        self.components = componentof
+        self.reach = reach
+        self.revcomponents = revcomponents
+        self.members = components
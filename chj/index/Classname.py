@@ -35,6 +35,8 @@ if TYPE_CHECKING:
 
 class Classname(JavaTypesBase):
 
+    __slots__ = ()
+
     def __init__(self, tpd: "JTypeDictionary", index: int, tags: List[str], args: List[int]):
         JavaTypesBase.__init__(self,tpd,index,tags,args)
 
@@ -26,14 +26,22 @@
 # SOFTWARE.
 # ------------------------------------------------------------------------------
 
+import os
+import pickle
+import tempfile
+
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+
 import chj.util.fileutil as UF
+import chj.util.IndexedTable as IT
 
 from chj.index.JTypeDictionary import JTypeDictionary
 from chj.index.TaintDictionary import TaintDictionary
 from chj.index.CallgraphDictionary import CallgraphDictionary
 from chj.index.JTermDictionary import JTermDictionary
 
-from typing import Callable, cast, Dict, List, Optional, Tuple, Union, TYPE_CHECKING
+from typing import Any, Callable, cast, Dict, List, Optional, Sequence, Set, Tuple, Union, TYPE_CHECKING
 
 if TYPE_CHECKING:
     from chj.index.AppAccess import AppAccess
@@ -45,14 +53,25 @@ if TYPE_CHECKING:
     from chj.index.MethodSignature import ClassMethodSignature
     import chj.index.Taint as T
 
+SNAPSHOT_VERSION = 2
+
 class DataDictionary():
+    '''Type, jterm, taint and callgraph data of an application.
+
+    The decoded tables are saved in binary snapshots next to the xml files
+    and reloaded from there as long as the xml files have not changed (same
+    sizes and modification times).
+
+    The jterm and taint dictionaries are loaded on first access of jtd and
+    ttd; has_taint_results tells whether the latter is available.
+    '''
 
     def __init__(self, app: "AppAccess") -> None:
         self.app = app                                                  # AppAccess
         self.tpd: JTypeDictionary                                       # JTypeDictionary
-        self.ttd: Optional[TaintDictionary] = None                      # TaintDictionary
+        self._ttd: Optional[TaintDictionary] = None                     # TaintDictionary (lazy)
         self.cgd: CallgraphDictionary                                   # CallgraphDictionary
-        self.jtd: JTermDictionary                                       # JTermDictionary
+        self._jtd: Optional[JTermDictionary] = None                     # JTermDictionary (lazy)
         self.appclassindices: Dict[str, int] = {}                       # classname (string) -> cnix
         self.msindices: Dict[Tuple[str, str], int] = {}                 # (name(string),sig(string)) -> msix
         self.mssignatures: Dict[int, Tuple[str, str]] = {}              # msix -> (name(string),sig(string))
@@ -60,8 +79,30 @@ class DataDictionary():
         self.callgraphedges: Dict[Tuple[int, int], 
                               Tuple[int, "CallgraphTargetBase"]] = {}     # (cmsix,pc) -> (msix,Calltarget)
         self.missingclasses: List[int] = []                             # list of cnix
+        self.appclasses: Set[int] = set([])                             # cnix of application classes
+        self._cmsindices: Optional[Dict[Tuple[int, int], int]] = None   # (cnix,msix) -> cmsix (lazy)
+        self._cmscnix: "array[int]" = array('i')                        # cmsix -> cnix (-1 if absent)
+        self._cmsmsix: "array[int]" = array('i')                        # cmsix -> msix (-1 if absent)
         self._initialize()
 
+    @property
+    def jtd(self) -> JTermDictionary:
+        if self._jtd is None:
+            self._jtd = self._load_jterm_dictionary(self.app.path)
+        return self._jtd
+
+    @property
+    def ttd(self) -> TaintDictionary:
+        '''raises CHJError if there are no taint results (see has_taint_results)'''
+        if self._ttd is None:
+            if not self.has_taint_results():
+                raise UF.CHJError('No taint analysis results found for ' + self.app.path)
+            self._ttd = self._load_taint_dictionary(self.app.path)
+        return self._ttd
+
+    def has_taint_results(self) -> bool:
+        return os.path.isfile(UF.get_data_taint_origins_filename(self.app.path))
+
     def get_cn(self, cnix: int) -> "Classname":
         return self.tpd.get_class_name(cnix)
 
@@ -90,7 +131,21 @@ class DataDictionary():
             raise UF.CHJError(classname + ' missing from appclassindices.')
 
     def get_cmsix(self, cnix:int, msix:int) -> int:
-        return self.tpd.get_cms_index([],[cnix,msix])
+        cmsindices = self._get_cms_indices()
+        if (cnix,msix) in cmsindices:
+            return cmsindices[(cnix,msix)]
+        else:
+            raise UF.CHJError('(' + str(cnix) + ',' + str(msix) + ') missing from class-method-signature-data-table')
+
+    def has_cms(self, cnix: int, msix: int) -> bool: return (cnix,msix) in self._get_cms_indices()
+
+    def get_cms_cnix_msix(self, cmsix: int) -> Tuple[int, int]:
+        '''returns (cnix,msix) of class method signature cmsix'''
+        self._get_cms_indices()
+        if 0 <= cmsix < len(self._cmscnix) and self._cmscnix[cmsix] >= 0:
+            return (self._cmscnix[cmsix], self._cmsmsix[cmsix])
+        else:
+            raise UF.CHJError('cmsix ' + str(cmsix) + ' missing from class-method-signature-data-table')
 
     def iter_appclasses(self, f:Callable[[int], None]) -> None:
         '''iterates over the indices of application class names'''
@@ -98,24 +153,21 @@ class DataDictionary():
 
     def iter_fields(self, f:Callable[["ClassFieldSignature"], None]) -> None:
         '''iterates over class field signatures of application classes'''
-        cnindices = self.appclassindices.values()
         for fld in self.tpd.get_fields():
-            if fld.cnix in cnindices: f(fld)
+            if fld.cnix in self.appclasses: f(fld)
 
     def iter_methods(self, f:Callable[["ClassMethodSignature"], None]) -> None:
         '''iterates over class method signatures of application classes'''
-        cnindices = self.appclassindices.values()
-        for m in sorted(self.tpd.get_methods(), key=lambda x: self.get_cmsix(x.cnix, x.msix)):
-            if m.cnix in cnindices: f(m)
+        self._get_cms_indices()
+        for (cmsix, cnix) in enumerate(self._cmscnix):
+            if cnix in self.appclasses: f(self.get_cms(cmsix))
 
     def iter_method_signature_targets(self,f: Callable[[int, Tuple[List[int], List[int], List[int]]], None]) -> None:
         for (msix,tgts) in self.mstargets.items(): f(msix,tgts)
 
     def iter_taint_origins(self, f: Callable[["T.TaintBase"], None]) -> None:
-        if self.ttd != None:
-            taintdictionary = cast(TaintDictionary, self.ttd)
-            taintorigins = taintdictionary.get_taint_origins()
-            for m in taintdictionary.get_taint_origins(): f(m)
+        if self.has_taint_results():
+            for m in self.ttd.get_taint_origins(): f(m)
         else:
             print('Taint Dictionary not found!')
 
@@ -145,7 +197,7 @@ class DataDictionary():
             (msix,tgt) = self.callgraphedges[ (cmsix,pc) ]
             f(cmsix,pc,msix,tgt)
 
-    def is_application_class(self, cnix: int) -> bool: return cnix in self.appclassindices.values()
+    def is_application_class(self, cnix: int) -> bool: return cnix in self.appclasses
 
     def has_call_target(self, cmsix: int, pc: int) -> bool: return (cmsix,pc) in self.callgraphedges
 
@@ -167,86 +219,315 @@ class DataDictionary():
 
     def _initialize(self) -> None:
         path = self.app.path
-        self._initialize_type_dictionary(path)
-        self._initialize_jterm_dictionary(path)
-        self._initialize_taint_dictionary(path)
-        self._initialize_app_classes(path)
-        self._initialize_missing_classes(path)
-        self._initialize_method_signatures(path)
-        self._initialize_callgraph(path)
+        key = get_snapshot_key([
+            UF.get_datadictionary_filename(path),
+            UF.get_dataclassnames_filename(path),
+            UF.get_datamissingitems_filename(path),
+            UF.get_datasignatures_filename(path),
+            UF.get_datacallgraph_filename(path) ])
+        if not load_snapshot(path, 'datadictionary', key, self._restore):
+            if self.app.parallel:
+                self._initialize_parallel(path)
+            else:
+                self._initialize_type_dictionary(path)
+                self._initialize_app_classes(path)
+                self._initialize_missing_classes(path)
+                self._initialize_method_signatures(path)
+                self._initialize_callgraph(path)
+            save_snapshot(path, 'datadictionary', key, {
+                'tpd': pack_tables(self.tpd.tables),
+                'cgd': pack_tables(self.cgd.tables),
+                'appclassindices': self.appclassindices,
+                'msindices': self.msindices,
+                'mssignatures': self.mssignatures,
+                'mstargets': self.mstargets,
+                'missingclasses': self.missingclasses,
+                'callgraphedges': [ (cmsix, pc, msix, tgt.index)
+                                    for ((cmsix, pc), (msix, tgt)) in self.callgraphedges.items() ] })
+        self.appclasses = set(self.appclassindices.values())
+        self._cmsindices = None
+
+    def _restore(self, data: Dict[str, Any]) -> None:
+        '''Construct the type and callgraph dictionaries from decoded tables
+        and set the maps.'''
+        self.tpd = JTypeDictionary(self, None)
+        self.tpd.initialize_tables(get_packed_table(data['tpd']))
+        self.cgd = CallgraphDictionary(self, None)
+        self.cgd.initialize_tables(get_packed_table(data['cgd']))
+        callgraphedges = {}
+        for (cmsix, pc, msix, tgtix) in data['callgraphedges']:
+            callgraphedges[(cmsix,pc)] = (msix, self.cgd.get_target(tgtix))
+        self.appclassindices = data['appclassindices']
+        self.msindices = data['msindices']
+        self.mssignatures = data['mssignatures']
+        self.mstargets = data['mstargets']
+        self.missingclasses = data['missingclasses']
+        self.callgraphedges = callgraphedges
+
+    def _initialize_parallel(self, path: str) -> None:
+        '''Decode the xml files in worker processes, one per file, and
+        construct the dictionaries when all parts have arrived.'''
+        parts = [ 'tpd', 'callgraph', 'signatures', 'appclassindices', 'missingclasses' ]
+        with ProcessPoolExecutor(max_workers=len(parts)) as pool:
+            results = dict(zip(parts, pool.map(read_part, [ path ] * len(parts), parts)))
+        (cgtables, cgedges) = results['callgraph']
+        (msindices, mssignatures, mstargets) = results['signatures']
+        self._restore({
+            'tpd': results['tpd'],
+            'cgd': cgtables,
+            'callgraphedges': cgedges,
+            'appclassindices': results['appclassindices'],
+            'msindices': msindices,
+            'mssignatures': mssignatures,
+            'mstargets': mstargets,
+            'missingclasses': results['missingclasses'] })
+
+    def _load_jterm_dictionary(self, path: str) -> JTermDictionary:
+        filename = UF.get_jterm_dictionary_filename(path)
+        key = get_snapshot_key([ filename ])
+        jtd = JTermDictionary(self, None)
+        def restore(data: Dict[str, Any]) -> None:
+            jtd.initialize_tables(get_packed_table(data['tables']))
+        if not load_snapshot(path, 'jtermdictionary', key, restore):
+            with IT.XmlTableStream(filename) as stream:
+                jtd.initialize_tables(lambda name: stream.get_table('dictionary/jterm-dictionary/' + name))
+            save_snapshot(path, 'jtermdictionary', key, { 'tables': pack_tables(jtd.tables) })
+        return jtd
+
+    def _load_taint_dictionary(self, path: str) -> TaintDictionary:
+        filename = UF.get_data_taint_origins_filename(path)
+        key = get_snapshot_key([ filename ])
+        ttd = TaintDictionary(self, None)
+        def restore(data: Dict[str, Any]) -> None:
+            ttd.initialize_tables(get_packed_table(data['tables']))
+        if not load_snapshot(path, 'taintdictionary', key, restore):
+            with IT.XmlTableStream(filename) as stream:
+                ttd.initialize_tables(lambda name: stream.get_table('taint-origins/taint-dictionary/' + name))
+            save_snapshot(path, 'taintdictionary', key, { 'tables': pack_tables(ttd.tables) })
+        return ttd
+
+    def _get_cms_indices(self) -> Dict[Tuple[int, int], int]:
+        '''Build the maps between cmsix and (cnix,msix) from the rows of the
+        class-method-signature table, without constructing the signatures.'''
+        if self._cmsindices is None:
+            table = self.tpd.class_method_signature_data_table
+            cmsindices: Dict[Tuple[int, int], int] = {}
+            cmscnix = array('i', [-1]) * table.next
+            cmsmsix = array('i', [-1]) * table.next
+            for (cmsix, _, args) in table.iter_reps():
+                cmscnix[cmsix] = args[0]
+                cmsmsix[cmsix] = args[1]
+                cmsindices[(args[0], args[1])] = cmsix
+            (self._cmscnix, self._cmsmsix) = (cmscnix, cmsmsix)
+            self._cmsindices = cmsindices
+        return self._cmsindices
 
     def _initialize_type_dictionary(self, path: str) -> None:
-        xdict = UF.get_datadictionary_xnode(path)
-        if not xdict is None:
-            self.tpd = JTypeDictionary(self,UF.safe_find(xdict, 'type-dictionary', 'type-dictionary missing from xml'))
-
-    def _initialize_jterm_dictionary(self, path: str) -> None:
-        xnode = UF.get_jterm_dictionary_xnode(path)
-        if not xnode is None:
-            self.jtd = JTermDictionary(self,UF.safe_find(xnode, 'jterm-dictionary', 'jterm-dictionary missing from xml'))
-
-    def _initialize_taint_dictionary(self, path: str) -> None:
-        xnode = UF.get_data_taint_origins_xnode(path)
-        if not xnode is None:
-            self.ttd = TaintDictionary(self,UF.safe_find(xnode, 'taint-dictionary', 'taint-dictionary missing from xml'))
+        with IT.XmlTableStream(UF.get_datadictionary_filename(path)) as stream:
+            self.tpd = JTypeDictionary(self, None)
+            self.tpd.initialize_tables(lambda name: stream.get_table('dictionary/type-dictionary/' + name))
 
     def _initialize_callgraph(self, path: str) -> None:
-        xnode = UF.get_datacallgraph_xnode(path)
-        if not xnode is None:
-            self.cgd = CallgraphDictionary(self,UF.safe_find(xnode, 'dictionary', 'callgraph dictionary missing from xml'))
-            xedges = UF.safe_find(xnode, 'edges', 'edges missing from xml')
-            for xedge in xedges.findall('edge'):
+        with IT.XmlTableStream(UF.get_datacallgraph_filename(path)) as stream:
+            self.cgd = CallgraphDictionary(self, None)
+            self.cgd.initialize_tables(lambda name: stream.get_table('callgraph/dictionary/' + name))
+            for xedge in stream.iter_records('callgraph/edges', 'edge'):
                 cmsix = UF.safe_get(xedge, 'ix', 'cmsix missing from xml', int)
                 pc = UF.safe_get(xedge, 'pc', 'pc missing from xml', int)
                 msix = UF.safe_get(xedge, 'ms-ix', 'ms-ix missing from xml', int)
                 tgt = self.cgd.read_xml_target(xedge)
                 self.callgraphedges[(cmsix,pc)] = (msix,tgt)
-                
+
     def _initialize_app_classes(self, path: str) -> None:
-        xnode = UF.get_dataclassnames_xnode(path)
-        if not xnode is None:
-            for cn in xnode.findall('cn'):
-                if "package" in cn.attrib and len(UF.safe_get(cn, 'package', 'packing missing from xml', str)) > 0:
-                    cname = UF.safe_get(cn, 'package', 'package missing from xml', str) \
-                            + '.' + UF.safe_get(cn, 'name', 'name of class missing from ' + path + ' xml.', str)
-                else:
-                    cname = UF.safe_get(cn, 'name', 'name of class missing from ' + path + ' xml.', str)
-                self.appclassindices[cname] = UF.safe_get(cn, 'ix', 'ix of class missing from ' + path + ' xml.', int)
+        self.appclassindices.update(read_app_classes(path))
 
     def _initialize_missing_classes(self, path: str) -> None:
-        xnode = UF.get_datamissingitems_xnode(path)
-        if not xnode is None:
-            xmissing = UF.safe_find(xnode, 'missing-classes' ,'missing-classes missing from xml')
-            for cn in xmissing.findall('cn'):
-                self.missingclasses.append(UF.safe_get(cn, 'ix', 'ix missing from xml', int))
+        self.missingclasses.extend(read_missing_classes(path))
 
     def _initialize_method_signatures(self,path: str) -> None:
-        xnode = UF.get_datasignatures_xnode(path)
-        if not xnode is None:
-            for xms in xnode.findall('ms'):
-                msix = UF.safe_get(xms, 'ix', 'ix missing from xml', int)
-                msname = UF.safe_get(xms, 'name', 'name missing from xml', str)
-                mssig = UF.safe_get(xms, 'sig', 'sig missing from xml', str)
-                xstubs = xms.findall('stubs')
-                stubs: List[int] = []
-                if len(xstubs) > 0:
-                    for xstub in xstubs:
-                        if 'ixs' in xstub.attrib:
-                            stubs += [ int(x) for x in UF.safe_get(xstub, 'ixs', 'ixs missing from xml', str).split(',') ]
-                appmethods: List[int] = []
-                xbcs = xms.findall('bc')
-                if len(xbcs) > 0:
-                    for xbc in xbcs:
-                        if 'ixs' in xbc.attrib:
-                            appmethods += [ int(x) for x in UF.safe_get(xbc, 'ixs', 'ixs missing from xml', str).split(',') ]
-                natives: List[int] = []
-                xnatives = xms.findall('native')
-                if len(xnatives) > 0:
-                    for xnative in xnatives:
-                        if 'ixs' in xnative.attrib:
-                            natives += [ int(x) for x in UF.safe_get(xnative, 'ixs', 'ixs missing from xml', str).split(',') ]
-                self.msindices[(msname,mssig)] = msix
-                self.mssignatures[msix] = (msname,mssig)
-                self.mstargets[msix] = (stubs,appmethods,natives)
-                
-
+        (msindices, mssignatures, mstargets) = read_method_signatures(path)
+        self.msindices.update(msindices)
+        self.mssignatures.update(mssignatures)
+        self.mstargets.update(mstargets)
+
+
+def get_snapshot_key(filenames: List[str]) -> List[Optional[Tuple[str, int, int]]]:
+    '''Return the (name, size, mtime) of the files a snapshot is derived from.'''
+    result: List[Optional[Tuple[str, int, int]]] = []
+    for filename in filenames:
+        if os.path.isfile(filename):
+            stat = os.stat(filename)
+            result.append((os.path.basename(filename), stat.st_size, stat.st_mtime_ns))
+        else:
+            result.append(None)
+    return result
+
+class SnapshotUnpickler(pickle.Unpickler):
+    '''Unpickler that resolves only the classes snapshots are made of, so
+    that loading a snapshot file cannot run any other code.'''
+
+    allowed = set([
+        ('array', 'array'),
+        ('array', '_array_reconstructor'),
+        (IT.PackedTable.__module__, 'PackedTable') ])
+
+    def find_class(self, module: str, name: str) -> Any:
+        if (module, name) in self.allowed:
+            return super().find_class(module, name)
+        raise pickle.UnpicklingError('snapshot refers to ' + module + '.' + name)
+
+def load_snapshot(
+        path: str,
+        name: str,
+        key: List[Optional[Tuple[str, int, int]]],
+        restore: Callable[[Dict[str, Any]], None],
+        version: int = SNAPSHOT_VERSION) -> bool:
+    '''Pass the data of snapshot name to restore if it was saved with the
+    same version and key; return whether it was.'''
+    filename = UF.get_datadictionary_snapshot_filename(path, name)
+    if not os.path.isfile(filename):
+        return False
+    try:
+        with open(filename, 'rb') as fp:
+            snapshot: Dict[str, Any] = SnapshotUnpickler(fp).load()
+        if snapshot['version'] != version or snapshot['key'] != key:
+            return False
+        restore(snapshot)
+    except (OSError, EOFError, KeyError, ValueError, TypeError, AttributeError, IndexError,
+            pickle.UnpicklingError, IT.IndexedTableError, UF.CHJError):
+        return False
+    return True
+
+def save_snapshot(
+        path: str,
+        name: str,
+        key: List[Optional[Tuple[str, int, int]]],
+        data: Dict[str, Any],
+        version: int = SNAPSHOT_VERSION) -> None:
+    snapshot = dict(data)
+    snapshot['version'] = version
+    snapshot['key'] = key
+    filename = UF.get_datadictionary_snapshot_filename(path, name)
+    try:
+        (fd, tmpname) = tempfile.mkstemp(dir=os.path.dirname(filename))
+    except OSError:
+        return
+    saved = False
+    try:
+        with os.fdopen(fd, 'wb') as fp:
+            pickle.dump(snapshot, fp, pickle.HIGHEST_PROTOCOL)
+        os.replace(tmpname, filename)
+        saved = True
+    except (OSError, pickle.PicklingError, AttributeError, TypeError):
+        pass                # snapshot is an optimization only
+    finally:
+        if not saved:
+            try:
+                os.unlink(tmpname)
+            except OSError:
+                pass
+
+def pack_tables(tables: Sequence[Tuple[IT.IndexedTableSuperclass, Any]]) -> Dict[str, IT.PackedTable]:
+    return { t.name: cast(IT.IndexedTable[IT.IndexedTableValue], t).pack() for (t, _) in tables }
+
+def get_packed_table(tables: Dict[str, IT.PackedTable]) -> Callable[[str], IT.TableNode]:
+    def get_table(name: str) -> IT.TableNode:
+        if name in tables:
+            return tables[name]
+        raise UF.CHJError(name + ' missing from snapshot')
+    return get_table
+
+def read_app_classes(path: str) -> Dict[str, int]:
+    '''Return the application classes as classname -> cnix.'''
+    result: Dict[str, int] = {}
+    xnode = UF.get_dataclassnames_xnode(path)
+    if not xnode is None:
+        for cn in xnode.findall('cn'):
+            if "package" in cn.attrib and len(UF.safe_get(cn, 'package', 'packing missing from xml', str)) > 0:
+                cname = UF.safe_get(cn, 'package', 'package missing from xml', str) \
+                        + '.' + UF.safe_get(cn, 'name', 'name of class missing from ' + path + ' xml.', str)
+            else:
+                cname = UF.safe_get(cn, 'name', 'name of class missing from ' + path + ' xml.', str)
+            result[cname] = UF.safe_get(cn, 'ix', 'ix of class missing from ' + path + ' xml.', int)
+    return result
+
+def read_missing_classes(path: str) -> List[int]:
+    '''Return the cnix of the missing classes.'''
+    result: List[int] = []
+    xnode = UF.get_datamissingitems_xnode(path)
+    if not xnode is None:
+        xmissing = UF.safe_find(xnode, 'missing-classes' ,'missing-classes missing from xml')
+        for cn in xmissing.findall('cn'):
+            result.append(UF.safe_get(cn, 'ix', 'ix missing from xml', int))
+    return result
+
+def read_method_signatures(path: str) -> Tuple[
+        Dict[Tuple[str, str], int],
+        Dict[int, Tuple[str, str]],
+        Dict[int, Tuple[List[int], List[int], List[int]]]]:
+    '''Return the method signature indices, signatures and targets.'''
+    msindices: Dict[Tuple[str, str], int] = {}
+    mssignatures: Dict[int, Tuple[str, str]] = {}
+    mstargets: Dict[int, Tuple[List[int], List[int], List[int]]] = {}
+    xnode = UF.get_datasignatures_xnode(path)
+    if not xnode is None:
+        for xms in xnode.findall('ms'):
+            msix = UF.safe_get(xms, 'ix', 'ix missing from xml', int)
+            msname = UF.safe_get(xms, 'name', 'name missing from xml', str)
+            mssig = UF.safe_get(xms, 'sig', 'sig missing from xml', str)
+            xstubs = xms.findall('stubs')
+            stubs: List[int] = []
+            if len(xstubs) > 0:
+                for xstub in xstubs:
+                    if 'ixs' in xstub.attrib:
+                        stubs += [ int(x) for x in UF.safe_get(xstub, 'ixs', 'ixs missing from xml', str).split(',') ]
+            appmethods: List[int] = []
+            xbcs = xms.findall('bc')
+            if len(xbcs) > 0:
+                for xbc in xbcs:
+                    if 'ixs' in xbc.attrib:
+                        appmethods += [ int(x) for x in UF.safe_get(xbc, 'ixs', 'ixs missing from xml', str).split(',') ]
+            natives: List[int] = []
+            xnatives = xms.findall('native')
+            if len(xnatives) > 0:
+                for xnative in xnatives:
+                    if 'ixs' in xnative.attrib:
+                        natives += [ int(x) for x in UF.safe_get(xnative, 'ixs', 'ixs missing from xml', str).split(',') ]
+            msindices[(msname,mssig)] = msix
+            mssignatures[msix] = (msname,mssig)
+            mstargets[msix] = (stubs,appmethods,natives)
+    return (msindices, mssignatures, mstargets)
+
+def read_callgraph(path: str) -> Tuple[Dict[str, IT.PackedTable], List[Tuple[int, int, int, int]]]:
+    '''Return the callgraph dictionary tables and the edges as
+    (cmsix, pc, msix, target index).'''
+    targets = IT.PackedTable()
+    edges: List[Tuple[int, int, int, int]] = []
+    with IT.XmlTableStream(UF.get_datacallgraph_filename(path)) as stream:
+        for xtgt in stream.iter_records('callgraph/dictionary/target-table', 'n'):
+            targets.add(
+                UF.safe_get(xtgt, 'ix', 'ix missing from xml', int),
+                xtgt.get('t', ''),
+                xtgt.get('a', ''))
+        for xedge in stream.iter_records('callgraph/edges', 'edge'):
+            edges.append((
+                UF.safe_get(xedge, 'ix', 'cmsix missing from xml', int),
+                UF.safe_get(xedge, 'pc', 'pc missing from xml', int),
+                UF.safe_get(xedge, 'ms-ix', 'ms-ix missing from xml', int),
+                UF.safe_get(xedge, 'itgt', 'tag missing from xml of CallgraphDictionary', int)))
+    return ({ 'target-table': targets }, edges)
+
+def read_part(path: str, part: str) -> Any:
+    '''Decode one part of the data dictionary without constructing record
+    objects; used by the worker processes in parallel initialization.'''
+    if part == 'tpd':
+        return IT.read_packed_tables(UF.get_datadictionary_filename(path), 'dictionary/type-dictionary')
+    if part == 'callgraph':
+        return read_callgraph(path)
+    if part == 'appclassindices':
+        return read_app_classes(path)
+    if part == 'missingclasses':
+        return read_missing_classes(path)
+    if part == 'signatures':
+        return read_method_signatures(path)
+    raise UF.CHJError('Unknown data dictionary part: ' + part)
@@ -39,6 +39,8 @@ if TYPE_CHECKING:
 
 class FieldSignature(JavaTypesBase):
 
+    __slots__ = ()
+
     def __init__(self,
             tpd: "JTypeDictionary",
             index: int,
@@ -70,6 +72,8 @@ class FieldSignature(JavaTypesBase):
 
 class ClassFieldSignature(JavaTypesBase):
 
+    __slots__ = ("cnix", "fsix")
+
     def __init__(self,
         tpd: "JTypeDictionary",
         index: int,
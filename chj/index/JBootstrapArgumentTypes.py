@@ -37,6 +37,8 @@ if TYPE_CHECKING:
 
 class JBootstrapArgumentTypeBase(JD.JDictionaryRecord):
 
+    __slots__ = ()
+
     def __init__(self,
             tpd: "JTypeDictionary",
             index: int,
@@ -50,6 +52,8 @@ class JBootstrapArgumentTypeBase(JD.JDictionaryRecord):
 @JD.j_dictionary_record_tag("c")
 class BootstrapArgConstantValue(JBootstrapArgumentTypeBase):
 
+    __slots__ = ()
+
     def __init__(self,
             tpd: "JTypeDictionary",
             index: int,
@@ -65,6 +69,8 @@ class BootstrapArgConstantValue(JBootstrapArgumentTypeBase):
 @JD.j_dictionary_record_tag("h")
 class BootstrapArgMethodHandle(JBootstrapArgumentTypeBase):
 
+    __slots__ = ()
+
     def __init__(self,
             tpd: "JTypeDictionary",
             index: int,
@@ -84,6 +90,8 @@ class BootstrapArgMethodHandle(JBootstrapArgumentTypeBase):
 @JD.j_dictionary_record_tag("t")
 class BootstrapArgMethodType(JBootstrapArgumentTypeBase):
 
+    __slots__ = ()
+
     def __init__(self,
             tpd: "JTypeDictionary",
             index: int,
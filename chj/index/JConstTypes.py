@@ -42,6 +42,8 @@ if TYPE_CHECKING:
 
 class JConstTypeBase(JD.JDictionaryRecord):
 
+    __slots__ = ()
+
     def __init__(self,
             tpd: "JTypeDictionary",
             index: int,
@@ -55,6 +57,8 @@ class JConstTypeBase(JD.JDictionaryRecord):
 @JD.j_dictionary_record_tag("v")
 class ConstValue(JConstTypeBase):
 
+    __slots__ = ()
+
     def __init__(self,
             tpd: "JTypeDictionary",
             index: int,
@@ -70,6 +74,8 @@ class ConstValue(JConstTypeBase):
 @JD.j_dictionary_record_tag("f")
 class ConstField(JConstTypeBase):
 
+    __slots__ = ()
+
     def __init__(self,
             tpd: "JTypeDictionary",
             index: int,
@@ -89,6 +95,8 @@ class ConstField(JConstTypeBase):
 @JD.j_dictionary_record_tag("m")
 class ConstMethod(JConstTypeBase):
 
+    __slots__ = ()
+
     def __init__(self,
             tpd: "JTypeDictionary",
             index: int,
@@ -108,6 +116,8 @@ class ConstMethod(JConstTypeBase):
 @JD.j_dictionary_record_tag("i")
 class ConstInterfaceMethod(JConstTypeBase):
 
+    __slots__ = ()
+
     def __init__(self,
             tpd: "JTypeDictionary",
             index: int,
@@ -128,6 +138,8 @@ class ConstInterfaceMethod(JConstTypeBase):
 @JD.j_dictionary_record_tag("d")
 class ConstDynamicMethod(JConstTypeBase):
 
+    __slots__ = ()
+
     def __init__(self,
             tpd: "JTypeDictionary",
             index: int,
@@ -148,6 +160,8 @@ class ConstDynamicMethod(JConstTypeBase):
 @JD.j_dictionary_record_tag("n")
 class ConstNameAndType(JConstTypeBase):
 
+    __slots__ = ()
+
     def __init__(self,
             tpd: "JTypeDictionary",
             index: int,
@@ -166,6 +180,8 @@ class ConstNameAndType(JConstTypeBase):
 @JD.j_dictionary_record_tag("s")
 class ConstStringUTF8(JConstTypeBase):
 
+    __slots__ = ()
+
     def __init__(self,
             tpd: "JTypeDictionary",
             index: int,
@@ -181,6 +197,8 @@ class ConstStringUTF8(JConstTypeBase):
 @JD.j_dictionary_record_tag("h")
 class ConstMethodHandle(JConstTypeBase):
 
+    __slots__ = ()
+
     def __init__(self,
             tpd: "JTypeDictionary",
             index: int,
@@ -200,6 +218,8 @@ class ConstMethodHandle(JConstTypeBase):
 @JD.j_dictionary_record_tag("t")
 class ConstMethodType(JConstTypeBase):
 
+    __slots__ = ()
+
     def __init__(self,
             tpd: "JTypeDictionary",
             index: int,
@@ -216,6 +236,8 @@ class ConstMethodType(JConstTypeBase):
 @JD.j_dictionary_record_tag("u")
 class ConstUnusable(JConstTypeBase):
 
+    __slots__ = ()
+
     def __init__(self,
             tpd: "JTypeDictionary",
             index: int,
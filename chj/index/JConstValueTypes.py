@@ -36,6 +36,8 @@ if TYPE_CHECKING:
 
 class JConstValueTypeBase(JD.JDictionaryRecord):
 
+    __slots__ = ()
+
     def __init__(self,
             tpd: "JTypeDictionary",
             index: int,
@@ -48,6 +50,8 @@ class JConstValueTypeBase(JD.JDictionaryRecord):
 @JD.j_dictionary_record_tag("s")
 class ConstString(JConstValueTypeBase):
 
+    __slots__ = ()
+
     def __init__(self,
             tpd: "JTypeDictionary",
             index: int,
@@ -62,6 +66,8 @@ class ConstString(JConstValueTypeBase):
 @JD.j_dictionary_record_tag("i")
 class ConstInt(JConstValueTypeBase):
 
+    __slots__ = ()
+
     def __init__(self,
             tpd: "JTypeDictionary",
             index: int,
@@ -76,6 +82,8 @@ class ConstInt(JConstValueTypeBase):
 @JD.j_dictionary_record_tag("f")
 class ConstFloat(JConstValueTypeBase):
 
+    __slots__ = ()
+
     def __init__(self,
             tpd: "JTypeDictionary",
             index: int,
@@ -90,6 +98,8 @@ class ConstFloat(JConstValueTypeBase):
 @JD.j_dictionary_record_tag("l")
 class ConstLong(JConstValueTypeBase):
 
+    __slots__ = ()
+
     def __init__(self,
             tpd: "JTypeDictionary",
             index: int,
@@ -104,6 +114,8 @@ class ConstLong(JConstValueTypeBase):
 @JD.j_dictionary_record_tag("d")
 class ConstDouble(JConstValueTypeBase):
 
+    __slots__ = ()
+
     def __init__(self,
             tpd: "JTypeDictionary",
             index: int,
@@ -118,6 +130,8 @@ class ConstDouble(JConstValueTypeBase):
 @JD.j_dictionary_record_tag("c")
 class ConstClass(JConstValueTypeBase):
 
+    __slots__ = ()
+
     def __init__(self,
             tpd: "JTypeDictionary",
             index: int,
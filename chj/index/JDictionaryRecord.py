@@ -38,6 +38,8 @@ if TYPE_CHECKING:
 class JDictionaryRecord(IT.IndexedTableValue):
     """Base class for all objects kept in the JDictionary."""
 
+    __slots__ = ("args", "tags", "tpd")
+
     def __init__(self,
             tpd: "JTypeDictionary",
             index: int,
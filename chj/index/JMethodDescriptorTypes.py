@@ -36,6 +36,8 @@ if TYPE_CHECKING:
 
 class JMethodDescriptorTypeBase(JD.JDictionaryRecord):
 
+    __slots__ = ()
+
     def __init__(self,
             tpd: "JTypeDictionary",
             index: int,
@@ -49,6 +51,8 @@ class JMethodDescriptorTypeBase(JD.JDictionaryRecord):
 @JD.j_dictionary_record_tag("m")
 class MethodDescriptor(JMethodDescriptorTypeBase):
 
+    __slots__ = ()
+
     def __init__(self,
             tpd: "JTypeDictionary",
             index: int,
@@ -78,6 +82,8 @@ class MethodDescriptor(JMethodDescriptorTypeBase):
 @JD.j_dictionary_record_tag("v")
 class ValueDescriptor(JMethodDescriptorTypeBase):
 
+    __slots__ = ()
+
     def __init__(self,
             tpd: "JTypeDictionary",
             index: int,
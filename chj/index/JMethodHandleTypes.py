@@ -38,6 +38,8 @@ if TYPE_CHECKING:
 
 class JMethodHandleTypeBase(JD.JDictionaryRecord):
 
+    __slots__ = ()
+
     def __init__(self,
             tpd: "JTypeDictionary",
             index: int,
@@ -51,6 +53,8 @@ class JMethodHandleTypeBase(JD.JDictionaryRecord):
 @JD.j_dictionary_record_tag("f")
 class FieldHandle(JMethodHandleTypeBase):
 
+    __slots__ = ()
+
     def __init__(self,
             tpd: "JTypeDictionary",
             index: int,
@@ -70,6 +74,8 @@ class FieldHandle(JMethodHandleTypeBase):
 @JD.j_dictionary_record_tag("m")
 class MethodHandle(JMethodHandleTypeBase):
 
+    __slots__ = ()
+
     def __init__(self,
             tpd: "JTypeDictionary",
             index: int,
@@ -89,6 +95,8 @@ class MethodHandle(JMethodHandleTypeBase):
 @JD.j_dictionary_record_tag("i")
 class InterfaceHandle(JMethodHandleTypeBase):
 
+    __slots__ = ()
+
     def __init__(self,
             tpd: "JTypeDictionary",
             index: int,
@@ -36,6 +36,8 @@ if TYPE_CHECKING:
 
 class JObjectTypeBase(JD.JDictionaryRecord):
 
+    __slots__ = ()
+
     def __init__(self,
             tpd: "JTypeDictionary",
             index: int,
@@ -67,6 +69,8 @@ class JObjectTypeBase(JD.JDictionaryRecord):
 @JD.j_dictionary_record_tag("c")
 class ClassObjectType(JObjectTypeBase):
 
+    __slots__ = ()
+
     def __init__(self,
             tpd: "JTypeDictionary",
             index: int,
@@ -83,6 +87,8 @@ class ClassObjectType(JObjectTypeBase):
 @JD.j_dictionary_record_tag("a")
 class ArrayObjectType(JObjectTypeBase):
 
+    __slots__ = ()
+
     def __init__(self,
             tpd: "JTypeDictionary",
             index: int,
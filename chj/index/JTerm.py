@@ -60,13 +60,14 @@ def convert_op(s: str) -> str:
 
 class JTermBase(JTD.JTermDictionaryRecord):
 
+    __slots__ = ()
+
     def __init__(self,
             jtd: "JTermDictionary",
             index: int,
             tags: List[str],
             args: List[int]):
         JTD.JTermDictionaryRecord.__init__(self,jtd,index,tags,args)
-        self.jtd = jtd
 
     def is_constant(self) -> bool: return False
 
@@ -109,6 +110,8 @@ class JTermBase(JTD.JTermDictionaryRecord):
 
 class JTStringConstant(JTermBase):
 
+    __slots__ = ()
+
     def __init__(self,
             jtd: "JTermDictionary",
             index: int,
@@ -135,6 +138,8 @@ class JTStringConstant(JTermBase):
 
 class JTNumerical(JTermBase):
 
+    __slots__ = ()
+
     def __init__(self,
             jtd: "JTermDictionary",
             index: int,
@@ -151,6 +156,8 @@ class JTNumerical(JTermBase):
 
 class JTFloat(JTermBase):
 
+    __slots__ = ()
+
     def __init__(self,
             jtd: "JTermDictionary",
             index: int,
@@ -166,6 +173,8 @@ class JTFloat(JTermBase):
 @JTD.j_dictionary_record_tag("xv")
 class JTAuxiliaryVar(JTermBase):
 
+    __slots__ = ()
+
     def __init__(self,
             jtd: "JTermDictionary",
             index: int,
@@ -183,6 +192,8 @@ class JTAuxiliaryVar(JTermBase):
 @JTD.j_dictionary_record_tag("lv")
 class JTLocalVar(JTermBase):
 
+    __slots__ = ()
+
     def __init__(self,
             jtd: "JTermDictionary",
             index: int,
@@ -200,6 +211,8 @@ class JTLocalVar(JTermBase):
 @JTD.j_dictionary_record_tag("lc")
 class JTLoopCounter(JTermBase):
 
+    __slots__ = ()
+
     def __init__(self,
             jtd: "JTermDictionary",
             index: int,
@@ -217,6 +230,8 @@ class JTLoopCounter(JTermBase):
 @JTD.j_dictionary_record_tag("c")
 class JTConstant(JTermBase):
 
+    __slots__ = ()
+
     def __init__(self,
             jtd: "JTermDictionary",
             index: int,
@@ -264,6 +279,8 @@ class JTConstant(JTermBase):
 @JTD.j_dictionary_record_tag("sf")
 class JTStaticFieldValue(JTermBase):
 
+    __slots__ = ()
+
     def __init__(self,
             jtd: "JTermDictionary",
             index: int,
@@ -289,6 +306,8 @@ class JTStaticFieldValue(JTermBase):
 @JTD.j_dictionary_record_tag("of")
 class JTObjectFieldValue(JTermBase):
 
+    __slots__ = ()
+
     def __init__(self,
             jtd: "JTermDictionary",
             index: int,
@@ -324,6 +343,8 @@ class JTObjectFieldValue(JTermBase):
 @JTD.j_dictionary_record_tag("bc")
 class JTBoolConstant(JTermBase):
 
+    __slots__ = ()
+
     def __init__(self,
             jtd: "JTermDictionary",
             index: int,
@@ -341,6 +362,8 @@ class JTBoolConstant(JTermBase):
 @JTD.j_dictionary_record_tag("fc")
 class JTFloatConstant(JTermBase):
 
+    __slots__ = ()
+
     def __init__(self,
             jtd: "JTermDictionary",
             index: int,
@@ -378,6 +401,8 @@ class JTFloatConstant(JTermBase):
 @JTD.j_dictionary_record_tag("sc")
 class JTermStringConstant(JTermBase):
 
+    __slots__ = ()
+
     def __init__(self,
             jtd: "JTermDictionary",
             index: int,
@@ -395,6 +420,8 @@ class JTermStringConstant(JTermBase):
 @JTD.j_dictionary_record_tag("al")
 class JTArrayLength(JTermBase):
 
+    __slots__ = ()
+
     def __init__(self,
             jtd: "JTermDictionary",
             index: int,
@@ -414,6 +441,8 @@ class JTArrayLength(JTermBase):
 @JTD.j_dictionary_record_tag("sl")
 class JTStringLength(JTermBase):
 
+    __slots__ = ()
+
     def __init__(self,
             jtd: "JTermDictionary",
             index: int,
@@ -433,6 +462,8 @@ class JTStringLength(JTermBase):
 @JTD.j_dictionary_record_tag("si")
 class JTSize(JTermBase):
 
+    __slots__ = ()
+
     def __init__(self,
             jtd: "JTermDictionary",
             index: int,
@@ -450,6 +481,8 @@ class JTSize(JTermBase):
 
 class JTSymbolicJTermConstant(JTermBase):
 
+    __slots__ = ()
+
     def __init__(self,
             jtd: "JTermDictionary",
             index: int,
@@ -485,6 +518,8 @@ class JTSymbolicJTermConstant(JTermBase):
 @JTD.j_dictionary_record_tag("symc")
 class JTSymbolicConstant(JTermBase):
 
+    __slots__ = ()
+
     def __init__(self,
             jtd: "JTermDictionary",
             index: int,
@@ -514,6 +549,8 @@ class JTSymbolicConstant(JTermBase):
 @JTD.j_dictionary_record_tag("ar")
 class JTArithmeticExpr(JTermBase):
 
+    __slots__ = ()
+
     def __init__(self,
             jtd: "JTermDictionary",
             index: int,
@@ -590,6 +627,8 @@ class JTArithmeticExpr(JTermBase):
 
 class JTRelationalExpr(JTermBase):
 
+    __slots__ = ()
+
     def __init__(self,
             jtd: "JTermDictionary",
             index: int,
@@ -612,6 +651,8 @@ class JTRelationalExpr(JTermBase):
 
 class JTRelationalExprList(JTermBase):
 
+    __slots__ = ()
+
     def __init__(self,
             jtd: "JTermDictionary",
             index: int,
@@ -628,6 +669,8 @@ class JTRelationalExprList(JTermBase):
 
 class JTermList(JTermBase):
 
+    __slots__ = ()
+
     def __init__(self,
             jtd: "JTermDictionary",
             index: int,
@@ -673,6 +716,8 @@ class JTermList(JTermBase):
 
 class JTermRange(JTermBase):
 
+    __slots__ = ()
+
     def __init__(self,
             jtd: "JTermDictionary",
             index: int,
@@ -41,18 +41,18 @@ import xml.etree.ElementTree as ET
 
 class JTermDictionary(object):
 
-    def __init__(self, jd: "DataDictionary", xnode: ET.Element):
+    def __init__(self, jd: "DataDictionary", xnode: Optional[ET.Element]):
         self.jd = jd
-        self.symbolic_jterm_constant_table: IT.IndexedTable[JT.JTSymbolicJTermConstant] = IT.IndexedTable('symbolic-jterm-constant-table')
-        self.string_table: IT.IndexedTable[JT.JTStringConstant] = IT.IndexedTable('string-table')
-        self.numerical_table: IT.IndexedTable[JT.JTNumerical] = IT.IndexedTable('numerical-table')
-        self.float_table: IT.IndexedTable[JT.JTFloat] = IT.IndexedTable('float-table')
-        self.jterm_table: IT.IndexedTable[JT.JTermBase] = IT.IndexedTable('jterm-table')
-        self.relational_expr_table: IT.IndexedTable[JT.JTRelationalExpr] = IT.IndexedTable('relational-expr-table')
-        self.jterm_list_table: IT.IndexedTable[JT.JTermList] = IT.IndexedTable('jterm-list-table')
-        self.relational_expr_list_table: IT.IndexedTable[JT.JTRelationalExprList] = IT.IndexedTable('relational-expr-list-table')
-        self.jterm_range_table: IT.IndexedTable[JT.JTermRange] = IT.IndexedTable('jterm-range-table')
-        self.tables: List[Tuple[IT.IndexedTableSuperclass, Callable[[ET.Element], None]]] = [
+        self.symbolic_jterm_constant_table: IT.IndexedTable[JT.JTSymbolicJTermConstant] = IT.mk_indexed_table('symbolic-jterm-constant-table')
+        self.string_table: IT.IndexedTable[JT.JTStringConstant] = IT.mk_indexed_table('string-table')
+        self.numerical_table: IT.IndexedTable[JT.JTNumerical] = IT.mk_indexed_table('numerical-table')
+        self.float_table: IT.IndexedTable[JT.JTFloat] = IT.mk_indexed_table('float-table')
+        self.jterm_table: IT.IndexedTable[JT.JTermBase] = IT.mk_indexed_table('jterm-table')
+        self.relational_expr_table: IT.IndexedTable[JT.JTRelationalExpr] = IT.mk_indexed_table('relational-expr-table')
+        self.jterm_list_table: IT.IndexedTable[JT.JTermList] = IT.mk_indexed_table('jterm-list-table')
+        self.relational_expr_list_table: IT.IndexedTable[JT.JTRelationalExprList] = IT.mk_indexed_table('relational-expr-list-table')
+        self.jterm_range_table: IT.IndexedTable[JT.JTermRange] = IT.mk_indexed_table('jterm-range-table')
+        self.tables: List[Tuple[IT.IndexedTableSuperclass, Callable[[Optional[IT.TableNode]], None]]] = [
             (self.symbolic_jterm_constant_table, self._read_xml_symbolic_jterm_constant_table),
             (self.string_table, self._read_xml_string_table),
             (self.numerical_table, self._read_xml_numerical_table),
@@ -92,25 +92,25 @@ class JTermDictionary(object):
 
     def index_numerical(self, v: int) -> int:
         tags = [ str(v) ]
-        def f(index: int, key: Tuple[str, str]) -> JT.JTNumerical: 
+        def f(index: int) -> JT.JTNumerical:
             return JT.JTNumerical(self,index,tags,[])
-        return self.numerical_table.add(IT.get_key(tags,[]),f)
+        return self.numerical_table.add_rep(tags,[],f)
 
     def mk_numerical(self, v: int) -> JT.JTNumerical:
         return self.get_numerical(self.index_numerical(v))
 
     def index_float(self, v: float) -> int:
         tags = [ str(v) ]
-        def f(index: int, key: Tuple[str, str]) -> JT.JTFloat: 
+        def f(index: int) -> JT.JTFloat:
             return JT.JTFloat(self,index,tags,[])
-        return self.float_table.add(IT.get_key(tags,[]),f)
+        return self.float_table.add_rep(tags,[],f)
 
     def index_float_constant(self, v: float) -> int:
         tags = [ 'fc' ]
         args = [ self.index_float(float(v)) ]
-        def f(index: int, key: Tuple[str, str]) -> JT.JTFloatConstant: 
+        def f(index: int) -> JT.JTFloatConstant:
             return JT.JTFloatConstant(self,index,tags,args)
-        return self.jterm_table.add(IT.get_key(tags,args),f)
+        return self.jterm_table.add_rep(tags,args,f)
 
     def mk_float_constant(self, v: float) -> JT.JTFloatConstant:
         return cast(JT.JTFloatConstant, self.get_jterm(self.index_float_constant(v)))
@@ -118,9 +118,9 @@ class JTermDictionary(object):
     def index_constant_jterm(self, v: int) -> int:
         tags = ['c']
         args = [ self.index_numerical(v) ]
-        def f(index: int, key: Tuple[str, str]) -> JT.JTConstant: 
+        def f(index: int) -> JT.JTConstant:
             return JT.JTConstant(self,index,tags,args)
-        return self.jterm_table.add(IT.get_key(tags,args),f)
+        return self.jterm_table.add_rep(tags,args,f)
 
     def mk_constant_jterm(self, v: int) -> JT.JTermBase:
         return self.get_jterm(self.index_constant_jterm(v))
@@ -128,9 +128,9 @@ class JTermDictionary(object):
     def index_arithmetic_jterm(self, jt1: JT.JTermBase, jt2: JT.JTermBase, op: str) -> int:
         tags = [ 'ar', op ]
         args = [ jt1.index, jt2.index ]
-        def f(index: int, key: Tuple[str, str]) -> JT.JTArithmeticExpr: 
+        def f(index: int) -> JT.JTArithmeticExpr:
             return JT.JTArithmeticExpr(self,index,tags,args)
-        return self.jterm_table.add(IT.get_key(tags,args),f)
+        return self.jterm_table.add_rep(tags,args,f)
 
     def mk_arithmetic_jterm(self, jt1: JT.JTermBase, jt2: JT.JTermBase, op: str) -> JT.JTArithmeticExpr:
         return cast(JT.JTArithmeticExpr, self.get_jterm(self.index_arithmetic_jterm(jt1,jt2,op)))
@@ -163,64 +163,61 @@ class JTermDictionary(object):
         for (t,f) in self.tables:
             t.reset()
             f(UF.safe_find(xnode, t.name, t.name + ' missing from xml'))
+
+    def initialize_tables(self, get_table: Callable[[str], IT.TableNode]) -> None:
+        for (t,f) in self.tables:
+            t.reset()
+            f(get_table(t.name))
            
-    def _read_xml_string_table(self, txnode: Optional[ET.Element]) -> None:
-        def get_value(node: ET.Element) -> JT.JTStringConstant:
-            rep = IT.get_rep(node)
+    def _read_xml_string_table(self, txnode: Optional[IT.TableNode]) -> None:
+        def get_value(rep: IT.TableRep) -> JT.JTStringConstant:
             args = (self,) + rep
             return JT.JTStringConstant(*args)
         self.string_table.read_xml(txnode,'n',get_value)
 
-    def _read_xml_symbolic_jterm_constant_table(self, txnode: Optional[ET.Element]) -> None:
-        def get_value(node: ET.Element) -> JT.JTSymbolicJTermConstant:
-            rep = IT.get_rep(node)
+    def _read_xml_symbolic_jterm_constant_table(self, txnode: Optional[IT.TableNode]) -> None:
+        def get_value(rep: IT.TableRep) -> JT.JTSymbolicJTermConstant:
             args = (self,) + rep
             return JT.JTSymbolicJTermConstant(*args)
         self.symbolic_jterm_constant_table.read_xml(txnode,'n',get_value)
 
-    def _read_xml_numerical_table(self, txnode: Optional[ET.Element]) -> None:
-        def get_value(node: ET.Element) -> JT.JTNumerical:
-            rep = IT.get_rep(node)
+    def _read_xml_numerical_table(self, txnode: Optional[IT.TableNode]) -> None:
+        def get_value(rep: IT.TableRep) -> JT.JTNumerical:
             args = (self,) + rep
             return JT.JTNumerical(*args)
         self.numerical_table.read_xml(txnode,'n',get_value)
 
-    def _read_xml_float_table(self, txnode: Optional[ET.Element]) -> None:
-        def get_value(node: ET.Element) -> JT.JTFloat:
-            rep = IT.get_rep(node)
+    def _read_xml_float_table(self, txnode: Optional[IT.TableNode]) -> None:
+        def get_value(rep: IT.TableRep) -> JT.JTFloat:
             args = (self,) + rep
             return JT.JTFloat(*args)
         self.float_table.read_xml(txnode,'n',get_value)
 
-    def _read_xml_jterm_table(self, txnode: Optional[ET.Element]) -> None:
-        def get_value(node: ET.Element) -> JT.JTermBase:
-            return JTD.construct_jterm_dictionary_record(*((self,) + IT.get_rep(node)), JT.JTermBase)
+    def _read_xml_jterm_table(self, txnode: Optional[IT.TableNode]) -> None:
+        def get_value(rep: IT.TableRep) -> JT.JTermBase:
+            return JTD.construct_jterm_dictionary_record(*((self,) + rep), JT.JTermBase)
         self.jterm_table.read_xml(txnode,'n',get_value)
 
-    def _read_xml_relational_expr_table(self, txnode: Optional[ET.Element]) -> None:
-        def get_value(node: ET.Element) -> JT.JTRelationalExpr:
-            rep = IT.get_rep(node)
+    def _read_xml_relational_expr_table(self, txnode: Optional[IT.TableNode]) -> None:
+        def get_value(rep: IT.TableRep) -> JT.JTRelationalExpr:
             args = (self,) + rep
             return JT.JTRelationalExpr(*args)
         self.relational_expr_table.read_xml(txnode,'n',get_value)
 
-    def _read_xml_jterm_list_table(self, txnode: Optional[ET.Element]) -> None:
-        def get_value(node: ET.Element) -> JT.JTermList:
-            rep = IT.get_rep(node)
+    def _read_xml_jterm_list_table(self, txnode: Optional[IT.TableNode]) -> None:
+        def get_value(rep: IT.TableRep) -> JT.JTermList:
             args = (self,) + rep
             return JT.JTermList(*args)
         self.jterm_list_table.read_xml(txnode,'n',get_value)
 
-    def _read_xml_relational_expr_list_table(self, txnode: Optional[ET.Element]) -> None:
-        def get_value(node: ET.Element) -> JT.JTRelationalExprList:
-            rep = IT.get_rep(node)
+    def _read_xml_relational_expr_list_table(self, txnode: Optional[IT.TableNode]) -> None:
+        def get_value(rep: IT.TableRep) -> JT.JTRelationalExprList:
             args = (self,) + rep
             return JT.JTRelationalExprList(*args)
         self.relational_expr_list_table.read_xml(txnode,'n',get_value)
 
-    def _read_xml_jterm_range_table(self, txnode: Optional[ET.Element]) -> None:
-        def get_value(node: ET.Element) -> JT.JTermRange:
-            rep = IT.get_rep(node)
+    def _read_xml_jterm_range_table(self, txnode: Optional[IT.TableNode]) -> None:
+        def get_value(rep: IT.TableRep) -> JT.JTermRange:
             args = (self,) + rep
             return JT.JTermRange(*args)
         self.jterm_range_table.read_xml(txnode,'n',get_value)
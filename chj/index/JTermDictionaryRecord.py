@@ -37,6 +37,8 @@ if TYPE_CHECKING:
 class JTermDictionaryRecord(IT.IndexedTableValue):
     """Base class for all objects kept in the JDictionary."""
 
+    __slots__ = ("args", "jtd", "tags")
+
     def __init__(self,
             jtd: "JTermDictionary",
             index: int,
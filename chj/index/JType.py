@@ -38,13 +38,14 @@ if TYPE_CHECKING:
 
 class JavaTypesBase(JD.JDictionaryRecord):
 
+    __slots__ = ()
+
     def __init__(self,
             tpd: "JTypeDictionary",
             index: int,
             tags: List[str],
             args: List[int]):
         JD.JDictionaryRecord.__init__(self,tpd,index,tags,args)
-        self.tpd = tpd
 
     def get_scalar_size(self) -> int: return 4
 
@@ -57,6 +58,8 @@ class JavaTypesBase(JD.JDictionaryRecord):
     def __str__(self) -> str: return 'javatypesbase'
 
 class StringConstant(JavaTypesBase):
+
+    __slots__ = ()
     
     def __init__(self,
             tpd: "JTypeDictionary",
@@ -83,6 +86,8 @@ class StringConstant(JavaTypesBase):
 
 class BootstrapMethodData(JavaTypesBase):
 
+    __slots__ = ()
+
     def __init__(self,
             tpd: "JTypeDictionary",
             index: int,
@@ -67,28 +67,27 @@ from typing import Any, cast, Callable, Dict, Optional, List, Union, Tuple, Type
 if TYPE_CHECKING:
     from chj.app.JavaMethod import JavaMethod
     from chj.index.DataDictionary import DataDictionary
-    from collections.abc import ValuesView
 
 class JTypeDictionary(object):
 
-    def __init__(self, jd: "DataDictionary", xnode: ET.Element):
+    def __init__(self, jd: "DataDictionary", xnode: Optional[ET.Element]):
         self.jd = jd
-        self.string_table: IndexedTable[JT.StringConstant] = IndexedTable('string-table')
-        self.class_name_table: IndexedTable[Classname] = IndexedTable('class-name-table')
-        self.object_type_table: IndexedTable[JObjectTypeBase] = IndexedTable('object-type-table')
-        self.value_type_table: IndexedTable[JValueTypeBase] = IndexedTable('value-type-table')
-        self.method_descriptor_table: IndexedTable[MethodDescriptor] = IndexedTable('method-descriptor-table')
-        self.descriptor_table: IndexedTable[JMethodDescriptorTypeBase] = IndexedTable('descriptor-table')
-        self.field_signature_data_table: IndexedTable[FieldSignature] = IndexedTable('field-signature-data-table')
-        self.method_signature_data_table: IndexedTable[MethodSignature] = IndexedTable('method-signature-data-table')
-        self.class_field_signature_data_table: IndexedTable[ClassFieldSignature] = IndexedTable('class-field-signature-data-table')
-        self.class_method_signature_data_table: IndexedTable[ClassMethodSignature] = IndexedTable('class-method-signature-data-table')
-        self.constant_value_table: IndexedTable[JConstValueTypeBase] = IndexedTable('constant-value-table')
-        self.method_handle_type_table: IndexedTable[JMethodHandleTypeBase] = IndexedTable('method-handle-type-table')
-        self.constant_table: IndexedTable[JConstTypeBase] = IndexedTable('constant-table')
-        self.bootstrap_argument_table: IndexedTable[JBootstrapArgumentTypeBase] = IndexedTable('bootstrap-argument-table')
-        self.bootstrap_method_data_table: IndexedTable[JT.BootstrapMethodData] = IndexedTable('bootstrap-method-data-table')
-        self.tables: List[Tuple[IndexedTableSuperclass, Callable[[ET.Element], None]]] = [
+        self.string_table: IndexedTable[JT.StringConstant] = IT.mk_indexed_table('string-table')
+        self.class_name_table: IndexedTable[Classname] = IT.mk_indexed_table('class-name-table')
+        self.object_type_table: IndexedTable[JObjectTypeBase] = IT.mk_indexed_table('object-type-table')
+        self.value_type_table: IndexedTable[JValueTypeBase] = IT.mk_indexed_table('value-type-table')
+        self.method_descriptor_table: IndexedTable[MethodDescriptor] = IT.mk_indexed_table('method-descriptor-table')
+        self.descriptor_table: IndexedTable[JMethodDescriptorTypeBase] = IT.mk_indexed_table('descriptor-table')
+        self.field_signature_data_table: IndexedTable[FieldSignature] = IT.mk_indexed_table('field-signature-data-table')
+        self.method_signature_data_table: IndexedTable[MethodSignature] = IT.mk_indexed_table('method-signature-data-table')
+        self.class_field_signature_data_table: IndexedTable[ClassFieldSignature] = IT.mk_indexed_table('class-field-signature-data-table')
+        self.class_method_signature_data_table: IndexedTable[ClassMethodSignature] = IT.mk_indexed_table('class-method-signature-data-table')
+        self.constant_value_table: IndexedTable[JConstValueTypeBase] = IT.mk_indexed_table('constant-value-table')
+        self.method_handle_type_table: IndexedTable[JMethodHandleTypeBase] = IT.mk_indexed_table('method-handle-type-table')
+        self.constant_table: IndexedTable[JConstTypeBase] = IT.mk_indexed_table('constant-table')
+        self.bootstrap_argument_table: IndexedTable[JBootstrapArgumentTypeBase] = IT.mk_indexed_table('bootstrap-argument-table')
+        self.bootstrap_method_data_table: IndexedTable[JT.BootstrapMethodData] = IT.mk_indexed_table('bootstrap-method-data-table')
+        self.tables: List[Tuple[IndexedTableSuperclass, Callable[[Optional[IT.TableNode]], None]]] = [
             (self.string_table, self._read_xml_string_table),
             (self.class_name_table, self._read_xml_class_name_table),
             (self.object_type_table, self._read_xml_object_type_table),
@@ -106,11 +105,11 @@ class JTypeDictionary(object):
             (self.bootstrap_method_data_table, self._read_xml_bootstrap_method_data_table) ]
         self.initialize(xnode)
 
-    def get_fields(self) -> "ValuesView[ClassFieldSignature]":
-        return self.class_field_signature_data_table.indextable.values()
+    def get_fields(self) -> List[ClassFieldSignature]:
+        return self.class_field_signature_data_table.values()
 
-    def get_methods(self) -> "ValuesView[ClassMethodSignature]":
-        return self.class_method_signature_data_table.indextable.values()
+    def get_methods(self) -> List[ClassMethodSignature]:
+        return self.class_method_signature_data_table.values()
 
     def get_string(self, ix: int) -> JT.StringConstant: return self.string_table.retrieve(ix)
 
@@ -173,95 +172,92 @@ class JTypeDictionary(object):
         for (t,f) in self.tables:
             t.reset()
             f(UF.safe_find(xnode, t.name, t.name + ' missing from xml'))
+
+    def initialize_tables(self, get_table: Callable[[str], IT.TableNode]) -> None:
+        for (t,f) in self.tables:
+            t.reset()
+            f(get_table(t.name))
            
-    def _read_xml_string_table(self, txnode: Optional[ET.Element]) -> None:
-        def get_value(node: ET.Element) -> JT.StringConstant:
-            rep = IT.get_rep(node)
+    def _read_xml_string_table(self, txnode: Optional[IT.TableNode]) -> None:
+        def get_value(rep: IT.TableRep) -> JT.StringConstant:
             args = (self,) + rep
             return JT.StringConstant(*args)
         self.string_table.read_xml(txnode,'n',get_value)
 
-    def _read_xml_class_name_table(self, txnode: Optional[ET.Element]) -> None:
-        def get_value(node: ET.Element) -> Classname:
-            rep = IT.get_rep(node)
+    def _read_xml_class_name_table(self, txnode: Optional[IT.TableNode]) -> None:
+        def get_value(rep: IT.TableRep) -> Classname:
             args = (self,) + rep
             return Classname(*args)
         self.class_name_table.read_xml(txnode,'n',get_value)
 
-    def _read_xml_object_type_table(self, txnode: Optional[ET.Element]) -> None:
-        def get_value(node: ET.Element) -> JObjectTypeBase:
-            return JD.construct_j_dictionary_record(*((self,) + IT.get_rep(node)), JObjectTypeBase)
+    def _read_xml_object_type_table(self, txnode: Optional[IT.TableNode]) -> None:
+        def get_value(rep: IT.TableRep) -> JObjectTypeBase:
+            return JD.construct_j_dictionary_record(*((self,) + rep), JObjectTypeBase)
             
         self.object_type_table.read_xml(txnode,'n',get_value)
 
-    def _read_xml_value_type_table(self, txnode: Optional[ET.Element]) -> None:
-        def get_value(node: ET.Element) -> JValueTypeBase:
-            return JD.construct_j_dictionary_record(*((self,) + IT.get_rep(node)), JValueTypeBase)
+    def _read_xml_value_type_table(self, txnode: Optional[IT.TableNode]) -> None:
+        def get_value(rep: IT.TableRep) -> JValueTypeBase:
+            return JD.construct_j_dictionary_record(*((self,) + rep), JValueTypeBase)
         self.value_type_table.read_xml(txnode,'n',get_value)
 
-    def _read_xml_method_descriptor_table(self, txnode: Optional[ET.Element]) -> None:
-        def get_value(node: ET.Element) -> MethodDescriptor:
-            rep = IT.get_rep(node)
+    def _read_xml_method_descriptor_table(self, txnode: Optional[IT.TableNode]) -> None:
+        def get_value(rep: IT.TableRep) -> MethodDescriptor:
             args = (self,) + rep
             return MethodDescriptor(*args)
         self.method_descriptor_table.read_xml(txnode,'n',get_value)
 
-    def _read_xml_field_signature_data_table(self, txnode: Optional[ET.Element]) -> None:
-        def get_value(node: ET.Element) -> FieldSignature:
-            rep = IT.get_rep(node)
+    def _read_xml_field_signature_data_table(self, txnode: Optional[IT.TableNode]) -> None:
+        def get_value(rep: IT.TableRep) -> FieldSignature:
             args = (self,) + rep
             return FieldSignature(*args)
         self.field_signature_data_table.read_xml(txnode,'n',get_value)
 
-    def _read_xml_class_field_signature_data_table(self, txnode: Optional[ET.Element]) -> None:
-        def get_value(node: ET.Element) -> ClassFieldSignature:
-            rep = IT.get_rep(node)
+    def _read_xml_class_field_signature_data_table(self, txnode: Optional[IT.TableNode]) -> None:
+        def get_value(rep: IT.TableRep) -> ClassFieldSignature:
             args = (self,) + rep
             return ClassFieldSignature(*args)
         self.class_field_signature_data_table.read_xml(txnode,'n',get_value)
 
-    def _read_xml_method_signature_data_table(self, txnode: Optional[ET.Element]) -> None:
-        def get_value(node: ET.Element) -> MethodSignature:
-            rep = IT.get_rep(node)
+    def _read_xml_method_signature_data_table(self, txnode: Optional[IT.TableNode]) -> None:
+        def get_value(rep: IT.TableRep) -> MethodSignature:
             args = (self,) + rep
             return MethodSignature(*args)
         self.method_signature_data_table.read_xml(txnode,'n',get_value)
 
-    def _read_xml_class_method_signature_data_table(self,txnode: Optional[ET.Element]) -> None:
-        def get_value(node: ET.Element) -> ClassMethodSignature:
-            rep = IT.get_rep(node)
+    def _read_xml_class_method_signature_data_table(self,txnode: Optional[IT.TableNode]) -> None:
+        def get_value(rep: IT.TableRep) -> ClassMethodSignature:
             args = (self,) + rep
             return ClassMethodSignature(*args)
         self.class_method_signature_data_table.read_xml(txnode,'n',get_value)            
 
-    def _read_xml_descriptor_table(self, txnode: Optional[ET.Element]) -> None:
-        def get_value(node: ET.Element) -> JMethodDescriptorTypeBase:
-            return JD.construct_j_dictionary_record(*((self,) + IT.get_rep(node)), JMethodDescriptorTypeBase)
+    def _read_xml_descriptor_table(self, txnode: Optional[IT.TableNode]) -> None:
+        def get_value(rep: IT.TableRep) -> JMethodDescriptorTypeBase:
+            return JD.construct_j_dictionary_record(*((self,) + rep), JMethodDescriptorTypeBase)
         self.descriptor_table.read_xml(txnode,'n',get_value)
 
-    def _read_xml_constant_value_table(self, txnode: Optional[ET.Element]) -> None:
-        def get_value(node: ET.Element) -> JConstValueTypeBase:
-            return JD.construct_j_dictionary_record(*((self,) + IT.get_rep(node)), JConstValueTypeBase)
+    def _read_xml_constant_value_table(self, txnode: Optional[IT.TableNode]) -> None:
+        def get_value(rep: IT.TableRep) -> JConstValueTypeBase:
+            return JD.construct_j_dictionary_record(*((self,) + rep), JConstValueTypeBase)
         self.constant_value_table.read_xml(txnode,'n',get_value)
 
-    def _read_xml_method_handle_type_table(self, txnode: Optional[ET.Element]) -> None:
-        def get_value(node: ET.Element) -> JMethodHandleTypeBase:
-            return JD.construct_j_dictionary_record(*((self,) + IT.get_rep(node)), JMethodHandleTypeBase)
+    def _read_xml_method_handle_type_table(self, txnode: Optional[IT.TableNode]) -> None:
+        def get_value(rep: IT.TableRep) -> JMethodHandleTypeBase:
+            return JD.construct_j_dictionary_record(*((self,) + rep), JMethodHandleTypeBase)
         self.method_handle_type_table.read_xml(txnode,'n',get_value)
 
-    def _read_xml_constant_table(self, txnode: Optional[ET.Element]) -> None:
-        def get_value(node: ET.Element) -> JConstTypeBase:
-            return JD.construct_j_dictionary_record(*((self,) + IT.get_rep(node)), JConstTypeBase)
+    def _read_xml_constant_table(self, txnode: Optional[IT.TableNode]) -> None:
+        def get_value(rep: IT.TableRep) -> JConstTypeBase:
+            return JD.construct_j_dictionary_record(*((self,) + rep), JConstTypeBase)
         self.constant_table.read_xml(txnode,'n',get_value)
 
-    def _read_xml_bootstrap_argument_table(self, txnode: Optional[ET.Element]) -> None:
-        def get_value(node: ET.Element) -> JBootstrapArgumentTypeBase:
-            return JD.construct_j_dictionary_record(*((self,) + IT.get_rep(node)), JBootstrapArgumentTypeBase)
+    def _read_xml_bootstrap_argument_table(self, txnode: Optional[IT.TableNode]) -> None:
+        def get_value(rep: IT.TableRep) -> JBootstrapArgumentTypeBase:
+            return JD.construct_j_dictionary_record(*((self,) + rep), JBootstrapArgumentTypeBase)
         self.bootstrap_argument_table.read_xml(txnode,'n',get_value)
 
-    def _read_xml_bootstrap_method_data_table(self, txnode: Optional[ET.Element]) -> None:
-        def get_value(node: ET.Element) -> JT.BootstrapMethodData:
-            rep = IT.get_rep(node)
+    def _read_xml_bootstrap_method_data_table(self, txnode: Optional[IT.TableNode]) -> None:
+        def get_value(rep: IT.TableRep) -> JT.BootstrapMethodData:
             args = (self,) + rep
             return JT.BootstrapMethodData(*args)
         self.bootstrap_method_data_table.read_xml(txnode,'n',get_value)
@@ -33,6 +33,9 @@ if TYPE_CHECKING:
     from chj.index.JTypeDictionary import JTypeDictionary
 
 class JTypeDictionaryRecord(IT.IndexedTableValue):
+
+    __slots__ = ("args", "jtd", "tags")
+
     def __init__(
         self,
         jtd: "JTypeDictionary",
@@ -37,6 +37,8 @@ if TYPE_CHECKING:
 
 class JValueTypeBase(JD.JDictionaryRecord):
 
+    __slots__ = ()
+
     def __init__(self,
             tpd: "JTypeDictionary",
             index: int,
@@ -69,6 +71,8 @@ class JValueTypeBase(JD.JDictionaryRecord):
 @JD.j_dictionary_record_tag("o")
 class ObjectValueType(JValueTypeBase):
 
+    __slots__ = ()
+
     def __init__(self,
             tpd: "JTypeDictionary",
             index: int,
@@ -97,6 +101,8 @@ class ObjectValueType(JValueTypeBase):
 @JD.j_dictionary_record_tag("b")
 class BasicValueType(JValueTypeBase):
 
+    __slots__ = ()
+
     def __init__(self,
             tpd: "JTypeDictionary",
             index: int,
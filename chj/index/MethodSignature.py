@@ -35,6 +35,8 @@ if TYPE_CHECKING:
 
 class MethodSignature(JavaTypesBase):
 
+    __slots__ = ("descriptor", "isstatic", "name")
+
     def __init__(self, 
             tpd: "JTypeDictionary",
             index: int,
@@ -50,6 +52,8 @@ class MethodSignature(JavaTypesBase):
 
 class ClassMethodSignature(JavaTypesBase):
 
+    __slots__ = ("classname", "cnix", "methodname", "msix", "signature")
+
     def __init__(self,
             tpd: "JTypeDictionary",
             index: int,
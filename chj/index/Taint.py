@@ -37,19 +37,22 @@ if TYPE_CHECKING:
 
 class TaintBase(TD.TaintDictionaryRecord):
 
+    __slots__ = ()
+
     def __init__(self,
             ttd: "TaintDictionary",
             index: int,
             tags: List[str],
             args: List[int]):
         TD.TaintDictionaryRecord.__init__(self,ttd,index,tags,args)
-        self.ttd = ttd
 
     def __str__(self) -> str: return 'jdtaintbase'
 
 
 class TStringConstant(TaintBase):
 
+    __slots__ = ()
+
     def __init__(self,
             ttd: "TaintDictionary",
             index: int,
@@ -77,6 +80,8 @@ class TStringConstant(TaintBase):
 class TSymbol(TaintBase):
     '''Symbolic value.'''
 
+    __slots__ = ()
+
     def __init__(self,
             ttd: "TaintDictionary",
             index: int,
@@ -108,6 +113,8 @@ class TSymbol(TaintBase):
 class TVariable(TaintBase):
     '''CHIF variable.'''
 
+    __slots__ = ()
+
     def __init__(self,
             ttd: "TaintDictionary",
             index: int,
@@ -128,6 +135,8 @@ class TVariable(TaintBase):
 
 class TMethodTarget(TaintBase):
 
+    __slots__ = ()
+
     def __init__(self,
             ttd: "TaintDictionary",
             index: int,
@@ -148,6 +157,8 @@ class TMethodTarget(TaintBase):
 @TD.t_dictionary_record_tag("v")
 class VariableTaint(TaintBase):
 
+    __slots__ = ()
+
     def __init__(self,
             ttd: "TaintDictionary",
             index: int,
@@ -168,6 +179,8 @@ class VariableTaint(TaintBase):
 @TD.t_dictionary_record_tag("f")
 class FieldTaint(TaintBase):
 
+    __slots__ = ()
+
     def __init__(self,
             ttd: "TaintDictionary",
             index: int,
@@ -193,6 +206,8 @@ class FieldTaint(TaintBase):
 @TD.t_dictionary_record_tag("c")
 class CallerTaint(TaintBase):
 
+    __slots__ = ()
+
     def __init__(self,
             ttd: "TaintDictionary",
             index: int,
@@ -218,6 +233,8 @@ class CallerTaint(TaintBase):
 @TD.t_dictionary_record_tag("t")
 class TopTargetTaint(TaintBase):
 
+    __slots__ = ()
+
     def __init__(self,
             ttd: "TaintDictionary",
             index: int,
@@ -241,6 +258,8 @@ class TopTargetTaint(TaintBase):
 @TD.t_dictionary_record_tag("s")
 class StubTaint(TaintBase):
 
+    __slots__ = ()
+
     def __init__(self,
             ttd: "TaintDictionary",
             index: int,
@@ -262,6 +281,8 @@ class StubTaint(TaintBase):
 
 class TaintOriginList(TaintBase):
 
+    __slots__ = ()
+
     def __init__(self,
             ttd: "TaintDictionary",
             index: int,
@@ -278,6 +299,8 @@ class TaintOriginList(TaintBase):
 
 class TaintedVariable(TaintBase):
 
+    __slots__ = ()
+
     def __init__(self,
             ttd: "TaintDictionary",
             index: int,
@@ -297,6 +320,8 @@ class TaintedVariable(TaintBase):
 
 class TaintedVariableIds(TaintBase):
 
+    __slots__ = ()
+
     def __init__(self,
             ttd: "TaintDictionary",
             index: int,
@@ -313,6 +338,8 @@ class TaintedVariableIds(TaintBase):
 
 class TaintNodeBase(TaintBase):
 
+    __slots__ = ()
+
     def __init__(self,
             ttd: "TaintDictionary",
             index: int,
@@ -330,6 +357,8 @@ class TaintNodeBase(TaintBase):
 @TD.t_dictionary_record_tag("f")
 class FieldTaintNode(TaintNodeBase):
 
+    __slots__ = ()
+
     def __init__(self,
             ttd: "TaintDictionary",
             index: int,
@@ -347,6 +376,8 @@ class FieldTaintNode(TaintNodeBase):
 @TD.t_dictionary_record_tag("v")
 class VariableTaintNode(TaintNodeBase):
 
+    __slots__ = ()
+
     def __init__(self,
             ttd: "TaintDictionary",
             index: int,
@@ -376,6 +407,8 @@ class VariableTaintNode(TaintNodeBase):
 @TD.t_dictionary_record_tag("q")
 class VariableEqTaintNode(TaintNodeBase):
 
+    __slots__ = ()
+
     def __init__(self,
             ttd: "TaintDictionary",
             index: int,
@@ -404,6 +437,8 @@ class VariableEqTaintNode(TaintNodeBase):
 @TD.t_dictionary_record_tag("c")
 class CallTaintNode(TaintNodeBase):
 
+    __slots__ = ()
+
     def __init__(self,
             ttd: "TaintDictionary",
             index: int,
@@ -434,6 +469,8 @@ class CallTaintNode(TaintNodeBase):
 @TD.t_dictionary_record_tag("u")
 class UnknownCallTaintNode(TaintNodeBase):
 
+    __slots__ = ()
+
     def __init__(self,
             ttd: "TaintDictionary",
             index: int,
@@ -456,6 +493,8 @@ class UnknownCallTaintNode(TaintNodeBase):
 @TD.t_dictionary_record_tag("o")
 class ObjectFieldTaintNode(TaintNodeBase):
 
+    __slots__ = ()
+
     def __init__(self,
             ttd: "TaintDictionary",
             index: int,
@@ -483,6 +522,8 @@ class ObjectFieldTaintNode(TaintNodeBase):
 @TD.t_dictionary_record_tag("j")
 class ConditionalTaintNode(TaintNodeBase):
 
+    __slots__ = ()
+
     def __init__(self,
             ttd: "TaintDictionary",
             index: int,
@@ -507,6 +548,8 @@ class ConditionalTaintNode(TaintNodeBase):
 @TD.t_dictionary_record_tag("s")
 class SizeTaintNode(TaintNodeBase):
 
+    __slots__ = ()
+
     def __init__(self,
             ttd: "TaintDictionary",
             index: int,
@@ -534,6 +577,8 @@ class SizeTaintNode(TaintNodeBase):
 @TD.t_dictionary_record_tag("r")
 class RefEqualTaintNode(TaintNodeBase):
 
+    __slots__ = ()
+
     def __init__(self,
             ttd: "TaintDictionary",
             index: int,
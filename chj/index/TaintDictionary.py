@@ -44,20 +44,25 @@ if TYPE_CHECKING:
     from collections.abc import ValuesView
     from chj.index.DataDictionary import DataDictionary
 
+# tag of a taint node type -> position in its args of the cmsix of the method
+# the node belongs to
+METHOD_TAINT_NODE_CALLER_ARG: Dict[str, int] = {
+    'v': 0, 'q': 0, 'c': 2, 'u': 2, 'o': 0, 'j': 0, 's': 0 }
+
 class TaintDictionary(object):
 
-    def __init__(self, jd: "DataDictionary", xnode: ET.Element):
+    def __init__(self, jd: "DataDictionary", xnode: Optional[ET.Element]):
         self.jd = jd                  # DataDictionary
-        self.string_table: IT.IndexedTable[T.TStringConstant] = IT.IndexedTable('string-table')
-        self.symbol_table: IT.IndexedTable[T.TSymbol] = IT.IndexedTable('symbol-table')
-        self.variable_table: IT.IndexedTable[T.TVariable] = IT.IndexedTable('variable-table')
-        self.method_target_table: IT.IndexedTable[T.TMethodTarget] = IT.IndexedTable('method-target-table')
-        self.taint_origin_table: IT.IndexedTable[T.TaintBase] = IT.IndexedTable('taint-origin-table')
-        self.taint_origin_list_table: IT.IndexedTable[T.TaintOriginList] = IT.IndexedTable('taint-origin-list-table')
-        self.tainted_variable_table: IT.IndexedTable[T.TaintedVariable] = IT.IndexedTable('tainted-variable-table')
-        self.tainted_variable_ids_table: IT.IndexedTable[T.TaintedVariableIds] = IT.IndexedTable('tainted-variable-ids-table')
-        self.taint_node_type_table: IT.IndexedTable[T.TaintNodeBase] = IT.IndexedTable('taint-node-type-table')
-        self.tables: List[Tuple[IT.IndexedTableSuperclass, Callable[[ET.Element], None]]] = [
+        self.string_table: IT.IndexedTable[T.TStringConstant] = IT.mk_indexed_table('string-table')
+        self.symbol_table: IT.IndexedTable[T.TSymbol] = IT.mk_indexed_table('symbol-table')
+        self.variable_table: IT.IndexedTable[T.TVariable] = IT.mk_indexed_table('variable-table')
+        self.method_target_table: IT.IndexedTable[T.TMethodTarget] = IT.mk_indexed_table('method-target-table')
+        self.taint_origin_table: IT.IndexedTable[T.TaintBase] = IT.mk_indexed_table('taint-origin-table')
+        self.taint_origin_list_table: IT.IndexedTable[T.TaintOriginList] = IT.mk_indexed_table('taint-origin-list-table')
+        self.tainted_variable_table: IT.IndexedTable[T.TaintedVariable] = IT.mk_indexed_table('tainted-variable-table')
+        self.tainted_variable_ids_table: IT.IndexedTable[T.TaintedVariableIds] = IT.mk_indexed_table('tainted-variable-ids-table')
+        self.taint_node_type_table: IT.IndexedTable[T.TaintNodeBase] = IT.mk_indexed_table('taint-node-type-table')
+        self.tables: List[Tuple[IT.IndexedTableSuperclass, Callable[[Optional[IT.TableNode]], None]]] = [
             (self.string_table, self._read_xml_string_table),
             (self.symbol_table, self._read_xml_symbol_table),
             (self.variable_table, self._read_xml_variable_table),
@@ -68,6 +73,7 @@ class TaintDictionary(object):
             (self.tainted_variable_ids_table, self._read_xml_tainted_variable_ids_table),
             (self.taint_node_type_table, self._read_xml_taint_node_type_table)
             ]
+        self.methodtaintnodes: Optional[Dict[int, Dict[str, List[int]]]] = None      # cmsix -> tag -> node indices
         self.initialize(xnode)
 
     def get_string(self, ix: int) -> T.TStringConstant:
@@ -103,13 +109,22 @@ class TaintDictionary(object):
     def iter_taint_node_types(self, f: Callable[[int, T.TaintNodeBase], None]) -> None:
         self.taint_node_type_table.iter(f)
 
-    def iter_var_taint_node_types(self,f: Callable[[int, T.VariableTaintNode], None]) -> None:
-        def g(i: Any, n: T.TaintNodeBase) -> None:
-            if n.is_var():
-                n = cast(T.VariableTaintNode, n)
-                f(i,n)
-            else: pass
-        self.iter_taint_node_types(g)
+    def get_method_taint_nodes(self, cmsix: int, tags: List[str]) -> List[T.TaintNodeBase]:
+        '''returns the taint node types with the given tags that belong to method cmsix'''
+        methodnodes = self._get_method_taint_nodes().get(cmsix, {})
+        indices: List[int] = []
+        for tag in tags:
+            indices.extend(methodnodes.get(tag, []))
+        return [ self.get_taint_node_type(ix) for ix in sorted(indices) ]
+
+    def get_method_var_taint_nodes(self, cmsix: int) -> List[T.VariableTaintNode]:
+        return cast(List[T.VariableTaintNode], self.get_method_taint_nodes(cmsix, [ 'v' ]))
+
+    def get_method_call_taint_nodes(self, cmsix: int) -> List[T.TaintNodeBase]:
+        return self.get_method_taint_nodes(cmsix, [ 'c', 'u' ])
+
+    def get_method_field_taint_nodes(self, cmsix: int) -> List[T.ObjectFieldTaintNode]:
+        return cast(List[T.ObjectFieldTaintNode], self.get_method_taint_nodes(cmsix, [ 'o' ]))
 
     def read_xml_tainted_variable_ids(self,
             node:ET.Element,
@@ -134,67 +149,77 @@ class TaintDictionary(object):
  
     def initialize(self, xnode: Optional[ET.Element], force: bool=False) -> None:
         if xnode is None: return
+        self.methodtaintnodes = None
         for (t,f) in self.tables:
             t.reset()
             f(UF.safe_find(xnode, t.name, t.name + ' missing from xml'))
+
+    def initialize_tables(self, get_table: Callable[[str], IT.TableNode]) -> None:
+        self.methodtaintnodes = None
+        for (t,f) in self.tables:
+            t.reset()
+            f(get_table(t.name))
+
+    def _get_method_taint_nodes(self) -> Dict[int, Dict[str, List[int]]]:
+        if self.methodtaintnodes is None:
+            methodtaintnodes: Dict[int, Dict[str, List[int]]] = {}
+            for (index, tags, args) in self.taint_node_type_table.iter_reps():
+                if len(tags) > 0 and tags[0] in METHOD_TAINT_NODE_CALLER_ARG:
+                    cmsix = args[METHOD_TAINT_NODE_CALLER_ARG[tags[0]]]
+                    methodtaintnodes.setdefault(cmsix, {}).setdefault(tags[0], []).append(index)
+            self.methodtaintnodes = methodtaintnodes
+        return self.methodtaintnodes
            
-    def _read_xml_string_table(self, txnode: ET.Element) -> None:
-        def get_value(node: ET.Element) -> T.TStringConstant:
-            rep = IT.get_rep(node)
+    def _read_xml_string_table(self, txnode: Optional[IT.TableNode]) -> None:
+        def get_value(rep: IT.TableRep) -> T.TStringConstant:
             args = (self,) + rep
             return T.TStringConstant(*args)
         self.string_table.read_xml(txnode,'n',get_value)
 
-    def _read_xml_symbol_table(self, txnode: ET.Element) -> None:
-        def get_value(node: ET.Element) -> T.TSymbol:
-            rep = IT.get_rep(node)
+    def _read_xml_symbol_table(self, txnode: Optional[IT.TableNode]) -> None:
+        def get_value(rep: IT.TableRep) -> T.TSymbol:
             args = (self,) + rep
             return T.TSymbol(*args)
         self.symbol_table.read_xml(txnode,'n',get_value)
 
-    def _read_xml_variable_table(self, txnode: ET.Element) -> None:
-        def get_value(node: ET.Element) -> T.TVariable:
-            rep = IT.get_rep(node)
+    def _read_xml_variable_table(self, txnode: Optional[IT.TableNode]) -> None:
+        def get_value(rep: IT.TableRep) -> T.TVariable:
             args = (self,) + rep
             return T.TVariable(*args)
         self.variable_table.read_xml(txnode,'n',get_value)
 
-    def _read_xml_method_target_table(self, txnode: ET.Element) -> None:
-        def get_value(node: ET.Element) -> T.TMethodTarget:
-            rep = IT.get_rep(node)
+    def _read_xml_method_target_table(self, txnode: Optional[IT.TableNode]) -> None:
+        def get_value(rep: IT.TableRep) -> T.TMethodTarget:
             args = (self,) + rep
             return T.TMethodTarget(*args)
         self.method_target_table.read_xml(txnode,'n',get_value)
 
-    def _read_xml_taint_origin_table(self, txnode: ET.Element) -> None:
-        def get_value(node: ET.Element) -> T.TaintBase:
-            return TD.construct_t_dictionary_record(*((self,) + IT.get_rep(node)), T.TaintBase)
+    def _read_xml_taint_origin_table(self, txnode: Optional[IT.TableNode]) -> None:
+        def get_value(rep: IT.TableRep) -> T.TaintBase:
+            return TD.construct_t_dictionary_record(*((self,) + rep), T.TaintBase)
         self.taint_origin_table.read_xml(txnode,'n',get_value)
 
-    def _read_xml_taint_origin_list_table(self, txnode: ET.Element) -> None:
-        def get_value(node: ET.Element) -> T.TaintOriginList:
-            rep = IT.get_rep(node)
+    def _read_xml_taint_origin_list_table(self, txnode: Optional[IT.TableNode]) -> None:
+        def get_value(rep: IT.TableRep) -> T.TaintOriginList:
             args = (self,) + rep
             return T.TaintOriginList(*args)
         self.taint_origin_list_table.read_xml(txnode,'n',get_value)
 
-    def _read_xml_tainted_variable_table(self, txnode:ET.Element) -> None:
-        def get_value(node: ET.Element) -> T.TaintedVariable:
-            rep = IT.get_rep(node)
+    def _read_xml_tainted_variable_table(self, txnode:Optional[IT.TableNode]) -> None:
+        def get_value(rep: IT.TableRep) -> T.TaintedVariable:
             args = (self,) + rep
             return T.TaintedVariable(*args)
         self.tainted_variable_table.read_xml(txnode,'n',get_value)
 
-    def _read_xml_tainted_variable_ids_table(self, txnode: ET.Element) -> None:
-        def get_value(node: ET.Element) -> T.TaintedVariableIds:
-            rep = IT.get_rep(node)
+    def _read_xml_tainted_variable_ids_table(self, txnode: Optional[IT.TableNode]) -> None:
+        def get_value(rep: IT.TableRep) -> T.TaintedVariableIds:
             args = (self,) + rep
             return T.TaintedVariableIds(*args)
         self.tainted_variable_ids_table.read_xml(txnode,'n',get_value)
 
-    def _read_xml_taint_node_type_table(self, txnode: ET.Element) -> None:
-        def get_value(node: ET.Element) -> T.TaintNodeBase:
-            return TD.construct_t_dictionary_record(*((self,) + IT.get_rep(node)), T.TaintNodeBase)
+    def _read_xml_taint_node_type_table(self, txnode: Optional[IT.TableNode]) -> None:
+        def get_value(rep: IT.TableRep) -> T.TaintNodeBase:
+            return TD.construct_t_dictionary_record(*((self,) + rep), T.TaintNodeBase)
         self.taint_node_type_table.read_xml(txnode,'n',get_value)
 
         
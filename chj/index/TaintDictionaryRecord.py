@@ -33,6 +33,9 @@ if TYPE_CHECKING:
     from chj.index.TaintDictionary import TaintDictionary
 
 class TaintDictionaryRecord(IT.IndexedTableValue):
+
+    __slots__ = ("args", "tags", "ttd")
+
     def __init__(
         self,
         ttd: "TaintDictionary",
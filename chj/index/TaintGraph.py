@@ -47,11 +47,13 @@ class TaintGraph():
             appname: str,
             taintsourceid: str,
             loops: bool=False,
-            sink: Optional[str]=None) -> None:
+            sink: Optional[str]=None,
+            witnesses: int=0) -> None:
         self.app = app                   # AppAccess
         self.jd = self.app.jd            # DataDictionary
         self.loops = loops
         self.sink = sink
+        self.witnesses = witnesses       # number of shortest paths kept per sink (0: all paths)
 
         self.xnodes: "ET.Element"
         self.xedges: "ET.Element"
@@ -59,6 +61,7 @@ class TaintGraph():
         self.pathnodes: List[int] = []
         self.nodes: List[int] = []
         self.edges: List[Tuple[int, int]] = []
+        self.witnesspaths: Dict[int, List[List[int]]] = {}      # sink -> paths from the root
 
         self._build_graph(appname, taintsourceid)
 
@@ -76,17 +79,25 @@ class TaintGraph():
 
         self.nodes = [ UF.safe_get(n, 'ix', 'ix missing from xml', int) for n in self.xnodes.findall('tn') ]
 
+        nodes = set(self.nodes)
+        for j in self.xedges.findall('edge'):
+            src = UF.safe_get(j, 'src', 'src missing from xml', int)
+            if src in nodes:
+                tgts = [ int(x) for x in UF.safe_get(j, 'tgts', 'tgts missing from xml', str).split(',') ]
+                for tgt in tgts:
+                    if tgt in nodes:
+                        self.edges.append((src,tgt))
+
     def _get_root_node(self, nodes: List[int], enode: "ET.Element") -> int:
-        tgts = []
-        for en in enode.findall('edge'):
-            tgts.append(UF.safe_get(en, 'src', 'src missing from xml for taintgraph', int))
+        srcs = set([ UF.safe_get(en, 'src', 'src missing from xml for taintgraph', int)
+                     for en in enode.findall('edge') ])
         for n in nodes:
-            if not n in tgts:
+            if not n in srcs:
                 return n
         raise UF.CHJError("Root missing from TaintGraph")
 
     def _build_graph(self, appname: str, taintsourceid: str) -> None:
-        if self.jd.ttd is None:
+        if not self.jd.has_taint_results():
             raise UF.CHJError("Taint analysis results not found! Please create them first")
 
         self._get_edges(appname, taintsourceid)
@@ -102,6 +113,7 @@ class TaintGraph():
                     if self.sink in str(cms):
                         sinkids.append(n)
                 if len(sinkids) == 0:
+                    self.edges = []
                     return
 
             if self.loops:
@@ -110,52 +122,41 @@ class TaintGraph():
                     if cms.is_var() and str(cast(T.VariableTaintNode, cms).get_variable()) == 'lc':
                         sinkids.append(n)
 
-            edge_adjacencylists: Dict[int, List[int]] = {}
-            for m in self.xedges.findall('edge'):
-                src = UF.safe_get(m, 'src', 'src missing from xml', int)
-                tgts = [ int(x) for x in UF.safe_get(m, 'tgts', 'tgts missing from xml', str).split(',') ]
-                for t in tgts:
-                    edge_adjacencylists.setdefault(t,[])
-                    edge_adjacencylists[t].append(src)
-
+            # taint flows from the tgts of an edge to its src
+            successors: Dict[int, List[int]] = {}
+            predecessors: Dict[int, List[int]] = {}
+            for (src, tgt) in self.edges:
+                successors.setdefault(tgt, []).append(src)
+                predecessors.setdefault(src, []).append(tgt)
             srcid = self._get_root_node(self.nodes, self.xedges)
 
-            srcname = str(self.jd.ttd.get_taint_node_type(srcid))
-            for sinkid in sinkids:
-                sinkname = str(self.jd.ttd.get_taint_node_type(sinkid))
+            pathnodes = UG.get_path_nodes(
+                srcid, sinkids, lambda n: successors.get(n, []), lambda n: predecessors.get(n, []))
 
-            for sinkid in sinkids:
-                if sinkid in pathnodes: continue
-                g = UG.DirectedGraph(self.nodes,edge_adjacencylists)
-                g.find_paths(srcid,sinkid)
-                for p in g.paths:
-                    pathnodes = pathnodes.union(p)
+            if self.witnesses > 0:
+                slicesuccessors = lambda n: [ m for m in successors.get(n, []) if m in pathnodes ]
+                for sinkid in sinkids:
+                    if sinkid in pathnodes and not sinkid in self.witnesspaths:
+                        self.witnesspaths[sinkid] = UG.get_shortest_paths(
+                            srcid, sinkid, slicesuccessors, self.witnesses)
+                pathnodes = set([ n for paths in self.witnesspaths.values() for p in paths for n in p ])
 
         # if no restrictions include all nodes
         if len(pathnodes) == 0:
             pathnodes = set(self.nodes)
 
-        edges = []
-        for j in self.xedges.findall('edge'):
-            src = UF.safe_get(j, 'src', 'src missing from xml', int)
-            if src in self.nodes:
-                tgts = [ int(x) for x in UF.safe_get(j, 'tgts', 'tgts missing from xml', str).split(',') ]
-                for tgt in tgts:
-                    if tgt in self.nodes:
-                        edges.append((src,tgt))
-
         self.pathnodes = list(pathnodes)
-        self.edges = edges
         return
 
     def as_dot(self, taintsourceid: str) -> DotGraph:
-        if self.app.jd.ttd is None:
+        if not self.app.jd.has_taint_results():
             raise UF.CHJError("Taint analysis results not found! Please create them first")
 
         graphname = 'trail_' + str(taintsourceid)
         dotgraph = DotGraph(graphname)
+        pathnodes = set(self.pathnodes)
         for n in self.nodes:
-            if not n in self.pathnodes: continue
+            if not n in pathnodes: continue
             color = None
             cms = self.app.jd.ttd.get_taint_node_type(n)
             shaded = cms.is_call()
@@ -170,6 +171,6 @@ class TaintGraph():
                 color = 'yellow'
             dotgraph.add_node(str(n),str(cmslabel),shaded=shaded,fillcolor=color)
         for (src,tgt) in self.edges:
-            if src in self.pathnodes and tgt in self.pathnodes:
+            if src in pathnodes and tgt in pathnodes:
                 dotgraph.add_edge(str(tgt),str(src))
         return dotgraph 
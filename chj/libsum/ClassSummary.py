@@ -38,22 +38,21 @@ class ClassSummary(object):
 
     def __init__(self, jdkmodels: "JDKModels", xnode: "ET.Element"):
         self.jdkmodels = jdkmodels
-        self.xnode = xnode
-        self.name = self.xnode.get('name')
-        self.package = self.xnode.get('package')
+        self.name = xnode.get('name')
+        self.package = xnode.get('package')
         self.summaries: Dict[Tuple[str, str], MS.MethodSummary] = {}        # (name,signature-string) -> JMethodSummary
-        self._initialize()
+        self._initialize(xnode)
 
     def iter_method_summaries(self,f:Callable[[str, str, MS.MethodSummary], None]) -> None:
         for (name,ms) in self.summaries: f(name,ms,self.summaries[(name,ms)])
 
-    def _initialize(self) -> None:
-        xconstructors = self.xnode.find('constructors')
+    def _initialize(self, xnode: "ET.Element") -> None:
+        xconstructors = xnode.find('constructors')
         if not xconstructors is None:
             for xm in xconstructors.findall('constructor'):
                 c = MS.ConstructorSummary(self,xm)
                 self.summaries[ (c.get_name(), str(c.get_signature())) ] = c
-        xmethods = self.xnode.find('methods')
+        xmethods = xnode.find('methods')
         if not xmethods is None:
             for xm in xmethods.findall('method'):
                 m = MS.MethodSummary(self,xm)
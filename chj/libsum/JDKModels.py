@@ -89,15 +89,17 @@ class JDKModels():
     def _get_class_summary_xnode(self, classfilename: str) -> Optional[ET.Element]:
         errormsg = ' missing from xml for ' + classfilename
         try:
-            zfile = self.jdkjar.read(classfilename)
-            xnode = UF.safe_find(ET.fromstring(str(zfile)), 'header', 'header ' + errormsg)
+            root = UF.parse_xml_string(self.jdkjar.read(classfilename))
+            xnode = UF.safe_find(root, 'header', 'header ' + errormsg)
             if 'info' in xnode.attrib:
                 info = UF.safe_get(xnode, 'info', 'info ' + errormsg, str)
-                xnode = UF.safe_find(ET.fromstring(str(zfile)), info, 'info ' + errormsg)
+                xnode = UF.safe_find(root, info, 'info ' + errormsg)
             else:
-                xnode = UF.safe_find(ET.fromstring(str(zfile)), 'class', 'class ' + errormsg)
-                if xnode is None:
-                    xnode = UF.safe_find(ET.fromstring(str(zfile)), 'interface', 'interface ' + errormsg)
+                cnode = root.find('class')
+                if cnode is None:
+                    xnode = UF.safe_find(root, 'interface', 'interface ' + errormsg)
+                else:
+                    xnode = cnode
             if xnode is None:
                 print('Unable to load ' + classfilename)
             return xnode
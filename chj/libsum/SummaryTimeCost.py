@@ -26,7 +26,7 @@
 # SOFTWARE.
 # ------------------------------------------------------------------------------
 
-from typing import Tuple, TYPE_CHECKING
+from typing import cast, Optional, Tuple, TYPE_CHECKING
 
 import chj.util.fileutil as UF
 
@@ -35,50 +35,70 @@ if TYPE_CHECKING:
     import xml.etree.ElementTree as ET
 
 class SummaryTimeCost(object):
+    '''Time cost of a library method summary, decoded from its xml node
+    when constructed.'''
 
     def __init__(self,
             methodsum: "MethodSummary",
             xnode: "ET.Element"):
         self.methodsum = methodsum
-        self.xnode = xnode
+        self.src = xnode.get('src')
+        self.calls = xnode.get('calls')
+        self._modelvalue = xnode.get('modelvalue')
+        xcost = xnode.find('cost')
+        self.hascost = not xcost is None
+        self.isconstant = False
+        self.hasconstantnode = False
+        self._constant: Optional[str] = None
+        self._lb: Optional[str] = None
+        self._ub: Optional[str] = None
+        if not xcost is None:
+            self.isconstant = len(xcost) > 0 and xcost[0].tag == 'cn'
+            xcn = xcost.find('cn')
+            self.hasconstantnode = not xcn is None
+            if not xcn is None: self._constant = xcn.text
+            self._lb = xcost.get('lb')
+            self._ub = xcost.get('ub')
+
+    def _check_cost(self) -> None:
+        if not self.hascost:
+            raise UF.CHJError(self.methodsum.get_name() + ' cost missing from xml')
 
     def is_constant_cost(self) -> bool:
-        xcost = UF.safe_find(self.xnode, 'cost', self.methodsum.get_name() + ' cost missing from xml')
-        return len(xcost) > 0 and xcost[0].tag == 'cn'
+        self._check_cost()
+        return self.isconstant
 
     def is_interval_cost(self) -> bool:
-        xcost = UF.safe_find(self.xnode, 'cost', self.methodsum.get_name() + ' cost missing from xml')
-        return 'lb' in xcost.attrib and 'ub' in xcost.attrib
-            
+        self._check_cost()
+        return not self._lb is None and not self._ub is None
+
     def is_from_model(self) -> bool:
-        return 'src' in self.xnode.attrib and self.xnode.get('src') == 'model'
+        return self.src == 'model'
 
     def has_model_comparison_value(self) -> bool:
-        return 'modelvalue' in self.xnode.attrib
+        return not self._modelvalue is None
 
     def has_calls(self) -> bool:
-        return 'calls' in self.xnode.attrib and self.xnode.get('calls') == 'yes'
+        return self.calls == 'yes'
 
     def get_constant_cost(self) -> int:
-        xcost = UF.safe_find(self.xnode, 'cost', self.methodsum.get_name() + ' cost missing from xml')
-        xcn = UF.safe_find(xcost, 'cn', self.methodsum.get_name() + ' cn missing from xml')
-        if xcn.text is not None:
-            return int(xcn.text)
+        self._check_cost()
+        if not self.hasconstantnode:
+            raise UF.CHJError(self.methodsum.get_name() + ' cn missing from xml')
+        if self._constant is not None:
+            return int(self._constant)
         else:
             raise UF.CHJError(self.methodsum.get_name() + ' text missing from xml')
 
     def get_interval_cost(self) -> Tuple[int, int]:
         if self.is_interval_cost():
-            xcost = UF.safe_find(self.xnode, 'cost', 'cost missing from xml for interval')
-            lb = UF.safe_get(xcost, 'lb', 'lb missing from xml for interval', int)
-            ub = UF.safe_get(xcost, 'ub', 'ub missing from xml for interval', int)
-            return (lb, ub)
+            return (int(cast(str, self._lb)), int(cast(str, self._ub)))
         else:
             raise UF.CHJError('Cost of ' + self.methodsum.get_name() + ' is not an interval cost')
 
     def get_model_comparison_value(self) -> int:
-        if self.has_model_comparison_value():
-            return UF.safe_get(self.xnode, 'modelvalue', 'modelvalue missing from xml', int)
+        if self._modelvalue is not None:
+            return int(self._modelvalue)
         else:
             raise UF.CHJError(self.methodsum.get_name() + ' does not have a model comparison value')
 
@@ -307,11 +307,12 @@ def loadtaintgraph(engagement: str, project: str, index: str) -> Union[str, Dict
     result['meta'] = {}
     loops = False
     sink = None
+    witnesses = 0
     try:
         title = engagement + ":" + project + ":" + index
         app = load_engagement_app(engagement, project)
     
-        if app.jd.ttd is None:
+        if not app.jd.has_taint_results():
             raise UF.CHJError('Taint analysis results do not exist! Please create them first')
 
         name = str(app.jd.ttd.get_taint_origin(int(index)))
@@ -324,8 +325,9 @@ def loadtaintgraph(engagement: str, project: str, index: str) -> Union[str, Dict
             req = request.form
             loops = True if 'loops' in req else False
             sink = req['sinkid'] if 'sinkid' in req else None
+            witnesses = int(req['witnesses']) if 'witnesses' in req else 0
 
-        taintgraph = TaintGraph(app, project, index, loops=loops, sink=sink)
+        taintgraph = TaintGraph(app, project, index, loops=loops, sink=sink, witnesses=witnesses)
         dotgraph = taintgraph.as_dot(index)
         svggraph = UG.get_svg(app.path, dotgraph)
         svg = ET.tostring(svggraph.getroot(), encoding='unicode', method='html')
@@ -408,8 +410,9 @@ def load_method_cg(engagement: str, project: str, cmsix: str) -> Response:
     try:
         app = load_engagement_app(engagement, project)
         cg = app.get_callgraph()
+        maxdepth = request.args.get('depth', None, type=int)
 
-        (nodes, dotgraph) = cg.as_dot(int(cmsix))
+        (nodes, dotgraph) = cg.as_dot(int(cmsix), maxdepth)
         svggraph = UG.get_svg(app.path, dotgraph)
         UG.append_cmsixs(svggraph, nodes)
 
@@ -431,8 +434,9 @@ def load_method_rev_cg(engagement: str, project: str, cmsix: str) -> Response:
     try:
         app = load_engagement_app(engagement, project)
         revcg = app.get_callgraph()
+        maxdepth = request.args.get('depth', None, type=int)
 
-        dotgraph = revcg.as_rev_dot(int(cmsix))
+        dotgraph = revcg.as_rev_dot(int(cmsix), maxdepth)
         svggraph = UG.get_svg(app.path, dotgraph)
 
         svg = ET.tostring(svggraph.getroot(), encoding='unicode', method='html')
@@ -103,6 +103,49 @@ var Recursive = {
             }
             new_recursion_data.appendChild(table3);
         }
+
+        var recursivecomponents = response["recursivecomponents"];
+        if (recursivecomponents !== undefined && recursivecomponents.length > 0) {
+            var table4 = document.createElement('table');
+            table4.setAttribute('id', 'datatable');
+            table4.classList.add('balanced');
+            var header_row = document.createElement('tr');
+            Util.add_span_table_header("Recursive Components", header_row, 2);
+            table4.appendChild(header_row);
+
+            for (var i = 0; i < recursivecomponents.length; i++) {
+                var component = recursivecomponents[i];
+                var crow = document.createElement('tr');
+                var summary = "Component " + i + " (" + component["size"] + " methods, "
+                    + component["entries"].length + " entries)";
+                if (component["cost"] !== undefined) {
+                    summary += " cost [" + component["cost"][0] + " ; " + component["cost"][1] + "]";
+                }
+                var dsummary = Util.add_table_borderless(summary, crow);
+                dsummary.setAttribute('colspan', 2);
+                table4.appendChild(crow);
+
+                var methods = component["methods"];
+                for (var j = 0; j < methods.length; j++) {
+                    var mrow = document.createElement('tr');
+                    var methodname = Util.build_method_name(methods[j][1], methods[j][0]);
+                    Util.add_table_borderless("", mrow);
+                    Util.add_table_data_with_link(methodname, mrow, Util.get_method_link(methods[j][0]));
+                    table4.appendChild(mrow);
+                }
+
+                var entries = component["entries"];
+                for (var j = 0; j < entries.length; j++) {
+                    var erow = document.createElement('tr');
+                    var callername = Util.build_method_name(entries[j][1], entries[j][0]) + " @" + entries[j][2];
+                    var calleename = Util.build_method_name(entries[j][4], entries[j][3]);
+                    Util.add_table_data_with_link(callername, erow, Util.get_method_link(entries[j][0]));
+                    Util.add_table_data_with_link("==> " + calleename, erow, Util.get_method_link(entries[j][3]));
+                    table4.appendChild(erow);
+                }
+            }
+            new_recursion_data.appendChild(table4);
+        }
         return new_recursion_data;
     }
 }
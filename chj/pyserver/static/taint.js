@@ -14,9 +14,11 @@ function loadtaint() {
 
     var sink = document.getElementById("tsink").value;
     var loops = document.getElementById("loopsbox").checked;
+    var witnesses = document.getElementById("witnesses").value;
     var formData = new FormData();
     if(sink !== '') {formData.append("sinkid", sink);}
     if(loops === true) {formData.append("loops", loops);}
+    if(witnesses !== '' && witnesses !== '0') {formData.append("witnesses", witnesses);}
 
     var url = "/taint/" + navengagement + "/" + navproject + "/" + cmsix;
     var request = new XMLHttpRequest();
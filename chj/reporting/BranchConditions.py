@@ -30,24 +30,19 @@ from typing import cast, Dict, List, Tuple, Union, TYPE_CHECKING
 
 if TYPE_CHECKING:
     from chj.index.AppAccess import AppAccess
-    from chj.app.JavaMethod import JavaMethod
 
 import chj.util.printutil as UP
 
 class BranchConditions():
 
-    def __init__(self, app: "AppAccess"):
+    def __init__(self, app: "AppAccess", jobs: int = 1):
         self.app = app
+        self.jobs = jobs
 
     def get_table(self) -> Dict[str, List[Tuple[int, str]]]:
-        result = []
-        def f(cmsix: int, m: "JavaMethod") -> None:
-            for c in m.get_conditions():
-                result.append((cmsix, m.get_aqname(), c[0]))
-        self.app.iter_methods(f)
         table: Dict[str, List[Tuple[int, str]]] = {}
 
-        for (cmsix, name, cond) in result:
+        for (cmsix, name, cond) in self.app.get_branch_conditions(self.jobs):
             if cond in table:
                 table[cond].append( (cmsix, name) )
             else:
@@ -69,11 +64,7 @@ class BranchConditions():
         return table
 
     def tostring(self) -> str:
-        result = []
-        def f(cmsix: int, m: "JavaMethod") -> None:
-            for c in m.get_conditions():
-                result.append((m.get_aqname(),c[0]))
-        self.app.iter_methods(f)
+        result = [ (name, cond) for (_, name, cond) in self.app.get_branch_conditions(self.jobs) ]
         table: Dict[str, Union[str, int]] = {}
         for (name, cond) in result:
             if cond in table:
@@ -98,11 +89,7 @@ class BranchConditions():
         return '\n'.join(lines)
 
     def toincludestring(self, s: str) -> str:
-        result = []
-        def f(cmsix: int, m: "JavaMethod") -> None:
-            for c in m.get_conditions():
-                result.append((m.get_aqname(),c[0]))
-        self.app.iter_methods(f)
+        result = [ (name, cond) for (_, name, cond) in self.app.get_branch_conditions(self.jobs) ]
         table: Dict[str, Union[str, int]] = {}
         for (name,cond) in result:
             if s in cond:
@@ -26,7 +26,9 @@
 # SOFTWARE.
 # ------------------------------------------------------------------------------
 
-from typing import Any, Callable, Dict, List, Tuple, TYPE_CHECKING
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple, TYPE_CHECKING
+
+import chj.util.graphutil as UG
 
 if TYPE_CHECKING:
     from chj.cost.MethodCost import MethodCost
@@ -71,7 +73,8 @@ class CostSummary(object):
         self.app = app                  # AppAccess
         self.jd: "DataDictionary" = self.app.jd           # DataDictionary
         self.costmodel: "CostModel" = app.get_costmodel()
-        self.constantcost: List[int] = []
+        self.constantcost: Set[int] = set([])         # constant cost, and so are all callees
+        self._constantmarkers: Optional[Dict[int, str]] = None
 
     def get_cms(self, cmsix: int) -> "ClassMethodSignature": return self.jd.get_cms(cmsix)
 
@@ -118,6 +121,45 @@ class CostSummary(object):
     def get_call_targets(self, cmsix: int) -> List[int]:
         return self.app.get_method(cmsix).get_callee_cmsixs()
 
+    def get_constant_cost_marker(self, cmsix: int) -> str:
+        '''returns the marker shown after a constant method cost: (*) if the
+        method makes no calls, (**) if all methods it calls (transitively) have
+        constant cost, blank otherwise'''
+        if self._constantmarkers is None:
+            self._constantmarkers = self._get_constant_cost_markers()
+        return self._constantmarkers.get(cmsix, '      ')
+
+    def _get_constant_cost_markers(self) -> Dict[int, str]:
+        '''Decided in one pass over the strongly connected components of the
+        calls between constant-cost methods, callees first: a component is
+        marked if every call out of it goes to a marked method; the methods of
+        a recursive component are marked or not together.'''
+        constant = set([ cmsix for (cmsix, _) in self.costmodel.get_constant_method_costs() ])
+        targets: Dict[int, Set[int]] = {}
+        nocalls: Set[int] = set([])
+        for cmsix in constant:
+            if self.has_calls(cmsix):
+                targets[cmsix] = set(self.get_call_targets(cmsix))
+            else:
+                targets[cmsix] = set([])
+                nocalls.add(cmsix)
+        components = UG.get_strongly_connected_components(
+            sorted(constant), lambda c: sorted(targets[c] & constant))
+        for members in components:
+            memberset = set(members)
+            if all((t in self.constantcost or t in memberset)
+                   for m in members for t in targets[m]):
+                self.constantcost.update(members)
+        result: Dict[int, str] = {}
+        for cmsix in constant:
+            if cmsix in nocalls:
+                result[cmsix] = ' (*)  '
+            elif cmsix in self.constantcost:
+                result[cmsix] = ' (**) '
+            else:
+                result[cmsix] = '      '
+        return result
+
     def as_dictionary(self) -> Dict[str, Dict[int, Any]]:
         costs: Dict[str, Dict[int, Any]] = {}
 
@@ -133,16 +175,7 @@ class CostSummary(object):
         constantcosts = costs['constantcosts']
         for (cmsix,cost) in constantmethodcosts:
             name = str(self.get_cms(cmsix)) + ' (' + str(cmsix) + ')'
-            if (not self.has_calls(cmsix)):
-                pcalls = ' (*)  '
-                self.constantcost.append(cmsix)
-            else:
-                tgts = self.get_call_targets(cmsix)
-                if all( c in self.constantcost for c in tgts):
-                    pcalls = ' (**) '
-                    self.constantcost.append(cmsix)
-                else:
-                    pcalls = '      '
+            pcalls = self.get_constant_cost_marker(cmsix)
             constantcosts[cmsix] = (name, str(cost).rjust(10) + pcalls)
 
         costs['rangecosts'] = self.get_ranked_range_cost_dict()
@@ -167,16 +200,7 @@ class CostSummary(object):
         for (cmsix,cost) in constantmethodcosts:
             name = str(self.get_cms(cmsix))
             if namefilter(name):
-                if (not self.has_calls(cmsix)):
-                    pcalls = ' (*)  '
-                    self.constantcost.append(cmsix)
-                else:
-                    tgts = self.get_call_targets(cmsix)
-                    if all( c in self.constantcost for c in tgts):
-                        pcalls = ' (**) '
-                        self.constantcost.append(cmsix)
-                    else:
-                        pcalls = '      '
+                pcalls = self.get_constant_cost_marker(cmsix)
                 lines.append(str(cost).rjust(10) + pcalls + str(self.get_cms(cmsix))
                                 + ' (' + str(cmsix) + ')')
 
@@ -26,9 +26,11 @@
 # SOFTWARE.
 # ------------------------------------------------------------------------------
 
+import chj.util.fileutil as UF
+import chj.util.graphutil as UG
 import chj.util.printutil as UP
 
-from typing import Dict, List, Set, Tuple, TYPE_CHECKING
+from typing import Any, Dict, List, Optional, Set, Tuple, TYPE_CHECKING
 
 if TYPE_CHECKING:
     from chj.index.AppAccess import AppAccess
@@ -38,22 +40,78 @@ class Recursion():
 
     def __init__(self, app: "AppAccess"):
         self.app = app
+        self.appcalls: List[Tuple[int, int, int]] = self.get_appcalls()     # (caller, pc, callee)
         self.appedges: Dict[int, Set[int]] = self.get_appedges()    # cmsix -> targets
+        self.components: List[List[int]] = self.get_recursive_components()
+        self.componentof: Dict[int, int] = {}       # cmsix -> index in components
+        for (i, members) in enumerate(self.components):
+            for m in members: self.componentof[m] = i
+        self.hascostmodel = self.app.has_costmodel()
 
-    def get_appedges(self) -> Dict[int, Set[int]]:
+    def get_appcalls(self) -> List[Tuple[int, int, int]]:
         jd = self.app.jd
-        appedges: Dict[int, Set[int]] = {}
+        appcalls: List[Tuple[int, int, int]] = []
 
         def f(caller: int, pc: int, callee: int, tgt: "CallgraphTargetBase") -> None:
             if tgt.has_application_targets():
-                if not caller in appedges: appedges[caller] = set([])
-                cmstgts = [ jd.get_cmsix(cnix,callee) for cnix in tgt.get_application_targets() ]
-                for c in cmstgts:
-                    appedges[caller].add(c)
+                for cnix in tgt.get_application_targets():
+                    appcalls.append((caller, pc, jd.get_cmsix(cnix,callee)))
 
         jd.iter_callgraph_edges(f)
+        return appcalls
+
+    def get_appedges(self) -> Dict[int, Set[int]]:
+        appedges: Dict[int, Set[int]] = {}
+        for (caller, _, callee) in self.appcalls:
+            if not caller in appedges: appedges[caller] = set([])
+            appedges[caller].add(callee)
         return appedges
 
+    def get_recursive_components(self) -> List[List[int]]:
+        '''returns the strongly connected components of the application call
+        graph that contain a cycle (more than one method, or a self call), in
+        reverse topological order; members are sorted by cmsix'''
+        empty: Set[int] = set([])
+        components = UG.get_strongly_connected_components(
+            self.appedges, lambda n: self.appedges.get(n, empty))
+        return [ sorted(c) for c in components
+                 if len(c) > 1 or c[0] in self.appedges.get(c[0], empty) ]
+
+    def _in_same_component(self, m1: int, m2: int) -> bool:
+        return m1 in self.componentof and self.componentof.get(m2) == self.componentof[m1]
+
+    def get_component_entries(self) -> List[List[Tuple[int, int, int]]]:
+        '''returns, for each component, (caller, pc, callee) of the calls into
+        the component from methods outside it'''
+        result: List[List[Tuple[int, int, int]]] = [ [] for _ in self.components ]
+        for (caller, pc, callee) in self.appcalls:
+            if callee in self.componentof:
+                i = self.componentof[callee]
+                if self.componentof.get(caller) != i:
+                    result[i].append((caller, pc, callee))
+        return result
+
+    def get_component_cost(self, i: int) -> Optional[Tuple[int, int, int]]:
+        '''returns the summed lower and upper bounds of the costs of the members
+        of component i that have a constant range, and the number of members
+        that have not; None if no cost results are available'''
+        if not self.hascostmodel: return None
+        costmodel = self.app.get_costmodel()
+        (lb, ub, unbounded) = (0, 0, 0)
+        for m in self.components[i]:
+            try:
+                cost = costmodel.get_method_cost(m).methodcost.cost
+            except UF.CHJError:
+                unbounded += 1
+                continue
+            if cost.is_range():
+                (mlb, mub) = cost.get_range()
+                lb += mlb
+                ub += mub
+            else:
+                unbounded += 1
+        return (lb, ub, unbounded)
+
     def get_self_recursive_calls(self) -> List[int]:
         recursivecalls = []
 
@@ -67,10 +125,12 @@ class Recursion():
         mutualrecursivecalls = set([])
 
         for caller in self.appedges:
+            if not caller in self.componentof: continue
             callees = self.appedges[caller]
             for callee in callees:
-                if callee in self.appedges and caller in self.appedges[callee]:
-                    if callee == caller: continue
+                if callee == caller: continue
+                if not self._in_same_component(caller, callee): continue
+                if caller in self.appedges[callee]:
                     tuple = (caller,callee) if caller <= callee else (callee,caller)
                     mutualrecursivecalls.add(tuple)
 
@@ -80,19 +140,21 @@ class Recursion():
         recursive2cycles = []
 
         for caller in self.appedges:
+            if not caller in self.componentof: continue
             callees = self.appedges[caller]
             for callee in callees:
                 if callee == caller: continue
-                if callee in self.appedges:
-                    subcallees = self.appedges[callee]
-                    for subcallee in subcallees:
-                        if subcallee in self.appedges and caller in self.appedges[subcallee]:
-                            recursive2cycles.append((caller,callee,subcallee))
-    
+                if not self._in_same_component(caller, callee): continue
+                subcallees = self.appedges[callee]
+                for subcallee in subcallees:
+                    if not self._in_same_component(caller, subcallee): continue
+                    if caller in self.appedges[subcallee]:
+                        recursive2cycles.append((caller,callee,subcallee))
+
         return recursive2cycles
 
-    def as_dictionary(self) -> Dict[str, List[Tuple[str, ...]]]:
-        result: Dict[str, List[Tuple[str, ...]]] = {}
+    def as_dictionary(self) -> Dict[str, List[Any]]:
+        result: Dict[str, List[Any]] = {}
         jd = self.app.jd
 
         result["recursivecalls"] = [ (str(call), str(jd.get_cms(call))) for call in self.get_self_recursive_calls() ]
@@ -102,6 +164,20 @@ class Recursion():
                                             str(jd.get_cms(callee)), str(subcallee), str(jd.get_cms(subcallee)))
                                             for (caller, callee, subcallee) in self.get_recursive_2_cycles() ]
 
+        components: List[Dict[str, Any]] = []
+        entries = self.get_component_entries()
+        for (i, members) in enumerate(self.components):
+            component: Dict[str, Any] = {}
+            component["size"] = len(members)
+            component["methods"] = [ (str(m), str(jd.get_cms(m))) for m in members ]
+            component["entries"] = [ (str(caller), str(jd.get_cms(caller)), str(pc), str(callee), str(jd.get_cms(callee)))
+                                     for (caller, pc, callee) in entries[i] ]
+            cost = self.get_component_cost(i)
+            if not cost is None:
+                component["cost"] = [ str(c) for c in cost ]
+            components.append(component)
+        result["recursivecomponents"] = components
+
         return result
 
     def to_string(self) -> str:
@@ -126,5 +202,20 @@ class Recursion():
             callee_cms = jd.get_cms(callee)
             subcallee_cms = jd.get_cms(subcallee)
             lines.append('\n' + str(caller_cms) + '\n ==> ' + str(callee_cms) + '\n ====> ' + str(subcallee_cms))
-            
+
+        lines.append('\nRecursive components: ' + str(len(self.components)))
+        entries = self.get_component_entries()
+        for (i, members) in enumerate(self.components):
+            lines.append('\nComponent ' + str(i) + ' (' + str(len(members)) + ' methods)')
+            for m in members:
+                lines.append('  ' + str(m).rjust(6) + '  ' + str(jd.get_cms(m)))
+            cost = self.get_component_cost(i)
+            if not cost is None:
+                (lb, ub, unbounded) = cost
+                lines.append('  cost per iteration: [' + str(lb) + ' ; ' + str(ub) + ']'
+                             + ('' if unbounded == 0 else ' (' + str(unbounded) + ' methods without bounds)'))
+            lines.append('  entries: ' + str(len(entries[i])))
+            for (caller, pc, callee) in entries[i]:
+                lines.append('    ' + str(jd.get_cms(caller)) + ' @' + str(pc) + '\n      ==> ' + str(jd.get_cms(callee)))
+
         return '\n'.join(lines)
@@ -33,10 +33,9 @@ if TYPE_CHECKING:
 
 class StaticFields():
 
-    def __init__(self, app: "AppAccess"):
+    def __init__(self, app: "AppAccess", jobs: int = 1):
         self.app = app
-        self.initializers = self.app.get_static_initializers()
-        self.readers = self.app.get_static_field_readers()
+        (self.initializers, self.readers) = self.app.get_static_field_accesses(jobs)
 
     def as_dictionary(self) -> Dict[str, Dict[str, Dict[str, Dict[int, Tuple[int, str]]]]]:
         results = {}
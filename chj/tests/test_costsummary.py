@@ -0,0 +1,154 @@
+# ------------------------------------------------------------------------------
+# CodeHawk Java Analyzer
+# Author: Henny Sipma
+# ------------------------------------------------------------------------------
+# The MIT License (MIT)
+#
+# Copyright (c) 2016-2020 Kestrel Technology LLC
+# Copyright (c) 2021      Andrew McGraw
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+# 
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+# ------------------------------------------------------------------------------
+
+import random
+import unittest
+
+from typing import Dict, List, Set, Tuple
+
+from chj.reporting.CostSummary import CostSummary
+
+class StubMethod():
+
+    def __init__(self, callees: List[int]) -> None:
+        self.callees = callees
+
+    def has_calls(self) -> bool: return len(self.callees) > 0
+
+    def get_callee_cmsixs(self) -> List[int]: return self.callees
+
+class StubCostModel():
+
+    def __init__(self, costs: List[Tuple[int, int]]) -> None:
+        self.costs = costs
+
+    def get_constant_method_costs(self) -> List[Tuple[int, int]]:
+        return sorted(self.costs, key=lambda c: c[1])
+
+class StubApp():
+
+    def __init__(self, costs: List[Tuple[int, int]], calls: Dict[int, List[int]]) -> None:
+        self.jd = None
+        self.costmodel = StubCostModel(costs)
+        self.calls = calls
+
+    def get_costmodel(self) -> StubCostModel: return self.costmodel
+
+    def get_method(self, cmsix: int) -> StubMethod: return StubMethod(self.calls.get(cmsix, []))
+
+def get_markers(
+        costs: List[Tuple[int, int]],
+        calls: Dict[int, List[int]]) -> Dict[int, str]:
+    summary = CostSummary(StubApp(costs, calls))        # type: ignore
+    return dict((cmsix, summary.get_constant_cost_marker(cmsix)) for (cmsix, _) in costs)
+
+def get_reference_marked(constant: List[int], calls: Dict[int, List[int]]) -> Set[int]:
+    '''greatest set of constant-cost methods that only call methods in the set'''
+    marked = set(constant)
+    changed = True
+    while changed:
+        changed = False
+        for cmsix in sorted(marked):
+            if any(not t in marked for t in calls.get(cmsix, [])):
+                marked.discard(cmsix)
+                changed = True
+    return marked
+
+def get_random_graph(
+        rnd: random.Random,
+        size: int,
+        backedges: float) -> Tuple[List[int], Dict[int, List[int]]]:
+    '''calls to later methods (some outside the application), and with
+    probability backedges a call back to an earlier method or itself'''
+    calls: Dict[int, List[int]] = {}
+    for cmsix in range(size):
+        calls[cmsix] = [ rnd.randrange(cmsix + 1, size + size // 10 + 1)
+                         for _ in range(rnd.randrange(0, 3)) ]
+        if rnd.random() < backedges:
+            calls[cmsix].append(rnd.randrange(0, cmsix + 1))
+    constant = [ cmsix for cmsix in range(size) if rnd.random() < 0.9 ]
+    return (constant, calls)
+
+class TestConstantCostMarkers(unittest.TestCase):
+
+    def check_order_independent(
+            self,
+            rnd: random.Random,
+            constant: List[int],
+            calls: Dict[int, List[int]]) -> Dict[int, str]:
+        results = []
+        for _ in range(5):
+            costs = [ (cmsix, rnd.randrange(1, 4)) for cmsix in constant ]
+            rnd.shuffle(costs)
+            shuffledcalls = dict((c, rnd.sample(t, len(t))) for (c, t) in calls.items())
+            results.append(get_markers(costs, shuffledcalls))
+        for r in results[1:]:
+            self.assertEqual(results[0], r)
+        return results[0]
+
+    def check_reference(
+            self,
+            markers: Dict[int, str],
+            constant: List[int],
+            calls: Dict[int, List[int]]) -> None:
+        reference = get_reference_marked(constant, calls)
+        for cmsix in constant:
+            if len(calls.get(cmsix, [])) == 0:
+                self.assertEqual(' (*)  ', markers[cmsix])
+            elif cmsix in reference:
+                self.assertEqual(' (**) ', markers[cmsix])
+            else:
+                self.assertEqual('      ', markers[cmsix])
+
+    def test_chain(self) -> None:
+        calls = { 1: [ 2 ], 2: [ 3 ], 3: [] }
+        markers = get_markers([ (1, 1), (2, 1), (3, 1) ], calls)
+        self.assertEqual({ 1: ' (**) ', 2: ' (**) ', 3: ' (*)  ' }, markers)
+
+    def test_callee_not_constant(self) -> None:
+        calls = { 1: [ 2 ], 2: [ 3 ], 3: [] }
+        markers = get_markers([ (1, 1), (2, 1) ], calls)
+        self.assertEqual({ 1: '      ', 2: '      ' }, markers)
+
+    def test_recursive_component(self) -> None:
+        calls = { 1: [ 2 ], 2: [ 3, 1 ], 3: [ 3, 4 ], 4: [], 5: [ 5, 6 ], 6: [ 7 ] }
+        costs = [ (1, 1), (2, 1), (3, 1), (4, 1), (5, 1), (6, 1) ]
+        markers = self.check_order_independent(random.Random(0), [ c for (c, _) in costs ], calls)
+        self.assertEqual({ 1: ' (**) ', 2: ' (**) ', 3: ' (**) ', 4: ' (*)  ',
+                           5: '      ', 6: '      ' }, markers)
+
+    def test_random_graphs(self) -> None:
+        rnd = random.Random(1)
+        for trial in range(200):
+            size = rnd.randrange(2, 60)
+            (constant, calls) = get_random_graph(rnd, size, 0.2 if trial % 2 == 1 else 0.0)
+            markers = self.check_order_independent(rnd, constant, calls)
+            self.check_reference(markers, constant, calls)
+
+if __name__ == '__main__':
+    unittest.main()
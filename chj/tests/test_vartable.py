@@ -0,0 +1,144 @@
+# ------------------------------------------------------------------------------
+# CodeHawk Java Analyzer
+# Author: Henny Sipma
+# ------------------------------------------------------------------------------
+# The MIT License (MIT)
+#
+# Copyright (c) 2016-2020 Kestrel Technology LLC
+# Copyright (c) 2021      Andrew McGraw
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+# 
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+# ------------------------------------------------------------------------------
+
+import random
+import unittest
+import xml.etree.ElementTree as ET
+
+from typing import Any, List, Optional, Tuple
+
+import chj.util.fileutil as UF
+
+from chj.app.Vartable import Vartable
+
+class StubString():
+
+    def __init__(self, s: str) -> None:
+        self.s = s
+
+    def get_string(self) -> str: return self.s
+
+    def get_string_length(self) -> int: return len(self.s)
+
+class StubTypeDictionary():
+
+    def get_string(self, index: int) -> StubString: return StubString('v' + str(index))
+
+    def get_value_type(self, index: int) -> str: return 't' + str(index)
+
+class StubDataDictionary():
+
+    def __init__(self) -> None:
+        self.tpd = StubTypeDictionary()
+
+class StubMethod():
+
+    def __init__(self) -> None:
+        self.jd = StubDataDictionary()
+
+    def get_qname(self) -> str: return 'C.m'
+
+def make_vartable(slots: List[Tuple[int, int, int]]) -> Vartable:
+    '''slots are (vix, spc, epc); slot k has iname and ivty k'''
+    xnode = ET.Element('vartable')
+    for (k, (vix, spc, epc)) in enumerate(slots):
+        ET.SubElement(xnode, 'slot', {
+            'vix': str(vix), 'spc': str(spc), 'epc': str(epc),
+            'iname': str(k), 'ivty': str(k) })
+    return Vartable(StubMethod(), xnode)        # type: ignore
+
+def scan(vartable: Vartable, index: int, pc: int) -> Optional[Tuple[str, Any]]:
+    '''name and type found by the linear scan over the table'''
+    for (ix,spc) in vartable.table:
+        if ix == index and pc >= spc and pc <= vartable.table[(ix,spc)].endpc:
+            slot = vartable.table[(ix,spc)]
+            return (slot.name.get_string(), slot.vtype)
+    return None
+
+class TestVartable(unittest.TestCase):
+
+    def check_against_scan(self, slots: List[Tuple[int, int, int]]) -> None:
+        vartable = make_vartable(slots)
+        maxpc = max([ epc for (_, _, epc) in slots ] + [ 0 ]) + 2
+        maxvix = max([ vix for (vix, _, _) in slots ] + [ 0 ]) + 1
+        for index in range(-1, maxvix + 1):
+            for pc in range(-1, maxpc):
+                expected = scan(vartable, index, pc)
+                if expected is None:
+                    self.assertIsNone(vartable.get_slot(index, pc))
+                    with self.assertRaises(UF.CHJError):
+                        vartable.get_name(index, pc)
+                    with self.assertRaises(UF.CHJError):
+                        vartable.get_type(index, pc)
+                else:
+                    self.assertEqual(expected[0], vartable.get_name(index, pc))
+                    self.assertEqual(expected[1], vartable.get_type(index, pc))
+
+    def test_empty(self) -> None:
+        self.check_against_scan([])
+
+    def test_adjacent_ranges(self) -> None:
+        slots = [ (1, 6, 10), (1, 0, 5), (1, 11, 11), (2, 0, 20) ]
+        vartable = make_vartable(slots)
+        self.assertFalse(1 in vartable.overlapping)
+        self.assertEqual('v1', vartable.get_name(1, 5))
+        self.assertEqual('v0', vartable.get_name(1, 6))
+        self.assertEqual('t2', vartable.get_type(1, 11))
+        self.check_against_scan(slots)
+
+    def test_gaps(self) -> None:
+        slots = [ (0, 0, 3), (0, 8, 9), (3, 4, 6) ]
+        vartable = make_vartable(slots)
+        for pc in [ 4, 7, 10 ]:
+            with self.assertRaises(UF.CHJError):
+                vartable.get_name(0, pc)
+        with self.assertRaises(UF.CHJError):
+            vartable.get_type(1, 0)
+        self.check_against_scan(slots)
+
+    def test_overlapping_ranges(self) -> None:
+        slots = [ (1, 4, 12), (1, 0, 5), (1, 8, 9), (1, 14, 14), (2, 0, 3), (2, 3, 6) ]
+        vartable = make_vartable(slots)
+        self.assertEqual(set([ 1, 2 ]), vartable.overlapping)
+        self.assertEqual('v0', vartable.get_name(1, 5))
+        self.assertEqual('v0', vartable.get_name(1, 8))
+        self.assertEqual('v4', vartable.get_name(2, 3))
+        self.check_against_scan(slots)
+
+    def test_random_tables(self) -> None:
+        rnd = random.Random(1)
+        for _ in range(200):
+            slots = []
+            for vix in range(rnd.randrange(1, 4)):
+                for _ in range(rnd.randrange(0, 5)):
+                    spc = rnd.randrange(0, 30)
+                    slots.append((vix, spc, spc + rnd.randrange(0, 8)))
+            self.check_against_scan(slots)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -86,6 +86,26 @@ class Config():
         self.appdatadir: Optional[str] = None
         self.canonicaldir: Optional[str] = None
 
+        # storage of the type, jterm, taint and callgraph dictionary tables:
+        # 'dict': one record object per entry, constructed when read
+        # 'dense': as 'dict', with tuple keys and the records in a list by
+        #          index; cheaper add/lookup and in-order values
+        # 'columnar': flat int columns, record objects constructed on access
+        #             and kept in a cache of at most tablecachesize objects
+        # 'lazy': flat int columns, record objects constructed on first
+        #         access and kept
+        self.tablestorage = 'dict'
+        self.tablecachesize = 10000
+
+        # parsed xml files kept by fileutil.get_xnode, measured in bytes of
+        # xml source; files are reparsed when their mtime or size changes;
+        # 0 disables the cache
+        self.xmlcachesize = 64 * 1024 * 1024
+
+        # parser for analysis results that are only read: 'lxml' (used when
+        # the lxml package is installed) or 'stdlib' (xml.etree.ElementTree)
+        self.xmlparser = 'lxml'
+
         if os.path.isfile(os.path.join(os.path.dirname(os.path.abspath(__file__)), "ConfigLocal.py")):
             ConfigLocal.getLocals(self)
 
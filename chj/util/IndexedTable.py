@@ -26,11 +26,20 @@
 # SOFTWARE.
 # ------------------------------------------------------------------------------
 
+import os
+import sys
+
 import xml.etree.ElementTree as ET
 
+from array import array
+from collections import OrderedDict
+
 import chj.util.fileutil as UF
 
-from typing import Any, Callable, Dict, Generic, List, Optional, Tuple, TypeVar
+from typing import (
+    Any, Callable, Dict, Generic, IO, Iterator, List, Optional, Tuple, TypeVar, Union)
+
+TableRep = Tuple[int, List[str], List[int]]     # (index, tags, args)
 
 class IndexedTableError(Exception):
 
@@ -40,7 +49,7 @@ class IndexedTableError(Exception):
     def __str__(self) -> str: 
         return self.msg
 
-def get_rep(node: ET.Element) -> Tuple[int, List[str], List[int]]:
+def get_rep(node: ET.Element) -> TableRep:
     tags = node.get('t')
     args = node.get('a')
     try:
@@ -63,7 +72,169 @@ def get_rep(node: ET.Element) -> Tuple[int, List[str], List[int]]:
 def get_key(tags: List[str], args: List[int]) -> Tuple[str, str]: 
     return (','.join(tags), ','.join([str(x) for x in args]))
 
+class TableSource(object):
+    '''Source of table records other than an xml table node.'''
+
+    def iter_reps(self, tag: str) -> Iterator[TableRep]:
+        raise NotImplementedError("iter_reps not overridden")
+
+TableNode = Union[ET.Element, TableSource]
+
+class XmlTableStream(object):
+    '''Streaming access to the tables of an xml dictionary file.
+
+    The file is read with iterparse; the record nodes of a table are handed
+    out one at a time and cleared as soon as they have been consumed, so the
+    full document tree is never held in memory.
+
+    Tables are expected in the order in which they appear in the file (the
+    order in which write_xml emits them). A table that was passed over is
+    recovered by a full parse of the file.
+
+    Paths are relative to the document root, as in get_xnode, e.g.,
+    'dictionary/type-dictionary/string-table'.
+    '''
+
+    def __init__(self, filename: str) -> None:
+        if not os.path.isfile(filename):
+            raise UF.CHJFileNotFoundError(filename)
+        self.filename = filename
+        self.fp: IO[bytes] = open(filename, 'rb')
+        self.events = iter(UF.iterparse_xml(self.fp))
+        self.stack: List[str] = []           # tags of the currently open elements
+
+    def __enter__(self) -> "XmlTableStream":
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self.fp.close()
+
+    def get_table(self, path: str) -> TableSource:
+        return XmlStreamTable(self, path)
+
+    def iter_records(self, path: str, tag: str) -> Iterator[ET.Element]:
+        try:
+            table = self._find(path)
+            if table is None:
+                yield from self._find_parsed(path).findall(tag)
+                return
+            depth = len(self.stack)
+            for (event, elem) in self.events:
+                if event == 'start':
+                    self.stack.append(elem.tag)
+                    continue
+                self.stack.pop()
+                if len(self.stack) == depth:
+                    if elem.tag == tag:
+                        yield elem
+                    elem.clear()
+                    table.remove(elem)
+                elif len(self.stack) < depth:
+                    table.clear()
+                    return
+        except UF.XmlParseErrors as e:
+            raise UF.CHJXmlParseError(self.filename, getattr(e, 'code', 0), getattr(e, 'position', (0, 0)))
+
+    def _find(self, path: str) -> Optional[ET.Element]:
+        target = path.split('/')
+        targetdepth = len(target) + 1
+        for (event, elem) in self.events:
+            if event == 'start':
+                self.stack.append(elem.tag)
+                if len(self.stack) == targetdepth and self.stack[1:] == target:
+                    return elem
+            else:
+                self.stack.pop()
+                elem.clear()
+        return None
+
+    def _find_parsed(self, path: str) -> ET.Element:
+        node = UF.parse_xml_file(self.filename).find(path)
+        if node is None:
+            raise UF.CHJError(path + ' missing from ' + self.filename)
+        return node
+
+class XmlStreamTable(TableSource):
+
+    def __init__(self, stream: XmlTableStream, path: str) -> None:
+        self.stream = stream
+        self.path = path
+
+    def iter_reps(self, tag: str) -> Iterator[TableRep]:
+        for node in self.stream.iter_records(self.path, tag):
+            yield get_rep(node)
+
+class PackedTable(TableSource):
+    '''Records of a table in flat arrays, for saving and restoring without xml.
+
+    The args of record i are args[offsets[i]:offsets[i+1]]; tags are kept as
+    their comma-separated key string.
+    '''
+
+    def __init__(self) -> None:
+        self.indices = array('i')
+        self.tags: List[str] = []
+        self.offsets = array('i', [0])
+        self.args = array('i')
+
+    def add(self, index: int, tags: str, args: str) -> None:
+        self.indices.append(index)
+        self.tags.append(tags)
+        if len(args) > 0:
+            self.args.extend([ int(x) for x in args.split(',') ])
+        self.offsets.append(len(self.args))
+
+    def iter_reps(self, tag: str) -> Iterator[TableRep]:
+        taglists: Dict[str, List[str]] = {}
+        offsets = self.offsets
+        args = self.args
+        for (i, (index, tags)) in enumerate(zip(self.indices, self.tags)):
+            if not tags in taglists:
+                taglists[tags] = tags.split(',') if len(tags) > 0 else []
+            yield (index, taglists[tags][:], args[offsets[i]:offsets[i+1]].tolist())
+
+def read_packed_tables(filename: str, path: str, tag: str = 'n') -> Dict[str, PackedTable]:
+    '''Return the records of all tables below path (relative to the document
+    root) in filename, without constructing record objects.'''
+    if not os.path.isfile(filename):
+        raise UF.CHJFileNotFoundError(filename)
+    result: Dict[str, PackedTable] = {}
+    target = path.split('/')
+    tabledepth = len(target) + 2
+    stack: List[str] = []
+    table: Optional[PackedTable] = None
+    tablenode: Optional[ET.Element] = None
+    try:
+        for (event, elem) in UF.iterparse_xml(filename):
+            if event == 'start':
+                stack.append(elem.tag)
+                if len(stack) == tabledepth and stack[1:-1] == target:
+                    table = result[elem.tag] = PackedTable()
+                    tablenode = elem
+                continue
+            stack.pop()
+            if table is not None and tablenode is not None:
+                if len(stack) == tabledepth and elem.tag == tag:
+                    table.add(
+                        UF.safe_get(elem, 'ix', 'ix missing from xml in ' + filename, int),
+                        elem.get('t', ''),
+                        elem.get('a', ''))
+                    tablenode.remove(elem)
+                elif len(stack) < tabledepth:
+                    tablenode.clear()
+                    table = None
+                    tablenode = None
+    except UF.XmlParseErrors as e:
+        raise UF.CHJXmlParseError(filename, getattr(e, 'code', 0), getattr(e, 'position', (0, 0)))
+    return result
+
 class IndexedTableValue(object):
+
+    __slots__ = ("index",)
+
     def __init__(self, index: int) -> None:
         self.index = index
 
@@ -128,9 +299,8 @@ class IndexedTable(Generic[V], IndexedTableSuperclass):
             if i in self.reserved:
                 continue
             self.indextable.pop(i)
-        for k in self.keytable.keys():
-            if self.keytable[k] >= cp:
-                self.keytable.pop(k)
+        for k in [ k for (k, i) in self.keytable.items() if i >= cp ]:
+            self.keytable.pop(k)
         self.checkpoint = None
         self.reserved = []
         self.next = cp
@@ -150,6 +320,11 @@ class IndexedTable(Generic[V], IndexedTableSuperclass):
             self.next += 1
             return index
 
+    def add_rep(self, tags: List[str], args: List[int], f: Callable[[int], V]) -> int:
+        '''Return the index of the entry with tags and args; if not present
+        add f(index) as a new entry.'''
+        return self.add(get_key(tags, args), lambda index, key: f(index))
+
     def has_key(self, key: Tuple[str, str]) -> bool: return key in self.keytable
 
     def get_index(self, key: Tuple[str, str]) -> int:
@@ -214,16 +389,20 @@ class IndexedTable(Generic[V], IndexedTableSuperclass):
             node.append(snode)
 
     def read_xml(self,
-            node: Optional[ET.Element],
+            node: Optional[TableNode],
             tag: str,
-            get_value: Callable[[ET.Element], V],
+            get_value: Callable[[TableRep], V],
             get_key: Callable[[V], Tuple[str, str]]= lambda x:x.get_key(),
             get_index: Callable[[V], int]= lambda x:x.index) -> None:
         if node is None:
             print('Xml node not present in ' + self.name)
             raise IndexedTableError(self.name)
-        for snode in node.findall(tag):
-            obj = get_value(snode)
+        if isinstance(node, TableSource):
+            reps = node.iter_reps(tag)
+        else:
+            reps = (get_rep(snode) for snode in node.findall(tag))
+        for rep in reps:
+            obj = get_value(rep)
             key = get_key(obj)
             index = get_index(obj)
             self.keytable[key] = index
@@ -231,6 +410,20 @@ class IndexedTable(Generic[V], IndexedTableSuperclass):
             if index >= self.next:
                 self.next = index + 1
 
+    def iter_reps(self) -> Iterator[TableRep]:
+        '''Yield (index, tags, args) of all entries in index order, without
+        constructing record objects.'''
+        for ((tags, args), index) in sorted(self.keytable.items(), key=lambda x:x[1]):
+            yield (index,
+                   tags.split(',') if len(tags) > 0 else [],
+                   [ int(x) for x in args.split(',') ] if len(args) > 0 else [])
+
+    def pack(self) -> PackedTable:
+        result = PackedTable()
+        for (key, index) in sorted(self.keytable.items(), key=lambda x:x[1]):
+            result.add(index, key[0], key[1])
+        return result
+
     def __str__(self) -> str:
         lines = []
         lines.append('\n' + self.name)
@@ -241,4 +434,363 @@ class IndexedTable(Generic[V], IndexedTableSuperclass):
         if not self.checkpoint is None:
             lines.append('Checkpoint: ' + str(self.checkpoint))
         return '\n'.join(lines)
-            
+
+class ColumnarIndexedTable(IndexedTable[V]):
+    '''IndexedTable that keeps the records read from xml in flat columns.
+
+    Tags are interned in a string pool and args are kept in a single int
+    array with per-row offsets. Record objects are constructed by retrieve
+    (with the get_value function given to read_xml) and kept in a cache.
+    With a bounded cache the same index may yield different (equal) objects
+    over time; with cachesize None (lazy mode) every object is constructed
+    at most once and kept. The key table is built on first use. Records
+    added with add or commit_reserved are kept as objects.
+    '''
+
+    def __init__(self, name: str, cachesize: Optional[int] = 10000) -> None:
+        IndexedTable.__init__(self, name)
+        self.cachesize = cachesize
+        self.get_value: Optional[Callable[[TableRep], V]] = None
+        self._reset_columns()
+
+    def _reset_columns(self) -> None:
+        self.tagpool: List[str] = []             # tag strings
+        self.tagids: Dict[str, int] = {}         # tag string -> position in tagpool
+        self.rowtags = array('i')                # row -> position in tagpool
+        self.offsets = array('i', [0])           # row -> start of args of row
+        self.args = array('i')
+        self.rows = array('i')                   # index -> row (-1 if absent)
+        self.cache: "OrderedDict[int, V]" = OrderedDict()
+        self.haskeytable = False
+
+    def reset(self) -> None:
+        IndexedTable.reset(self)
+        self._reset_columns()
+
+    def _has_row(self, index: int) -> bool:
+        return index < len(self.rows) and self.rows[index] >= 0
+
+    def _add_row(self, index: int, tags: str, args: List[int]) -> None:
+        if not tags in self.tagids:
+            self.tagids[tags] = len(self.tagpool)
+            self.tagpool.append(tags)
+        row = len(self.rowtags)
+        self.rowtags.append(self.tagids[tags])
+        self.args.extend(args)
+        self.offsets.append(len(self.args))
+        if index >= len(self.rows):
+            self.rows.extend(array('i', [-1]) * (index + 1 - len(self.rows)))
+        self.rows[index] = row
+        if self.haskeytable:
+            self.keytable[(tags, ','.join([str(x) for x in args]))] = index
+        if index >= self.next:
+            self.next = index + 1
+
+    def _get_rep(self, index: int) -> TableRep:
+        row = self.rows[index]
+        tags = self.tagpool[self.rowtags[row]]
+        taglist = tags.split(',') if len(tags) > 0 else []
+        return (index, taglist, self.args[self.offsets[row]:self.offsets[row+1]].tolist())
+
+    def _get_keytable(self) -> Dict[Tuple[str, str], int]:
+        if not self.haskeytable:
+            for (index, row) in enumerate(self.rows):
+                if row >= 0:
+                    args = self.args[self.offsets[row]:self.offsets[row+1]]
+                    key = (self.tagpool[self.rowtags[row]], ','.join([str(x) for x in args]))
+                    self.keytable[key] = index
+            self.haskeytable = True
+        return self.keytable
+
+    def _indices(self) -> List[int]:
+        result = [ index for (index, row) in enumerate(self.rows) if row >= 0 ]
+        if len(self.indextable) > 0:
+            result = sorted(set(result).union(self.indextable))
+        return result
+
+    def iter(self, f: Callable[[int, V], None]) -> None:
+        for i in self._indices():
+            f(i, self.retrieve(i))
+
+    def reset_to_checkpoint(self) -> int:
+        cp = self.checkpoint
+        if cp is None:
+            raise UF.CHJError("Cannot reset non-existent checkpoint")
+        keytable = self._get_keytable()
+        for i in range(cp, self.next):
+            self.indextable.pop(i, None)
+            self.cache.pop(i, None)
+        del self.rows[cp:]
+        for k in [ k for (k, i) in keytable.items() if i >= cp ]:
+            keytable.pop(k)
+        self.checkpoint = None
+        self.reserved = []
+        self.next = cp
+        return cp
+
+    def add(self, key: Tuple[str, str], f: Callable[[int, Tuple[str, str]], V]) -> int:
+        self._get_keytable()
+        return IndexedTable.add(self, key, f)
+
+    def has_key(self, key: Tuple[str, str]) -> bool: return key in self._get_keytable()
+
+    def values(self) -> List[V]:
+        return [ self.retrieve(i) for i in self._indices() ]
+
+    def items(self) -> List[Tuple[int, V]]:
+        return [ (i, self.retrieve(i)) for i in self._indices() ]
+
+    def commit_reserved(self, index: int, key: Tuple[str, str], obj: V) -> None:
+        self._get_keytable()
+        IndexedTable.commit_reserved(self, index, key, obj)
+
+    def retrieve(self, index: int) -> V:
+        if index in self.indextable:
+            return self.indextable[index]
+        if index in self.cache:
+            self.cache.move_to_end(index)
+            return self.cache[index]
+        if self._has_row(index) and self.get_value is not None:
+            obj = self.get_value(self._get_rep(index))
+            self.cache[index] = obj
+            if self.cachesize is not None and len(self.cache) > self.cachesize:
+                self.cache.popitem(last=False)
+            return obj
+        return IndexedTable.retrieve(self, index)
+
+    def retrieve_by_key(
+        self, f: Callable[[Tuple[str, str]], bool]
+    ) -> List[Tuple[Tuple[str, str], V]]:
+        result: List[Tuple[Tuple[str, str], V]] = []
+        for (key, index) in self._get_keytable().items():
+            if f(key):
+                result.append((key, self.retrieve(index)))
+        return result
+
+    def write_xml(self,
+            node: ET.Element,
+            f: Callable[[ET.Element, V], None],
+            tag: str='n') -> None:
+        for i in self._indices():
+            snode = ET.Element(tag)
+            f(snode,self.retrieve(i))
+            node.append(snode)
+
+    def read_xml(self,
+            node: Optional[TableNode],
+            tag: str,
+            get_value: Callable[[TableRep], V],
+            get_key: Callable[[V], Tuple[str, str]]= lambda x:x.get_key(),
+            get_index: Callable[[V], int]= lambda x:x.index) -> None:
+        '''Store the records of node; get_key and get_index are not used.'''
+        if node is None:
+            print('Xml node not present in ' + self.name)
+            raise IndexedTableError(self.name)
+        self.get_value = get_value
+        if isinstance(node, TableSource):
+            for (index, tags, args) in node.iter_reps(tag):
+                self._add_row(index, ','.join(tags), args)
+        else:
+            for snode in node.findall(tag):
+                tagstr = snode.get('t')
+                argstr = snode.get('a')
+                self._add_row(
+                    UF.safe_get(snode, 'ix', 'ix missing from xml in IndexedTable construction', int),
+                    '' if tagstr is None else tagstr,
+                    [] if argstr is None or argstr == '' else [ int(x) for x in argstr.split(',') ])
+
+    def iter_reps(self) -> Iterator[TableRep]:
+        if len(self.indextable) > 0:
+            self._get_keytable()
+            yield from IndexedTable.iter_reps(self)
+            return
+        for (index, row) in enumerate(self.rows):
+            if row >= 0:
+                yield self._get_rep(index)
+
+    def pack(self) -> PackedTable:
+        self._get_keytable()
+        return IndexedTable.pack(self)
+
+    def __str__(self) -> str:
+        lines = []
+        lines.append('\n' + self.name)
+        for ix in self._indices():
+            lines.append(str(ix).rjust(4) + '  ' + str(self.retrieve(ix)))
+        if len(self.reserved) > 0:
+            lines.append('Reserved: ' + str(self.reserved))
+        if not self.checkpoint is None:
+            lines.append('Checkpoint: ' + str(self.checkpoint))
+        return '\n'.join(lines)
+
+DenseKey = Tuple[Tuple[str, ...], Tuple[int, ...]]     # (tags, args)
+
+def get_dense_key(key: Tuple[str, str]) -> DenseKey:
+    (tags, args) = key
+    return (tuple([ sys.intern(t) for t in tags.split(',') ]) if len(tags) > 0 else (),
+            tuple([ int(x) for x in args.split(',') ]) if len(args) > 0 else ())
+
+class DenseIndexedTable(IndexedTable[V]):
+    '''IndexedTable keyed by tuples of tags and args, with the record objects
+    in a list at their index.
+
+    Adding and looking up entries with add_rep does not join strings, and
+    values, items and iter need no sorting, as indices are dense and assigned
+    in order. Tags read from xml are interned. The string keys of get_key
+    are still accepted by add, has_key, get_index and commit_reserved.
+    '''
+
+    def __init__(self, name: str) -> None:
+        IndexedTable.__init__(self, name)
+        self.densekeys: Dict[DenseKey, int] = {}        # (tags, args) -> index
+        self.records: List[Optional[V]] = [ None ]      # index -> object; 0 is not used
+
+    def reset(self) -> None:
+        IndexedTable.reset(self)
+        self.densekeys = {}
+        self.records = [ None ]
+
+    def iter(self, f: Callable[[int, V], None]) -> None:
+        for (i, v) in self.items():
+            f(i,v)
+
+    def reset_to_checkpoint(self) -> int:
+        '''Remove all entries added since the checkpoint was set.'''
+        cp = self.checkpoint
+        if cp is None:
+            raise UF.CHJError("Cannot reset non-existent checkpoint")
+        for k in [ k for (k, i) in self.densekeys.items() if i >= cp ]:
+            self.densekeys.pop(k)
+        del self.records[cp:]
+        self.checkpoint = None
+        self.reserved = []
+        self.next = cp
+        return cp
+
+    def _add_record(self, index: int, key: DenseKey, obj: V) -> None:
+        if index >= len(self.records):
+            self.records.extend([ None ] * (index + 1 - len(self.records)))
+        self.records[index] = obj
+        self.densekeys[key] = index
+        if index >= self.next:
+            self.next = index + 1
+
+    def add_rep(self, tags: List[str], args: List[int], f: Callable[[int], V]) -> int:
+        key = (tuple(tags), tuple(args))
+        index = self.densekeys.get(key)
+        if index is None:
+            index = self.next
+            self._add_record(index, key, f(index))
+        return index
+
+    def add(self, key: Tuple[str, str], f: Callable[[int, Tuple[str, str]], V]) -> int:
+        densekey = get_dense_key(key)
+        index = self.densekeys.get(densekey)
+        if index is None:
+            index = self.next
+            self._add_record(index, densekey, f(index, key))
+        return index
+
+    def has_key(self, key: Tuple[str, str]) -> bool: return get_dense_key(key) in self.densekeys
+
+    def get_index(self, key: Tuple[str, str]) -> int:
+        densekey = get_dense_key(key)
+        if densekey in self.densekeys:
+            return self.densekeys[densekey]
+        else:
+            raise UF.CHJError('key : ' + str(key) + ' missing from IndexedTable : ' + self.name)
+
+    def reserve(self) -> int:
+        index = IndexedTable.reserve(self)
+        self.records.append(None)
+        return index
+
+    def values(self) -> List[V]:
+        return [ v for v in self.records if v is not None ]
+
+    def items(self) -> List[Tuple[int, V]]:
+        return [ (i, v) for (i, v) in enumerate(self.records) if v is not None ]
+
+    def commit_reserved(self, index: int, key: Tuple[str, str], obj: V) -> None:
+        if index in self.reserved:
+            self._add_record(index, get_dense_key(key), obj)
+            self.reserved.remove(index)
+        else:
+            raise IndexedTableError("Trying to commit nonexisting index: " + str(index))
+
+    def retrieve(self, index: int) -> V:
+        if 0 <= index < len(self.records):
+            obj = self.records[index]
+            if obj is not None:
+                return obj
+        return IndexedTable.retrieve(self, index)
+
+    def retrieve_by_key(
+        self, f: Callable[[Tuple[str, str]], bool]
+    ) -> List[Tuple[Tuple[str, str], V]]:
+        result: List[Tuple[Tuple[str, str], V]] = []
+        for ((tags, args), index) in self.densekeys.items():
+            key = get_key(list(tags), list(args))
+            if f(key):
+                result.append((key, self.retrieve(index)))
+        return result
+
+    def write_xml(self,
+            node: ET.Element,
+            f: Callable[[ET.Element, V], None],
+            tag: str='n') -> None:
+        for v in self.values():
+            snode = ET.Element(tag)
+            f(snode,v)
+            node.append(snode)
+
+    def read_xml(self,
+            node: Optional[TableNode],
+            tag: str,
+            get_value: Callable[[TableRep], V],
+            get_key: Callable[[V], Tuple[str, str]]= lambda x:x.get_key(),
+            get_index: Callable[[V], int]= lambda x:x.index) -> None:
+        '''Store the records of node; the key and index are taken from the
+        record reps, get_key and get_index are not used.'''
+        if node is None:
+            print('Xml node not present in ' + self.name)
+            raise IndexedTableError(self.name)
+        if isinstance(node, TableSource):
+            reps = node.iter_reps(tag)
+        else:
+            reps = (get_rep(snode) for snode in node.findall(tag))
+        for (index, tags, args) in reps:
+            tags = [ sys.intern(t) for t in tags ]
+            self._add_record(index, (tuple(tags), tuple(args)), get_value((index, tags, args)))
+
+    def iter_reps(self) -> Iterator[TableRep]:
+        for ((tags, args), index) in sorted(self.densekeys.items(), key=lambda x:x[1]):
+            yield (index, list(tags), list(args))
+
+    def pack(self) -> PackedTable:
+        result = PackedTable()
+        for (index, tags, args) in self.iter_reps():
+            (tagstr, argstr) = get_key(tags, args)
+            result.add(index, tagstr, argstr)
+        return result
+
+    def __str__(self) -> str:
+        lines = []
+        lines.append('\n' + self.name)
+        for (ix, v) in self.items():
+            lines.append(str(ix).rjust(4) + '  ' + str(v))
+        if len(self.reserved) > 0:
+            lines.append('Reserved: ' + str(self.reserved))
+        if not self.checkpoint is None:
+            lines.append('Checkpoint: ' + str(self.checkpoint))
+        return '\n'.join(lines)
+
+def mk_indexed_table(name: str) -> IndexedTable[Any]:
+    '''Return an empty table with the storage set in Config.tablestorage.'''
+    if UF.config.tablestorage == 'dense':
+        return DenseIndexedTable(name)
+    if UF.config.tablestorage == 'columnar':
+        return ColumnarIndexedTable(name, UF.config.tablecachesize)
+    if UF.config.tablestorage == 'lazy':
+        return ColumnarIndexedTable(name, None)
+    return IndexedTable(name)
@@ -31,11 +31,19 @@ import datetime
 import json
 import os
 import shutil
+import threading
+
+from collections import OrderedDict
 
 import xml.etree.ElementTree as ET
 import chj.util.xmlutil as UX
 
-from typing import Any, cast, Dict, List, Optional, Tuple, Type, TypeVar
+from typing import Any, Callable, cast, Dict, IO, Iterator, List, Optional, Tuple, Type, TypeVar, Union
+
+try:
+    from lxml import etree as lxmletree # type: ignore
+except ImportError:
+    lxmletree = None
 
 from chj.util.Config import Config
 config = Config()
@@ -335,22 +343,138 @@ class CHJEngagementDataNoDependenciesError(CHJError):
         return ('Record for application ' + self.appname + ' is incomplete: '
                     + ' dependencies are missing')
 
+# ------------------------------------------------------- xml parser backend --
+
+XmlParseErrors: Tuple[Type[Exception], ...] = (ET.ParseError,)
+if lxmletree is not None:
+    XmlParseErrors = XmlParseErrors + (lxmletree.XMLSyntaxError,)
+
+def get_xml_parser() -> str:
+    """Return the parser used for read-only xml: 'lxml' or 'stdlib'."""
+    if lxmletree is not None and config.xmlparser == 'lxml':
+        return 'lxml'
+    return 'stdlib'
+
+def _lxml_parser() -> Any:
+    return lxmletree.XMLParser(remove_comments=True, remove_pis=True, huge_tree=True)
+
+def parse_xml_file(filename: str) -> ET.Element:
+    """Return the root of the parsed file.
+
+    The tree may come from lxml; it must not be modified or combined with
+    ElementTree nodes. Use ET.parse for trees that are edited and saved.
+    """
+    if get_xml_parser() == 'lxml':
+        return cast(ET.Element, lxmletree.parse(filename, _lxml_parser()).getroot())
+    return ET.parse(filename).getroot()
+
+def parse_xml_string(text: Union[str, bytes]) -> ET.Element:
+    """Return the root of the parsed document (read-only, see parse_xml_file)."""
+    if get_xml_parser() == 'lxml':
+        if isinstance(text, str):
+            text = text.encode('utf-8')
+        return cast(ET.Element, lxmletree.fromstring(text, _lxml_parser()))
+    return ET.fromstring(text)
+
+def iterparse_xml(source: Union[str, IO[bytes]]) -> Iterator[Tuple[str, ET.Element]]:
+    """Return the ('start', elem) and ('end', elem) events for source."""
+    if get_xml_parser() == 'lxml':
+        return cast(Iterator[Tuple[str, ET.Element]], lxmletree.iterparse(
+            source, events=('start', 'end'), remove_comments=True, remove_pis=True, huge_tree=True))
+    return ET.iterparse(source, events=('start', 'end'))
+
+class XmlParseCache(object):
+    """Process-wide cache of parsed xml files.
+
+    Entries are keyed by absolute filename and validated against the
+    (mtime, size) of the file on every lookup. The least recently used
+    entries are evicted when the total size of the cached files exceeds
+    config.xmlcachesize. Cached trees are shared between callers and must
+    not be modified; use get_xnode(..., cache=False) for a private copy.
+    """
+
+    def __init__(self) -> None:
+        self.entries: "OrderedDict[str, Tuple[Tuple[int, int], ET.Element]]" = OrderedDict()
+        self.size = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.lock = threading.Lock()
+
+    def get_root(self, filename: str) -> ET.Element:
+        budget = config.xmlcachesize
+        if budget <= 0:
+            return parse_xml_file(filename)
+        filename = os.path.abspath(filename)
+        stat = os.stat(filename)
+        key = (stat.st_mtime_ns, stat.st_size)
+        with self.lock:
+            self._trim(budget)
+            entry = self.entries.get(filename)
+            if entry is not None and entry[0] == key:
+                self.entries.move_to_end(filename)
+                self.hits += 1
+                return entry[1]
+        root = parse_xml_file(filename)
+        with self.lock:
+            self.misses += 1
+            self._remove(filename)
+            self.entries[filename] = (key, root)
+            self.size += key[1]
+            self._trim(budget)
+        return root
+
+    def clear(self) -> None:
+        with self.lock:
+            self.entries.clear()
+            self.size = 0
+
+    def stats(self) -> Dict[str, int]:
+        with self.lock:
+            return {
+                'files': len(self.entries),
+                'size': self.size,
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions }
+
+    def _trim(self, budget: int) -> None:
+        while self.size > budget:
+            self._remove(next(iter(self.entries)))
+            self.evictions += 1
+
+    def _remove(self, filename: str) -> None:
+        entry = self.entries.pop(filename, None)
+        if entry is not None:
+            self.size -= entry[0][1]
+
+xmlcache = XmlParseCache()
+
 def get_xnode(
         filename: str,
         rootnode: str,
         desc : str,
-        show: bool = True) -> Optional[ET.Element]:
+        show: bool = True,
+        cache: bool = True) -> Optional[ET.Element]:
+    """Return the rootnode child of the parsed file.
+
+    With cache the tree is shared through xmlcache and parsed with the
+    configured backend (read-only); without, a private ElementTree copy
+    is returned that may be modified.
+    """
     if os.path.isfile(filename):
         try:
-            tree = ET.parse(filename)
-            root = tree.getroot()
+            if cache:
+                root = xmlcache.get_root(filename)
+            else:
+                root = ET.parse(filename).getroot()
             node = root.find(rootnode)
             if node is not None:
                 return node
             else:
                 raise CHJError(desc + ' missing from ' + filename)
-        except ET.ParseError as e:
-            raise CHJXmlParseError(filename, e.code, e.position)
+        except XmlParseErrors as e:
+            raise CHJXmlParseError(filename, getattr(e, 'code', 0), getattr(e, 'position', (0, 0)))
     elif show:
         raise CHJFileNotFoundError(filename)
     else:
@@ -421,6 +545,31 @@ def safe_find(xnode: ET.Element, name: str, message: str) -> ET.Element:
     else:
         return node
 
+# safe_get and safe_find with a function that returns the error message, for
+# callers that would otherwise format the message on every call
+def safe_get_lazy(xnode: ET.Element, name: str, message: Callable[[], str], type: Type[T]) -> T:
+    node = xnode.get(name)
+    if node is None:
+        raise CHJError(message())
+    else:
+        return type(node)
+
+def safe_find_lazy(xnode: ET.Element, name: str, message: Callable[[], str]) -> ET.Element:
+    node = xnode.find(name)
+    if node is None:
+        raise CHJError(message())
+    else:
+        return node
+
+# attribute that may be missing, for wrappers that decode their xml node once
+# when they are constructed and report a missing attribute when it is used
+def get_optional(xnode: ET.Element, name: str, type: Type[T]) -> Optional[T]:
+    node = xnode.get(name)
+    if node is None:
+        return None
+    else:
+        return type(node)
+
 def transform_methodname(mname: str) -> str:
     mname = mname.replace('<init>','__init__')
     mname = mname.replace('<clinit>','__clinit__')
@@ -470,6 +619,9 @@ def get_datadictionary_xnode(path: str) -> ET.Element:
     filename = get_datadictionary_filename(path)
     return cast(ET.Element, get_xnode(filename,'dictionary','Dictionary file'))
 
+def get_datadictionary_snapshot_filename(path: str, name: str = 'datadictionary') -> str:
+    return os.path.join(get_analysisdatadir(path),name + '.snapshot')
+
 def get_datacallgraph_filename(path: str) -> str:
     return os.path.join(get_analysisdatadir(path),'callgraph.xml')
 
@@ -714,7 +866,7 @@ def get_userdataclass_xnode(
         package: str,
         cname: str) -> Optional[ET.Element]:
     filename = get_userdataclass_filename(path,package,cname)
-    return get_xnode(filename,'class','User class file',show=False)
+    return get_xnode(filename,'class','User class file',show=False,cache=False)
 
 def save_userdataclass_file(
         path: str,
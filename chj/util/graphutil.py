@@ -26,36 +26,214 @@
 # SOFTWARE.
 # ------------------------------------------------------------------------------
 
+import heapq
 
-from typing import Dict, List, Tuple
-
-class DirectedGraph(object):
-
-    def __init__(self,
-            nodes: List[int],
-            edges: Dict[int, List[int]]) -> None:
-        self.nodes = nodes
-        self.edges = edges    # adjacency list: n -> [ n ]
-        self.paths: List[List[int]] = []
-
-    def find_paths_aux(self,
-            src: int,
-            dst: int,
-            visited: Dict[int, bool],
-            path: List[int]) -> None:
-        visited[src] = True
-        path.append(src)
-        if src == dst:
-            self.paths.append(path[:])
-        elif src in self.edges:
-            for d in self.edges[src]:
-                if not visited[d]:
-                    self.find_paths_aux(d,dst,visited,path)
-        path.pop()
-        visited[src] = False
-
-    def find_paths(self, src: int, dst: int) -> None:
-        visited = {}
-        for n in self.nodes:
-            visited[n] = False
-        self.find_paths_aux(src,dst,visited,[])
+from collections import deque
+
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+def get_strongly_connected_components(
+        nodes: Iterable[int],
+        successors: Callable[[int], Iterable[int]]) -> List[List[int]]:
+    '''Return the strongly connected components of the graph, in reverse
+    topological order: every component comes after the components it reaches.
+
+    Tarjan's algorithm with an explicit stack, so that long call chains do
+    not run into the recursion limit.
+    '''
+    index: Dict[int, int] = {}
+    lowlink: Dict[int, int] = {}
+    onstack: Set[int] = set([])
+    stack: List[int] = []
+    result: List[List[int]] = []
+    for root in nodes:
+        if root in index: continue
+        index[root] = lowlink[root] = len(index)
+        stack.append(root)
+        onstack.add(root)
+        work: List[Tuple[int, Iterator[int]]] = [ (root, iter(successors(root))) ]
+        while len(work) > 0:
+            (v, succs) = work[-1]
+            descended = False
+            for w in succs:
+                if not w in index:
+                    index[w] = lowlink[w] = len(index)
+                    stack.append(w)
+                    onstack.add(w)
+                    work.append((w, iter(successors(w))))
+                    descended = True
+                    break
+                elif w in onstack:
+                    lowlink[v] = min(lowlink[v], index[w])
+            if descended: continue
+            work.pop()
+            if len(work) > 0:
+                u = work[-1][0]
+                lowlink[u] = min(lowlink[u], lowlink[v])
+            if lowlink[v] == index[v]:
+                component: List[int] = []
+                while True:
+                    w = stack.pop()
+                    onstack.discard(w)
+                    component.append(w)
+                    if w == v: break
+                result.append(component)
+    return result
+
+def get_reachable_nodes(
+        roots: Iterable[int],
+        successors: Callable[[int], Iterable[int]]) -> Set[int]:
+    '''Return the nodes reachable from roots (roots included).'''
+    result: Set[int] = set(roots)
+    stack = list(result)
+    while len(stack) > 0:
+        n = stack.pop()
+        for m in successors(n):
+            if not m in result:
+                result.add(m)
+                stack.append(m)
+    return result
+
+def get_path_nodes(
+        src: int,
+        sinks: Iterable[int],
+        successors: Callable[[int], Iterable[int]],
+        predecessors: Callable[[int], Iterable[int]]) -> Set[int]:
+    '''Return the nodes that lie on a path from src to any of sinks.
+
+    A node is included if it is reachable from src and reaches a sink; the
+    result is the slice of the graph between src and the sinks, computed with
+    one forward and one backward traversal. Unlike an enumeration of simple
+    paths this includes cycles that hang off a path.
+    '''
+    forward = get_reachable_nodes([ src ], successors)
+    backward = get_reachable_nodes([ s for s in sinks if s in forward ], predecessors)
+    return forward & backward
+
+def get_shortest_path(
+        src: int,
+        dst: int,
+        successors: Callable[[int], Iterable[int]],
+        blockednodes: Optional[Set[int]] = None,
+        blockededges: Optional[Set[Tuple[int, int]]] = None) -> Optional[List[int]]:
+    '''Return a path from src to dst with the fewest edges that avoids
+    blockednodes and blockededges, or None if there is none.'''
+    if blockednodes is None: blockednodes = set([])
+    if blockededges is None: blockededges = set([])
+    if src in blockednodes: return None
+    parent: Dict[int, int] = { src: src }
+    queue = deque([ src ])
+    while len(queue) > 0:
+        n = queue.popleft()
+        if n == dst:
+            path = [ n ]
+            while n != src:
+                n = parent[n]
+                path.append(n)
+            return path[::-1]
+        for m in successors(n):
+            if m in parent or m in blockednodes or (n, m) in blockededges: continue
+            parent[m] = n
+            queue.append(m)
+    return None
+
+def get_shortest_paths(
+        src: int,
+        dst: int,
+        successors: Callable[[int], Iterable[int]],
+        k: int) -> List[List[int]]:
+    '''Return up to k simple paths from src to dst, shortest first.
+
+    Yen's algorithm with breadth-first search for the spur paths: every
+    further path costs at most one search per node of the previous path.
+    '''
+    first = get_shortest_path(src, dst, successors)
+    if first is None or k < 1: return []
+    result: List[List[int]] = [ first ]
+    candidates: List[Tuple[int, List[int]]] = []
+    seen: Set[Tuple[int, ...]] = set([ tuple(first) ])
+    while len(result) < k:
+        prev = result[-1]
+        for j in range(len(prev) - 1):
+            root = prev[:j+1]
+            blockededges = set([ (p[j], p[j+1]) for p in result
+                                 if len(p) > j + 1 and p[:j+1] == root ])
+            spur = get_shortest_path(prev[j], dst, successors, set(root[:-1]), blockededges)
+            if spur is None: continue
+            path = root[:-1] + spur
+            if tuple(path) in seen: continue
+            seen.add(tuple(path))
+            heapq.heappush(candidates, (len(path), path))
+        if len(candidates) == 0: break
+        result.append(heapq.heappop(candidates)[1])
+    return result
+
+def get_immediate_dominators(
+        root: int,
+        successors: Callable[[int], Iterable[int]],
+        predecessors: Callable[[int], Iterable[int]]) -> Dict[int, int]:
+    '''Return the immediate dominator of every node reachable from root; root
+    is its own immediate dominator.
+
+    Cooper, Harvey and Kennedy's iterative algorithm over the reverse
+    postorder of an explicit-stack depth-first search.
+    '''
+    postorder: List[int] = []
+    visited: Set[int] = set([ root ])
+    work: List[Tuple[int, Iterator[int]]] = [ (root, iter(successors(root))) ]
+    while len(work) > 0:
+        (n, succs) = work[-1]
+        for m in succs:
+            if not m in visited:
+                visited.add(m)
+                work.append((m, iter(successors(m))))
+                break
+        else:
+            work.pop()
+            postorder.append(n)
+    ponumber = dict((n, i) for (i, n) in enumerate(postorder))
+
+    def intersect(a: int, b: int) -> int:
+        while a != b:
+            while ponumber[a] < ponumber[b]: a = idom[a]
+            while ponumber[b] < ponumber[a]: b = idom[b]
+        return a
+
+    idom: Dict[int, int] = { root: root }
+    rpo = postorder[-2::-1]         # reverse postorder without root
+    changed = True
+    while changed:
+        changed = False
+        for n in rpo:
+            newidom: Optional[int] = None
+            for p in predecessors(n):
+                if not p in idom: continue
+                newidom = p if newidom is None else intersect(p, newidom)
+            if not newidom is None and idom.get(n) != newidom:
+                idom[n] = newidom
+                changed = True
+    return idom
+
+def get_tree_intervals(root: int, parent: Dict[int, int]) -> Dict[int, Tuple[int, int]]:
+    '''Return the (preorder, postorder) numbers of the nodes of the tree given
+    by parent (root is its own parent); a is an ancestor of b (or b itself) if
+    and only if the interval of a contains the interval of b.'''
+    children: Dict[int, List[int]] = {}
+    for (n, p) in parent.items():
+        if n != p: children.setdefault(p, []).append(n)
+    result: Dict[int, Tuple[int, int]] = {}
+    pre: Dict[int, int] = { root: 0 }
+    counter = 1
+    work: List[Tuple[int, Iterator[int]]] = [ (root, iter(children.get(root, []))) ]
+    while len(work) > 0:
+        (n, kids) = work[-1]
+        for k in kids:
+            pre[k] = counter
+            counter += 1
+            work.append((k, iter(children.get(k, []))))
+            break
+        else:
+            work.pop()
+            result[n] = (pre[n], counter)
+            counter += 1
+    return result